@@ -0,0 +1,65 @@
+# ~/supermodels/benchmarks/codecs.py
+"""
+Codec Benchmark
+
+Compares stored size and encode/decode time of typed column payloads for
+the default JSON column path (stdlib `json`, as the SQLAlchemy JSON type
+uses) against the JSON and binary codecs, with and without compression.
+
+    python benchmarks/codecs.py [--number N] [--rows N]
+"""
+from __future__ import annotations
+import json, argparse, timeit, typing as t
+
+from supermodels.converters.codecs import Codec, JSONCodec, BinaryCodec
+
+
+def payload(rows: int) -> t.Dict[str, t.Any]:
+    return {
+        'name': 'report',
+        'created': '2026-01-01 00:00:00',
+        'rows': [
+            {'id': i, 'sku': f"SKU-{i:06d}", 'price': i * 1.25, 'active': bool(i % 2), 'tags': ['a', 'b', 'c'], 'note': None}
+            for i in range(rows)
+        ],
+    }
+
+
+class DefaultJSON:
+    """The current path: the dialect's JSON serializer writing a str."""
+
+    def encode(self, value: t.Any) -> str:
+        return json.dumps(value)
+
+    def decode(self, data: str) -> t.Any:
+        return json.loads(data)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--number', type=int, default=200)
+    parser.add_argument('--rows', type=int, default=200)
+    args = parser.parse_args()
+
+    value = payload(args.rows)
+    candidates: t.List[t.Tuple[str, t.Any]] = [
+        ('JSON column (json.dumps)', DefaultJSON()),
+        ('JSONCodec (stdlib)', JSONCodec(fast=False)),
+        ('JSONCodec (fast)', JSONCodec()),
+        ('JSONCodec (fast) + zlib', JSONCodec(compress=1024)),
+        ('BinaryCodec', BinaryCodec()),
+        ('BinaryCodec + zlib', BinaryCodec(compress=1024)),
+    ]
+    print(f"{'codec':<28} {'backend':<8} {'bytes':>8} {'encode ms':>10} {'decode ms':>10}")
+    for label, codec in candidates:
+        encoded = codec.encode(value)
+        assert codec.decode(encoded) == value
+        size = len(encoded.encode('utf-8') if isinstance(encoded, str) else encoded)
+        enc = timeit.timeit(lambda: codec.encode(value), number=args.number) / args.number
+        dec = timeit.timeit(lambda: codec.decode(encoded), number=args.number) / args.number
+        backend = (getattr(codec, 'backend', '-') if isinstance(codec, Codec) else 'json')
+        print(f"{label:<28} {backend:<8} {size:>8} {enc * 1e3:>10.3f} {dec * 1e3:>10.3f}")
+
+
+if __name__ == '__main__':
+    main()
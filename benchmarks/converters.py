@@ -0,0 +1,75 @@
+# ~/supermodels/benchmarks/converters.py
+"""
+Converter Benchmark
+
+Compares DataclassConverter against the previous `dataclasses.asdict`
+based implementation on deep (nested) and wide (many fields/items)
+payloads.
+
+    python benchmarks/converters.py [--number N]
+"""
+from __future__ import annotations
+import argparse, timeit, typing as t, dataclasses as dcs
+from datetime import datetime
+
+from supermodels.converters.dc import DataclassConverter
+
+
+@dcs.dataclass
+class Leaf:
+    id: int
+    name: str
+    score: float
+    tags: t.List[str]
+    created: datetime
+
+
+@dcs.dataclass
+class Branch:
+    depth: int
+    leaves: t.List[Leaf]
+    child: t.Optional['Branch'] = None
+
+
+Wide = dcs.make_dataclass('Wide', [(f"f{i}", int) for i in range(64)] + [('leaves', t.List[Leaf])])
+
+
+def legacyserialize(val: t.Any) -> t.Any:
+    """The asdict-based serializer DataclassConverter used before compiled plans."""
+    if dcs.is_dataclass(val) and not isinstance(val, type): return {k: legacyserialize(getattr(val, k)) for k in dcs.asdict(val)}
+    elif isinstance(val, list): return [legacyserialize(item) for item in val]
+    elif isinstance(val, (int, float, str, bool)): return val
+    elif isinstance(val, dict): return {k: legacyserialize(v) for k,v in val.items()}
+    else: return str(val)
+
+
+def leaves(n: int) -> t.List[Leaf]:
+    return [Leaf(i, f"leaf{i}", i / 3, ['a', 'b'], datetime(2026, 1, 1)) for i in range(n)]
+
+
+def deep(depth: int) -> Branch:
+    node = None
+    for d in range(depth):
+        node = Branch(d, leaves(2), node)
+    return t.cast(Branch, node)
+
+
+def wide(n: int) -> t.Any:
+    return Wide(*range(64), leaves=leaves(n))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--number', type=int, default=200)
+    args = parser.parse_args()
+
+    converter = DataclassConverter(Branch)
+    for label, payload in (('deep (depth 40)', deep(40)), ('wide (64 fields, 500 items)', wide(500))):
+        assert converter.serialize(payload) == legacyserialize(payload)
+        before = timeit.timeit(lambda: legacyserialize(payload), number=args.number) / args.number
+        after = timeit.timeit(lambda: converter.serialize(payload), number=args.number) / args.number
+        print(f"{label:<30} asdict {before * 1e3:>8.3f} ms   compiled {after * 1e3:>8.3f} ms   {before / after:>6.1f}x")
+
+
+if __name__ == '__main__':
+    main()
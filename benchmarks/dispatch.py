@@ -0,0 +1,54 @@
+# ~/supermodels/benchmarks/dispatch.py
+"""
+Dispatch Benchmark
+
+Measures ManagerContext construction and per-call operation dispatch
+overhead against an in-memory adapter.
+
+    python benchmarks/dispatch.py [--number N]
+"""
+from __future__ import annotations
+import argparse, timeit
+
+from supermodels.core.bases.manager import BaseManager
+from supermodels.core.models.contexts import ManagerContext
+from supermodels.adapters.memory import MemoryAdapter
+
+
+class Item:
+    __super__ = {'Describe'}
+
+    def __init__(self, id=None, name=None):
+        self.id = id
+        self.name = name
+
+    @classmethod
+    def Describe(cls, session, value):
+        return value
+
+
+class ItemManager(BaseManager):
+    __model__ = Item
+
+
+def report(label: str, seconds: float, number: int) -> None:
+    print(f"{label:<28} {(seconds / number) * 1e9:>10.1f} ns/op")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--number', type=int, default=200_000)
+    args = parser.parse_args()
+    number = args.number
+
+    adapter = MemoryAdapter()
+    with ManagerContext(adapter, Item) as mgr:
+        mgr.add(Item(id=1, name='a'))
+        report("context construction", timeit.timeit(lambda: ManagerContext(adapter, Item), number=number), number)
+        report("custom op (Describe)", timeit.timeit(lambda: mgr.Describe(1), number=number), number)
+        report("get", timeit.timeit(lambda: mgr.get(Item, id=1), number=number), number)
+        report("direct manager get", timeit.timeit(lambda: mgr._managersregistry[Item].get(Item, id=1), number=number), number)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+# ~/supermodels/benchmarks/importtime.py
+"""
+Import-Time Benchmark
+
+Measures cold `import supermodels` (and a few entry points) in fresh
+interpreters and fails when the median exceeds the budget.
+
+    python benchmarks/importtime.py [--runs N] [--budget MS]
+"""
+from __future__ import annotations
+import sys, argparse, statistics, subprocess
+
+TARGETS = (
+    'supermodels',
+    'supermodels.adapters',
+    'supermodels.converters',
+    'supermodels.adapters.memory',
+)
+
+
+def measure(module: str) -> float:
+    """Cumulative import time of a module in a fresh interpreter, in milliseconds."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+        capture_output=True, text=True, check=True
+    )
+    for line in result.stderr.splitlines():
+        parts = [p.strip() for p in line.split('|')]
+        if (len(parts) == 3) and (parts[2] == module):
+            return int(parts[1]) / 1000
+    raise RuntimeError(f"No import time reported for '{module}'")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=7)
+    parser.add_argument('--budget', type=float, default=15.0, help="median budget for `import supermodels` in ms")
+    args = parser.parse_args()
+
+    medians = {}
+    for module in TARGETS:
+        medians[module] = statistics.median(measure(module) for _ in range(args.runs))
+        print(f"{module:<32} {medians[module]:>8.2f} ms")
+
+    if medians['supermodels'] > args.budget:
+        print(f"import supermodels exceeded budget of {args.budget:.2f} ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -26,9 +26,15 @@ Example:
     >>> with manager(User, Order) as mgr:
     ...     user = mgr.add(User(name="John"))
     ...     order = mgr.add(Order(user_id=user.id))
+
+Public names are imported on first access, so `import supermodels` stays
+cheap for tools that only need part of the package.
 """
+from __future__ import annotations
+
+from supermodels.core.utils.lazymodules import lazymodule, TYPE_CHECKING
 
-__version__ = "0.1.18"
+__version__ = "0.1.19"
 __author__ = "Joel Yisrael"
 __email__ = "schizoprada@gmail.com"
 __license__ = "MIT"
@@ -36,9 +42,23 @@ __url__ = "https://github.com/schizoprada/supermodels"
 
 VERSION = tuple(map(int, __version__.split('.')))
 
-from .core.manager import Manager, ManagerContext
-from .core.bases import BaseManager, DBAdapter
-from .core.metas import ManagerMeta
+if TYPE_CHECKING:
+    from .core.manager import Manager, ManagerContext
+    from .core.bases import BaseManager, DBAdapter
+    from .core.metas import ManagerMeta
+    from .core.filters import AND, OR
+    from .core.enums import CommitPolicy
+
+_lazy = {
+    'Manager': 'supermodels.core.manager',
+    'ManagerContext': 'supermodels.core.manager',
+    'BaseManager': 'supermodels.core.bases',
+    'DBAdapter': 'supermodels.core.bases',
+    'ManagerMeta': 'supermodels.core.metas',
+    'AND': 'supermodels.core.filters',
+    'OR': 'supermodels.core.filters',
+    'CommitPolicy': 'supermodels.core.enums',
+}
 
 __all__ = [
     'Manager',
@@ -46,6 +66,9 @@ __all__ = [
     'BaseManager',
     'DBAdapter',
     'ManagerMeta',
+    'AND',
+    'OR',
+    'CommitPolicy',
     '__version__',
     '__author__',
     '__email__',
@@ -53,3 +76,5 @@ __all__ = [
     '__url__',
     'VERSION'
 ]
+
+__getattr__, __dir__ = lazymodule(__name__, _lazy)
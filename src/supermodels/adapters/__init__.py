@@ -3,9 +3,28 @@
 Database Adapters
 
 Concrete implementations of database adapters for different frameworks.
-Currently supports SQLAlchemy with more adapters planned.
+Currently supports SQLAlchemy and an indexed in-memory store, plus a
+sharding adapter that composes other adapters.
+
+Adapters are imported on first access, so SQLAlchemy is only loaded when
+a SQLAlchemy adapter is actually used.
 """
+from __future__ import annotations
+
+from supermodels.core.utils.lazymodules import lazymodule, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .sqla import SQLA, SQLAAdapter
+    from .sharding import ShardedAdapter
+    from .memory import MemoryAdapter
+
+_lazy = {
+    'SQLA': 'supermodels.adapters.sqla',
+    'SQLAAdapter': 'supermodels.adapters.sqla',
+    'ShardedAdapter': 'supermodels.adapters.sharding',
+    'MemoryAdapter': 'supermodels.adapters.memory',
+}
 
-from .sqla import SQLA, SQLAAdapter
+__all__ = ['SQLA', 'SQLAAdapter', 'ShardedAdapter', 'MemoryAdapter']
 
-__all__ = ['SQLA', 'SQLAAdapter']
+__getattr__, __dir__ = lazymodule(__name__, _lazy)
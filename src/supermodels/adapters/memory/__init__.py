@@ -0,0 +1,13 @@
+# ~/supermodels/src/supermodels/adapters/memory/__init__.py
+"""
+In-Memory Adapter
+
+Dependency-free DBAdapter that keeps items in process memory with hash
+indexes on declared filter fields and sorted indexes for paging. Useful for
+unit tests and hot read-only lookup services.
+"""
+
+from .adapter import MemoryAdapter, MemorySession
+from .table import MemoryTable
+
+__all__ = ['MemoryAdapter', 'MemorySession', 'MemoryTable']
@@ -0,0 +1,375 @@
+# ~/supermodels/src/supermodels/adapters/memory/adapter.py
+"""
+In-Memory Database Adapter
+
+Concrete implementation of DBAdapter backed by process memory. Implements
+the full adapter contract including bulk operations and pagination, with
+hash indexes for `queryby` and sorted indexes for `querypage`.
+"""
+from __future__ import annotations
+import threading, itertools, typing as t
+
+from supermodels.core.models.tvars import ModelType
+from supermodels.core.bases.adapter import DBAdapter
+from supermodels.core.enums import CommitPolicy, ONCE
+from supermodels.core.utils.chunks import bulkitems, chunked
+from supermodels.core.filters import Expression, Condition, Group, parsefilters, evaluate
+from supermodels.core.aggregates import AggregateRow, parseaggregates, computeaggregates, shaperows
+from supermodels.adapters.sqla.enums import OrderBy, ASC, DESC
+from supermodels.adapters.memory.table import MemoryTable, sortentry, nullskey
+
+IndexDeclarations = t.Mapping[t.Type[t.Any], t.Iterable[str]]
+
+
+class MemorySession:
+    """Session token for the in-memory adapter.
+
+    Writes are applied (and visible to every session) as soon as each
+    adapter operation returns, mirroring the per-operation commits of
+    SQLAAdapter, so commit and rollback have nothing left to do.
+    """
+
+    def __init__(self) -> None:
+        self.closed = False
+
+    def commit(self) -> None:
+        """No-op; operations are committed as they run."""
+        pass
+
+    def rollback(self) -> None:
+        """No-op; operations are committed as they run."""
+        pass
+
+    def close(self) -> None:
+        """Mark the session closed."""
+        self.closed = True
+
+
+class MemoryAdapter(DBAdapter[MemorySession]):
+    """In-memory implementation of the database adapter interface.
+
+    Items are stored by reference, keyed by their primary key attribute.
+    Fields declared in `indexes` get hash indexes, so equality filters on
+    them are O(1) lookups; fields declared in `sortable` get sorted indexes
+    used by `querypage`. Items mutated in place must be passed to
+    `updateitem` for their index entries to follow.
+    """
+
+    def __init__(
+        self,
+        indexes: t.Optional[IndexDeclarations] = None,
+        sortable: t.Optional[IndexDeclarations] = None,
+        pk: str = 'id',
+    ) -> None:
+        """Initialize adapter with per-model hash and sorted index declarations."""
+        self.pk = pk
+        self.indexes: t.Dict[t.Type[t.Any], t.Tuple[str, ...]] = {m: tuple(f) for m, f in (indexes or {}).items()}
+        self.sortable: t.Dict[t.Type[t.Any], t.Tuple[str, ...]] = {m: tuple(f) for m, f in (sortable or {}).items()}
+        self.tables: t.Dict[t.Type[t.Any], MemoryTable] = {}
+        self._lock = threading.RLock()
+
+    def table(self, model: t.Type[t.Any]) -> MemoryTable:
+        """Get (or create) the table for a model type."""
+        table = self.tables.get(model)
+        if table is None:
+            with self._lock:
+                table = self.tables.setdefault(model, MemoryTable(
+                    self.pk,
+                    indexed=self.indexes.get(model, ()),
+                    sortable=self.sortable.get(model, ()),
+                ))
+        return table
+
+    def _keyof(self, item: t.Any) -> t.Any:
+        """Get an item's primary key value."""
+        key = getattr(item, self.pk, None)
+        if key is None:
+            raise ValueError(f"Item {item!r} has no value for primary key '{self.pk}'")
+        return key
+
+    def _lookup(self, table: MemoryTable, cond: Condition) -> t.Optional[t.Iterable[t.Any]]:
+        """Resolve an equality or `in` condition through the primary key or a hash index."""
+        if cond.op not in ('eq', 'in'):
+            return None
+        values = ([cond.value] if cond.op == 'eq' else list(cond.value))
+        if cond.field == self.pk:
+            return [v for v in dict.fromkeys(values) if v in table.rows]
+        if cond.field in table.hashes:
+            if cond.op == 'eq':
+                return table.lookup(cond.field, cond.value)
+            keys: t.Dict[t.Any, None] = {}
+            for v in values: keys.update(table.lookup(cond.field, v))
+            return keys
+        return None
+
+    def _candidates(self, table: MemoryTable, where: t.Tuple[Expression, ...], filters: t.Dict[str, t.Any]) -> t.Tuple[t.Optional[t.Iterable[t.Any]], Group]:
+        """Narrow filters to candidate primary keys using the most selective index.
+
+        Returns the candidate keys (None meaning every row) and the residual
+        expression still to be checked per row.
+        """
+        group = parsefilters(*where, **filters)
+        best: t.Optional[t.Tuple[int, t.Iterable[t.Any]]] = None
+        for i, child in enumerate(group.children):
+            if not isinstance(child, Condition): continue
+            keys = self._lookup(table, child)
+            if (keys is not None) and ((best is None) or (len(keys) < len(best[1]))): # type: ignore
+                best = (i, keys)
+
+        if best is None:
+            return None, group
+        residual = Group('and', group.children[:best[0]] + group.children[best[0] + 1:])
+        return best[1], residual
+
+    ## SESSIONS ##
+    def createsession(self) -> MemorySession:
+        """Create a new session token."""
+        return MemorySession()
+
+    def closesession(self, session: MemorySession) -> None:
+        """Close a session token."""
+        session.close()
+
+    ## QUERYING ##
+    def queryall(self, session: MemorySession, model: t.Type[ModelType]) -> t.List[ModelType]:
+        """Query all records of a model type."""
+        with self._lock:
+            return list(self.table(model).rows.values())
+
+    def queryby(self, session: MemorySession, model: t.Type[ModelType], *where: Expression, **filters: t.Any) -> t.List[ModelType]:
+        """Query records with filter criteria, using hash indexes for equality and `in` filters."""
+        with self._lock:
+            table = self.table(model)
+            keys, residual = self._candidates(table, where, filters)
+            items = (table.rows.values() if keys is None else (table.rows[k] for k in keys))
+            if not residual.children:
+                return list(items)
+            return [item for item in items if evaluate(residual, item)]
+
+    def queryoneby(self, session: MemorySession, model: t.Type[ModelType], *where: Expression, **kwargs: t.Any) -> t.Optional[ModelType]:
+        """Query a single record with filter criteria."""
+        with self._lock:
+            table = self.table(model)
+            keys, residual = self._candidates(table, where, kwargs)
+            items = (table.rows.values() if keys is None else (table.rows[k] for k in keys))
+            return next((item for item in items if evaluate(residual, item)), None)
+
+    def querybyid(self, session: MemorySession, model: t.Type[ModelType], **kwargs: t.Any) -> t.Optional[ModelType]:
+        """Query a record by its ID."""
+        idval = kwargs.get('id')
+        if idval is None: return None
+        with self._lock:
+            return self.table(model).rows.get(idval)
+
+    def querypage(
+        self,
+        session: MemorySession,
+        model: t.Type[ModelType],
+        page: int = 1,
+        hits: int = 25,
+        sortby: str = 'id',
+        orderby: OrderBy = DESC,
+        where: t.Optional[Expression] = None,
+        nullsfirst: t.Optional[bool] = None,
+        **filters: t.Any
+    ) -> t.Tuple[t.List[ModelType], int]:
+        """Query records with pagination and sorting.
+
+        Sorts by a sorted index when `sortby` is declared sortable, otherwise
+        sorts the filtered rows in Python. None values come first ascending
+        and last descending unless `nullsfirst` is given.
+        """
+        descending = (orderby == DESC)
+        offset = ((page - 1) * hits)
+        with self._lock:
+            table = self.table(model)
+            keys, residual = self._candidates(table, ((where,) if where is not None else ()), filters)
+
+            if sortby in table.sorted:
+                allowed = (None if keys is None else set(keys))
+                ordered = (
+                    table.rows[k] for k in table.ordered(sortby, descending, nullsfirst)
+                    if ((allowed is None) or (k in allowed))
+                )
+                if (keys is None) and (not residual.children):
+                    return (list(itertools.islice(ordered, offset, offset + hits)), len(table))
+                matching = [item for item in ordered if evaluate(residual, item)]
+            else:
+                items = (table.rows.values() if keys is None else [table.rows[k] for k in keys])
+                matching = [item for item in items if evaluate(residual, item)]
+                matching.sort(key=lambda item: sortentry(getattr(item, sortby, None), 0), reverse=descending)
+                if (nullsfirst is not None) and (nullsfirst == descending):
+                    key = nullskey(nullsfirst)
+                    matching.sort(key=lambda item: key(getattr(item, sortby, None)))
+
+            return (matching[offset:offset + hits], len(matching))
+
+    def iterpages(
+        self,
+        session: MemorySession,
+        model: t.Type[ModelType],
+        hits: int = 25,
+        sortby: str = 'id',
+        orderby: OrderBy = ASC,
+        where: t.Optional[Expression] = None,
+        nullsfirst: t.Optional[bool] = None,
+        **filters: t.Any
+    ) -> t.Iterator[t.List[ModelType]]:
+        """Iterate all matching records page by page using `querypage`.
+
+        Each page is read when requested, so writes made during the walk can
+        shift later pages.
+        """
+        if hits < 1:
+            raise ValueError(f"Page size must be positive, got {hits}")
+
+        def pages() -> t.Iterator[t.List[ModelType]]:
+            for page in itertools.count(1):
+                items, _ = self.querypage(
+                    session, model, page=page, hits=hits, sortby=sortby, orderby=orderby, where=where, nullsfirst=nullsfirst, **filters
+                )
+                if items:
+                    yield items
+                if len(items) < hits:
+                    return
+        return pages()
+
+    def aggregate(
+        self,
+        session: MemorySession,
+        model: t.Type[ModelType],
+        *where: Expression,
+        groupby: t.Sequence[str] = (),
+        astuples: bool = False,
+        **kwargs: t.Any
+    ) -> t.List[AggregateRow]:
+        """Compute grouped aggregates over the filtered rows."""
+        aggregates, filters = parseaggregates(model, **kwargs)
+        items = self.queryby(session, model, *where, **filters)
+        return shaperows(computeaggregates(items, groupby, aggregates), groupby, aggregates, astuples)
+
+    ## CRUD ##
+    def additem(self, session: MemorySession, item: t.Any) -> t.Any:
+        """Add an item, assigning an autoincrement ID when missing."""
+        with self._lock:
+            table = self.table(type(item))
+            key = table.assignid(item)
+            if key in table.rows:
+                raise ValueError(f"Duplicate primary key {key!r} for model '{type(item).__name__}'")
+            table.insert(key, item)
+        return item
+
+    def updateitem(self, session: MemorySession, item: t.Any, changes: t.Optional[t.Dict[str, t.Any]] = None) -> t.Any:
+        """Update an item (inserting it when absent) and refresh its index entries.
+
+        A stored item whose primary key was changed (in place or through
+        `changes`) is moved to the new key; moving onto a key held by
+        another row raises.
+        """
+        with self._lock:
+            table = self.table(type(item))
+            changes = (changes or {})
+            for k in changes:
+                if not hasattr(item, k):
+                    raise ValueError(f"Cannot update unknown field '{k}' on model '{type(item).__name__}'")
+            key = changes.get(self.pk, getattr(item, self.pk, None))
+            stored = table.storedkey(item)
+            moved = ((stored is not None) and (stored != key))
+            if moved and (key in table.rows):
+                raise ValueError(f"Duplicate primary key {key!r} for model '{type(item).__name__}'")
+            for k, v in changes.items():
+                setattr(item, k, v)
+            key = self._keyof(item)
+            if moved:
+                table.rekey(stored, key)
+            elif key in table.rows:
+                table.replace(key, item)
+            else:
+                table.insert(key, item)
+        return item
+
+    def deleteitem(self, session: MemorySession, item: t.Any) -> bool:
+        """Delete an item; returns False when it was not stored."""
+        with self._lock:
+            table = self.table(type(item))
+            key = table.storedkey(item)
+            if key is None:
+                key = getattr(item, self.pk, None)
+            if key not in table.rows:
+                return False
+            table.remove(key)
+        return True
+
+    ## BULK ##
+    def _addchunk(self, session: MemorySession, items: t.List[t.Any]) -> None:
+        """Add items; nothing is stored if any item is rejected."""
+        with self._lock:
+            seen: t.Dict[t.Type[t.Any], t.Set[t.Any]] = {}
+            for item in items:
+                key = getattr(item, self.pk, None)
+                if key is None: continue
+                table = self.table(type(item))
+                batch = seen.setdefault(type(item), set())
+                if (key in table.rows) or (key in batch):
+                    raise ValueError(f"Duplicate primary key {key!r} for model '{type(item).__name__}'")
+                batch.add(key)
+            for item in items:
+                self.additem(session, item)
+
+    def bulkadd(
+        self,
+        session: MemorySession,
+        *items: t.Any,
+        chunksize: t.Optional[int] = None,
+        commit: CommitPolicy = ONCE,
+        collect: bool = True
+    ) -> t.Union[t.List[t.Any], int]:
+        """Add multiple items (or one iterable); nothing is stored if any item is rejected.
+
+        With `commit=PERCHUNK` items are validated and stored `chunksize` at a
+        time, so a rejected item only discards its own chunk; ONCE keeps the
+        whole call atomic.
+        """
+        written: t.List[t.Any] = []
+        count = 0
+        for chunk in chunked(bulkitems(items), (chunksize if commit is CommitPolicy.PERCHUNK else None)):
+            self._addchunk(session, chunk)
+            count += len(chunk)
+            if collect:
+                written.extend(chunk)
+        return (written if collect else count)
+
+    def bulkupdate(
+        self,
+        session: MemorySession,
+        *items: t.Any,
+        chunksize: t.Optional[int] = None,
+        commit: CommitPolicy = ONCE,
+        collect: bool = True
+    ) -> t.Union[t.List[t.Any], int]:
+        """Update multiple items (or one iterable)."""
+        written: t.List[t.Any] = []
+        count = 0
+        for chunk in chunked(bulkitems(items), chunksize):
+            with self._lock:
+                for item in chunk:
+                    self.updateitem(session, item)
+            count += len(chunk)
+            if collect:
+                written.extend(chunk)
+        return (written if collect else count)
+
+    def bulkdelete(
+        self,
+        session: MemorySession,
+        *items: t.Any,
+        chunksize: t.Optional[int] = None,
+        commit: CommitPolicy = ONCE
+    ) -> bool:
+        """Delete multiple items (or one iterable); returns False if any item was not stored."""
+        ok = True
+        for chunk in chunked(bulkitems(items), chunksize):
+            with self._lock:
+                results = [self.deleteitem(session, item) for item in chunk]
+            ok = (all(results) and ok)
+        return ok
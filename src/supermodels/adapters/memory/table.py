@@ -0,0 +1,132 @@
+# ~/supermodels/src/supermodels/adapters/memory/table.py
+"""
+In-Memory Table
+
+Row storage for a single model type with hash and sorted secondary indexes.
+"""
+from __future__ import annotations
+import bisect, itertools, typing as t
+
+SortEntry = t.Tuple[bool, t.Any, int]
+
+
+def sortentry(value: t.Any, seq: int) -> SortEntry:
+    """Build a sorted-index entry; None sorts before any value."""
+    return ((value is not None), value, seq)
+
+
+def nullskey(nullsfirst: bool) -> t.Callable[[t.Any], bool]:
+    """Stable re-sort key moving None values first (or last) and keeping the rest in order."""
+    return (lambda value: ((value is not None) == nullsfirst))
+
+
+class MemoryTable:
+    """Rows of one model keyed by primary key, with secondary indexes.
+
+    Hash indexes map a field value to the primary keys holding it, so
+    equality lookups on indexed fields avoid a scan. Sorted indexes keep
+    `(value, insertion order)` entries in order for paging without sorting.
+    Indexed values are snapshotted on write, so an item mutated in place is
+    re-indexed correctly on its next update.
+    """
+
+    def __init__(self, pk: str, indexed: t.Iterable[str] = (), sortable: t.Iterable[str] = ()) -> None:
+        """Initialize empty table with primary key field and index declarations."""
+        self.pk = pk
+        self.rows: t.Dict[t.Any, t.Any] = {}
+        self.hashes: t.Dict[str, t.Dict[t.Any, t.Dict[t.Any, None]]] = {f: {} for f in indexed}
+        self.sorted: t.Dict[str, t.List[SortEntry]] = {f: [] for f in sortable}
+        self._snapshots: t.Dict[t.Any, t.Tuple[int, t.Dict[str, t.Any]]] = {}
+        self._bysequence: t.Dict[int, t.Any] = {}
+        self._keys: t.Dict[int, t.Any] = {} # id(row) -> primary key it is stored under
+        self._sequence = itertools.count()
+        self._nextid = 1
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def assignid(self, item: t.Any) -> t.Any:
+        """Assign an autoincrement primary key if the item has none."""
+        key = getattr(item, self.pk, None)
+        if key is None:
+            key = self._nextid
+            setattr(item, self.pk, key)
+        return key
+
+    def storedkey(self, item: t.Any) -> t.Any:
+        """Get the primary key this exact row object is stored under, or None."""
+        return self._keys.get(id(item))
+
+    def insert(self, key: t.Any, item: t.Any) -> None:
+        """Store an item under its primary key and index it."""
+        seq = next(self._sequence)
+        self.rows[key] = item
+        self._bysequence[seq] = key
+        self._keys[id(item)] = key
+        self._index(key, item, seq)
+        if isinstance(key, int) and (key >= self._nextid):
+            self._nextid = (key + 1)
+
+    def replace(self, key: t.Any, item: t.Any) -> None:
+        """Re-store an existing row, refreshing its index entries."""
+        seq, _ = self._snapshots[key]
+        self._unindex(key)
+        self._keys.pop(id(self.rows[key]), None)
+        self.rows[key] = item
+        self._keys[id(item)] = key
+        self._index(key, item, seq)
+
+    def rekey(self, old: t.Any, new: t.Any) -> None:
+        """Move the row stored under `old` to `new`, keeping its sequence for sorted-index ties."""
+        seq, _ = self._snapshots[old]
+        self._unindex(old)
+        item = self.rows.pop(old)
+        self.rows[new] = item
+        self._bysequence[seq] = new
+        self._keys[id(item)] = new
+        self._index(new, item, seq)
+        if isinstance(new, int) and (new >= self._nextid):
+            self._nextid = (new + 1)
+
+    def remove(self, key: t.Any) -> t.Any:
+        """Remove and return the row stored under a primary key."""
+        seq, _ = self._snapshots[key]
+        self._unindex(key)
+        del self._bysequence[seq]
+        item = self.rows.pop(key)
+        self._keys.pop(id(item), None)
+        return item
+
+    def _index(self, key: t.Any, item: t.Any, seq: int) -> None:
+        """Add index entries for a row and snapshot its indexed values."""
+        snapshot = {}
+        for field, buckets in self.hashes.items():
+            value = snapshot[field] = getattr(item, field, None)
+            buckets.setdefault(value, {})[key] = None
+        for field, entries in self.sorted.items():
+            value = snapshot[field] = getattr(item, field, None)
+            bisect.insort(entries, sortentry(value, seq))
+        self._snapshots[key] = (seq, snapshot)
+
+    def _unindex(self, key: t.Any) -> None:
+        """Remove a row's index entries using its snapshotted values."""
+        seq, snapshot = self._snapshots.pop(key)
+        for field, buckets in self.hashes.items():
+            bucket = buckets[snapshot[field]]
+            del bucket[key]
+            if not bucket: del buckets[snapshot[field]]
+        for field, entries in self.sorted.items():
+            entry = sortentry(snapshot[field], seq)
+            del entries[bisect.bisect_left(entries, entry)]
+
+    def lookup(self, field: str, value: t.Any) -> t.Dict[t.Any, None]:
+        """Get primary keys whose indexed field equals value."""
+        return self.hashes[field].get(value, {})
+
+    def ordered(self, field: str, descending: bool = False, nullsfirst: t.Optional[bool] = None) -> t.Iterator[t.Any]:
+        """Iterate primary keys in sorted-index order; None values come first ascending unless `nullsfirst` says otherwise."""
+        entries = (reversed(self.sorted[field]) if descending else iter(self.sorted[field]))
+        if (nullsfirst is not None) and (nullsfirst == descending):
+            key = nullskey(nullsfirst)
+            entries = iter(sorted(entries, key=lambda entry: key(entry[1])))
+        return (self._bysequence[seq] for _, _, seq in entries)
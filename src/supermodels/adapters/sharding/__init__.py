@@ -0,0 +1,13 @@
+# ~/supermodels/src/supermodels/adapters/sharding/__init__.py
+"""
+Sharding Adapter
+
+Horizontal sharding over several DBAdapters. Writes and keyed reads are
+routed to a single shard; unkeyed reads scatter to every shard in parallel
+and gather the merged results.
+"""
+
+from .adapter import ShardedAdapter, ShardedSession
+from .hints import ShardFunction, hashshards
+
+__all__ = ['ShardedAdapter', 'ShardedSession', 'ShardFunction', 'hashshards']
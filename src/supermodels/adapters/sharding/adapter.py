@@ -0,0 +1,454 @@
+# ~/supermodels/src/supermodels/adapters/sharding/adapter.py
+"""
+Sharding Database Adapter
+
+DBAdapter that partitions one logical dataset across several underlying
+adapters by a shard key. Writes and keyed reads go to exactly one shard;
+unkeyed reads fan out to all shards on a thread pool and are merged,
+including a global sort for paginated queries.
+"""
+from __future__ import annotations
+import heapq, weakref, threading, itertools, typing as t
+from concurrent.futures import ThreadPoolExecutor
+
+from supermodels.core.models.tvars import ModelType
+from supermodels.core.bases.adapter import DBAdapter
+from supermodels.core.enums import CommitPolicy, ONCE
+from supermodels.core.utils.chunks import bulkitems, chunked
+from supermodels.core.filters import Expression
+from supermodels.core.aggregates import Aggregate, AggregateRow, parseaggregates, shaperows
+from supermodels.adapters.sqla.enums import OrderBy, ASC, DESC
+from supermodels.adapters.sharding.hints import ShardFunction, hashshards
+
+R = t.TypeVar('R')
+
+
+def _sortkey(sortby: str, orderby: OrderBy, nullsfirst: bool) -> t.Callable[[t.Any], t.Tuple[bool, t.Any]]:
+    """Merge key (for `heapq.merge(reverse=orderby == DESC)`) placing NULLs first or last."""
+    nullrank = (nullsfirst != (orderby == DESC))
+    def key(item: t.Any) -> t.Tuple[bool, t.Any]:
+        value = getattr(item, sortby, None)
+        return (((not nullrank) if value is None else nullrank), value)
+    return key
+
+
+class ShardedSession:
+    """Session spanning several shards.
+
+    Per-shard sessions are opened on first use and committed, rolled back
+    or closed together.
+    """
+
+    def __init__(self, adapter: 'ShardedAdapter') -> None:
+        """Initialize with the owning sharded adapter."""
+        self.adapter = adapter
+        self.sessions: t.Dict[str, t.Any] = {}
+        self._lock = threading.Lock()
+
+    def forshard(self, name: str) -> t.Any:
+        """Get (or open) the session for a shard."""
+        with self._lock:
+            if name not in self.sessions:
+                self.sessions[name] = self.adapter.shards[name].createsession()
+            return self.sessions[name]
+
+    def commit(self) -> None:
+        """Commit every opened shard session."""
+        for session in self.sessions.values(): session.commit()
+
+    def rollback(self) -> None:
+        """Rollback every opened shard session."""
+        for session in self.sessions.values(): session.rollback()
+
+    def close(self) -> None:
+        """Close every opened shard session."""
+        for name, session in self.sessions.items():
+            self.adapter.shards[name].closesession(session)
+        self.sessions.clear()
+
+
+class ShardedAdapter(DBAdapter[ShardedSession]):
+    """Adapter routing operations across shards by a shard key.
+
+    Items are placed with `shardfunc(getattr(item, shardkey))`. Reads that
+    filter on the shard key are served by one shard; all other reads are
+    scattered to every shard in parallel and gathered. The scatter thread
+    pool is stopped by `shutdown()`, on leaving a `with` block, when the
+    adapter is garbage collected or at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        shards: t.Mapping[str, DBAdapter],
+        shardkey: str,
+        shardfunc: t.Optional[ShardFunction] = None,
+        maxworkers: t.Optional[int] = None,
+    ) -> None:
+        """Initialize with named shard adapters, the shard key attribute and an optional shard function."""
+        if not shards:
+            raise ValueError("At least one shard must be provided")
+        self.shards: t.Dict[str, DBAdapter] = dict(shards)
+        self.shardkey = shardkey
+        self.shardfunc: ShardFunction = (shardfunc or hashshards(list(self.shards)))
+        self._executor = ThreadPoolExecutor(
+            max_workers=(maxworkers or len(self.shards)),
+            thread_name_prefix='supermodels-shard'
+        )
+        # holds the executor, not the adapter, so it also runs at exit or once the adapter is collected
+        self._shutdown = weakref.finalize(self, self._executor.shutdown, wait=True)
+
+    def shutdown(self) -> None:
+        """Stop the scatter-gather thread pool."""
+        self._shutdown()
+
+    def __enter__(self) -> 'ShardedAdapter':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.shutdown()
+
+    ## ROUTING ##
+    def route(self, key: t.Any) -> str:
+        """Get the shard name for a shard key value."""
+        if key is None:
+            raise ValueError(f"Cannot route item with no value for shard key '{self.shardkey}'")
+        name = self.shardfunc(key)
+        if name not in self.shards:
+            raise ValueError(f"Shard function returned unknown shard '{name}'. Available shards: {list(self.shards)}")
+        return name
+
+    def routeitem(self, item: t.Any) -> str:
+        """Get the shard name for an item from its shard key attribute."""
+        return self.route(getattr(item, self.shardkey, None))
+
+    def _keyed(self, filters: t.Dict[str, t.Any]) -> t.Optional[str]:
+        """Get the target shard if filters pin the shard key, otherwise None."""
+        if self.shardkey in filters:
+            return self.route(filters[self.shardkey])
+        return None
+
+    def _scatter(self, session: ShardedSession, fn: t.Callable[[DBAdapter, t.Any], R]) -> t.List[R]:
+        """Run `fn(adapter, shardsession)` on every shard in parallel, in shard order."""
+        names = list(self.shards)
+        sessions = [session.forshard(name) for name in names]
+        return list(self._executor.map(
+            lambda pair: fn(self.shards[pair[0]], pair[1]),
+            zip(names, sessions)
+        ))
+
+    def _one(self, session: ShardedSession, name: str) -> t.Tuple[DBAdapter, t.Any]:
+        """Get the adapter and session for a single shard."""
+        return self.shards[name], session.forshard(name)
+
+    ## SESSIONS ##
+    def createsession(self) -> ShardedSession:
+        """Create a new multi-shard session."""
+        return ShardedSession(self)
+
+    def closesession(self, session: ShardedSession) -> None:
+        """Close all shard sessions."""
+        session.close()
+
+    ## QUERYING ##
+    def queryall(self, session: ShardedSession, model: t.Type[ModelType]) -> t.List[ModelType]:
+        """Query all records of a model type from every shard."""
+        results = self._scatter(session, lambda a, s: a.queryall(s, model))
+        return list(itertools.chain.from_iterable(results))
+
+    def queryby(self, session: ShardedSession, model: t.Type[ModelType], *where: Expression, **filters: t.Any) -> t.List[ModelType]:
+        """Query records with filter criteria, from one shard when keyed."""
+        name = self._keyed(filters)
+        if name is not None:
+            adapter, shardsession = self._one(session, name)
+            return adapter.queryby(shardsession, model, *where, **filters)
+        results = self._scatter(session, lambda a, s: a.queryby(s, model, *where, **filters))
+        return list(itertools.chain.from_iterable(results))
+
+    def queryoneby(self, session: ShardedSession, model: t.Type[ModelType], *where: Expression, **kwargs: t.Any) -> t.Optional[ModelType]:
+        """Query a single record with filter criteria, from one shard when keyed."""
+        name = self._keyed(kwargs)
+        if name is not None:
+            adapter, shardsession = self._one(session, name)
+            return adapter.queryoneby(shardsession, model, *where, **kwargs)
+        results = self._scatter(session, lambda a, s: a.queryoneby(s, model, *where, **kwargs))
+        return next((r for r in results if r is not None), None)
+
+    def querybyid(self, session: ShardedSession, model: t.Type[ModelType], **kwargs: t.Any) -> t.Optional[ModelType]:
+        """Query a record by its ID, from one shard when the shard key is also given.
+
+        Ids are only unique within a shard, so an unkeyed lookup found on
+        more than one shard raises instead of returning an arbitrary match.
+        """
+        name = self._keyed(kwargs)
+        if name is not None:
+            adapter, shardsession = self._one(session, name)
+            return adapter.querybyid(shardsession, model, id=kwargs.get('id'))
+        results = self._scatter(session, lambda a, s: a.querybyid(s, model, id=kwargs.get('id')))
+        found = [(n, r) for n, r in zip(self.shards, results) if r is not None]
+        if len(found) > 1:
+            raise ValueError(
+                f"{model.__name__} id {kwargs.get('id')!r} exists on shards {[n for n, _ in found]}; "
+                f"pass shard key '{self.shardkey}' to choose one"
+            )
+        return (found[0][1] if found else None)
+
+    def querypage(
+        self,
+        session: ShardedSession,
+        model: t.Type[ModelType],
+        page: int = 1,
+        hits: int = 25,
+        sortby: str = 'id',
+        orderby: OrderBy = DESC,
+        where: t.Optional[Expression] = None,
+        nullsfirst: t.Optional[bool] = None,
+        **filters: t.Any
+    ) -> t.Tuple[t.List[ModelType], int]:
+        """Query records with pagination and a global sort across shards.
+
+        Unkeyed pages fetch the first `page * hits` rows from every shard,
+        merge them by the sort column and slice out the requested page;
+        `sortby` must be a model field. Shard dialects may order NULLs
+        differently, so the merge decides where they go (first ascending and
+        last descending unless `nullsfirst` is given) and asks every shard for
+        that placement explicitly.
+        """
+        if not hasattr(model, sortby):
+            raise ValueError(f"Cannot sort on unknown field '{sortby}' of model '{model.__name__}'")
+        name = self._keyed(filters)
+        if name is not None:
+            adapter, shardsession = self._one(session, name)
+            return adapter.querypage( # type: ignore
+                shardsession, model, page=page, hits=hits, sortby=sortby, orderby=orderby, where=where, nullsfirst=nullsfirst, **filters
+            )
+
+        window = (page * hits)
+        nulls = ((orderby is ASC) if nullsfirst is None else nullsfirst)
+        results = self._scatter(
+            session,
+            lambda a, s: a.querypage( # type: ignore
+                s, model, page=1, hits=window, sortby=sortby, orderby=orderby, where=where, nullsfirst=nulls, **filters
+            )
+        )
+        total = sum(count for _, count in results)
+
+        merged = heapq.merge(*(items for items, _ in results), key=_sortkey(sortby, orderby, nulls), reverse=(orderby == DESC))
+        offset = ((page - 1) * hits)
+        return (list(itertools.islice(merged, offset, offset + hits)), total)
+
+    def iterpages(
+        self,
+        session: ShardedSession,
+        model: t.Type[ModelType],
+        hits: int = 25,
+        sortby: str = 'id',
+        orderby: OrderBy = ASC,
+        where: t.Optional[Expression] = None,
+        nullsfirst: t.Optional[bool] = None,
+        **options: t.Any
+    ) -> t.Iterator[t.List[ModelType]]:
+        """Iterate all matching records page by page with a global sort across shards.
+
+        Keyed walks run on one shard. Otherwise every shard's own `iterpages`
+        walk is started, their rows are merged by the sort column (NULLs
+        placed like `querypage`) and regrouped into pages of `hits`, so about
+        one page per shard is held at a time. Remaining options (filters, and
+        e.g. `keyset`/`prefetch`) are passed to the shards.
+        """
+        if not hasattr(model, sortby):
+            raise ValueError(f"Cannot sort on unknown field '{sortby}' of model '{model.__name__}'")
+        if hits < 1:
+            raise ValueError(f"Page size must be positive, got {hits}")
+        name = self._keyed(options)
+        if name is not None:
+            adapter, shardsession = self._one(session, name)
+            return adapter.iterpages(
+                shardsession, model, hits=hits, sortby=sortby, orderby=orderby, where=where, nullsfirst=nullsfirst, **options
+            )
+
+        nulls = ((orderby is ASC) if nullsfirst is None else nullsfirst)
+        walks = [
+            adapter.iterpages(
+                session.forshard(name), model, hits=hits, sortby=sortby, orderby=orderby, where=where, nullsfirst=nulls, **options
+            )
+            for name, adapter in self.shards.items()
+        ]
+        return self._mergepages(walks, hits, _sortkey(sortby, orderby, nulls), (orderby == DESC))
+
+    @staticmethod
+    def _mergepages(
+        walks: t.List[t.Iterator[t.List[t.Any]]],
+        hits: int,
+        key: t.Callable[[t.Any], t.Any],
+        reverse: bool
+    ) -> t.Iterator[t.List[t.Any]]:
+        """Merge sorted per-shard page walks into pages of `hits`, closing the walks when done."""
+        try:
+            rows = heapq.merge(*map(itertools.chain.from_iterable, walks), key=key, reverse=reverse)
+            yield from chunked(rows, hits)
+        finally:
+            for walk in walks:
+                close = getattr(walk, 'close', None)
+                if close is not None: close()
+
+    def aggregate(
+        self,
+        session: ShardedSession,
+        model: t.Type[ModelType],
+        *where: Expression,
+        groupby: t.Sequence[str] = (),
+        astuples: bool = False,
+        **kwargs: t.Any
+    ) -> t.List[AggregateRow]:
+        """Compute grouped aggregates per shard and combine the partial results.
+
+        AVG is computed from per-shard SUM and COUNT so the combined value is
+        exact; COUNT/SUM add up and MIN/MAX take the extreme.
+        """
+        aggregates, filters = parseaggregates(model, **kwargs)
+        name = self._keyed(filters)
+        if name is not None:
+            adapter, shardsession = self._one(session, name)
+            return adapter.aggregate(shardsession, model, *where, groupby=groupby, astuples=astuples, **kwargs)
+
+        partials: t.Dict[Aggregate, None] = {}
+        for a in aggregates:
+            if a.func == 'avg':
+                partials[Aggregate('sum', a.field)] = None
+                partials[Aggregate('count', a.field)] = None
+            else:
+                partials[a] = None
+        request: t.Dict[str, t.List[t.Any]] = {}
+        for a in partials:
+            request.setdefault(a.func, []).append(True if a.field is None else a.field)
+        shardaggs, _ = parseaggregates(**request)
+
+        results = self._scatter(
+            session,
+            lambda a, s: a.aggregate(s, model, *where, groupby=groupby, astuples=True, **request, **filters)
+        )
+
+        width = len(groupby)
+        combined: t.Dict[t.Tuple[t.Any, ...], t.Dict[Aggregate, t.Any]] = {}
+        for rows in results:
+            for row in rows:
+                values = combined.setdefault(tuple(row[:width]), {})
+                for a, v in zip(shardaggs, row[width:]):
+                    current = values.get(a)
+                    if (v is None) or (current is None):
+                        values[a] = (current if v is None else v)
+                    elif a.func in ('count', 'sum'):
+                        values[a] = (current + v)
+                    elif a.func == 'min':
+                        values[a] = min(current, v)
+                    else:
+                        values[a] = max(current, v)
+
+        def final(values: t.Dict[Aggregate, t.Any], a: Aggregate) -> t.Any:
+            if a.func != 'avg':
+                return values.get(a)
+            total, count = values.get(Aggregate('sum', a.field)), values.get(Aggregate('count', a.field))
+            return ((total / count) if count else None)
+
+        rows = [(*key, *(final(values, a) for a in aggregates)) for key, values in combined.items()]
+        return shaperows(rows, groupby, aggregates, astuples)
+
+    ## CRUD ##
+    def additem(self, session: ShardedSession, item: t.Any) -> t.Any:
+        """Add an item to its shard."""
+        adapter, shardsession = self._one(session, self.routeitem(item))
+        return adapter.additem(shardsession, item)
+
+    def updateitem(self, session: ShardedSession, item: t.Any, changes: t.Optional[t.Dict[str, t.Any]] = None) -> t.Any:
+        """Update an item on its shard."""
+        adapter, shardsession = self._one(session, self.routeitem(item))
+        if changes is None:
+            return adapter.updateitem(shardsession, item)
+        return adapter.updateitem(shardsession, item, changes=changes)
+
+    def deleteitem(self, session: ShardedSession, item: t.Any) -> bool:
+        """Delete an item from its shard."""
+        adapter, shardsession = self._one(session, self.routeitem(item))
+        return adapter.deleteitem(shardsession, item)
+
+    ## BULK ##
+    def _group(self, items: t.Sequence[t.Any]) -> t.Dict[str, t.List[int]]:
+        """Group item indexes by target shard."""
+        groups: t.Dict[str, t.List[int]] = {}
+        for i, item in enumerate(items):
+            groups.setdefault(self.routeitem(item), []).append(i)
+        return groups
+
+    def _bulk(self, session: ShardedSession, opname: str, items: t.Sequence[t.Any], **options: t.Any) -> t.List[t.Tuple[t.List[int], t.Any]]:
+        """Run a bulk operation per shard in parallel; returns (indexes, result) per shard."""
+        groups = self._group(items)
+        sessions = {name: session.forshard(name) for name in groups}
+
+        def run(name: str) -> t.Tuple[t.List[int], t.Any]:
+            indexes = groups[name]
+            op = getattr(self.shards[name], opname)
+            return indexes, op(sessions[name], *(items[i] for i in indexes), **options)
+
+        return list(self._executor.map(run, groups))
+
+    def _bulkwrite(
+        self,
+        session: ShardedSession,
+        opname: str,
+        items: t.Tuple[t.Any, ...],
+        chunksize: t.Optional[int],
+        commit: CommitPolicy,
+        collect: bool
+    ) -> t.Union[t.List[t.Any], int]:
+        """Write items chunk by chunk, one bulk write per shard and chunk."""
+        written: t.List[t.Any] = []
+        count = 0
+        for chunk in chunked(bulkitems(items), chunksize):
+            results: t.List[t.Any] = list(chunk)
+            for indexes, shardwritten in self._bulk(session, opname, chunk, commit=commit):
+                for i, item in zip(indexes, shardwritten): results[i] = item
+            count += len(results)
+            if collect:
+                written.extend(results)
+        return (written if collect else count)
+
+    def bulkadd(
+        self,
+        session: ShardedSession,
+        *items: t.Any,
+        chunksize: t.Optional[int] = None,
+        commit: CommitPolicy = ONCE,
+        collect: bool = True
+    ) -> t.Union[t.List[t.Any], int]:
+        """Add multiple items (or one iterable), one bulk write per shard and chunk.
+
+        Shards commit independently, so every chunk is committed on each shard
+        it touches; `commit` is applied within each shard's write.
+        """
+        return self._bulkwrite(session, 'bulkadd', items, chunksize, commit, collect)
+
+    def bulkupdate(
+        self,
+        session: ShardedSession,
+        *items: t.Any,
+        chunksize: t.Optional[int] = None,
+        commit: CommitPolicy = ONCE,
+        collect: bool = True
+    ) -> t.Union[t.List[t.Any], int]:
+        """Update multiple items (or one iterable), one bulk write per shard and chunk."""
+        return self._bulkwrite(session, 'bulkupdate', items, chunksize, commit, collect)
+
+    def bulkdelete(
+        self,
+        session: ShardedSession,
+        *items: t.Any,
+        chunksize: t.Optional[int] = None,
+        commit: CommitPolicy = ONCE
+    ) -> bool:
+        """Delete multiple items (or one iterable), one bulk delete per shard and chunk."""
+        results = [
+            ok
+            for chunk in chunked(bulkitems(items), chunksize)
+            for _, ok in self._bulk(session, 'bulkdelete', chunk, commit=commit)
+        ]
+        return all(results)
@@ -0,0 +1,26 @@
+# ~/supermodels/src/supermodels/adapters/sharding/hints.py
+"""
+Sharding Type Hints and Helpers
+
+Type definitions and the default shard function for the sharding adapter.
+"""
+from __future__ import annotations
+import zlib, typing as t
+
+ShardFunction = t.Callable[[t.Any], str]
+
+
+def hashshards(names: t.Sequence[str]) -> ShardFunction:
+    """Build a shard function that maps keys to shard names by stable hash.
+
+    Uses CRC32 of the key's string form, so placement is stable across
+    processes (unlike the builtin `hash`, which is salted per process).
+    """
+    ordered = list(names)
+    if not ordered:
+        raise ValueError("At least one shard name must be provided")
+
+    def shardfunc(key: t.Any) -> str:
+        return ordered[zlib.crc32(str(key).encode('utf-8')) % len(ordered)]
+
+    return shardfunc
@@ -4,12 +4,55 @@ SQLAlchemy Adapter
 
 Complete SQLAlchemy implementation with advanced features like pagination,
 bulk operations, and optimized querying.
+
+Names are imported on first access; light modules such as `enums` can be
+used without loading the SQLAlchemy ORM.
 """
+from __future__ import annotations
+
+from supermodels.core.utils.lazymodules import lazymodule, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .adapter import SQLAAdapter, SQLA
+    from .enums import OrderBy, ASC, DESC
+    from .hints import SessionFactory, PaginationResult
+    from .writebehind import WriteBehindQueue, WriteBehindConfig, WriteBehindStats
+    from .bulk import BulkReport, BulkFailure
+    from .slowlog import SlowLog, SlowLogConfig, SlowOperation, SlowStatement
+    from .advisor import IndexAdvisor, AdvisorReport, MissingIndex, UnusedIndex, createindex
+    from .pages import PageIterator
 
-from .adapter import SQLAAdapter
-from .enums import OrderBy, ASC, DESC
-from .hints import SessionFactory, PaginationResult
+_lazy = {
+    'SQLAAdapter': 'supermodels.adapters.sqla.adapter',
+    'SQLA': 'supermodels.adapters.sqla.adapter',
+    'OrderBy': 'supermodels.adapters.sqla.enums',
+    'ASC': 'supermodels.adapters.sqla.enums',
+    'DESC': 'supermodels.adapters.sqla.enums',
+    'SessionFactory': 'supermodels.adapters.sqla.hints',
+    'PaginationResult': 'supermodels.adapters.sqla.hints',
+    'WriteBehindQueue': 'supermodels.adapters.sqla.writebehind',
+    'WriteBehindConfig': 'supermodels.adapters.sqla.writebehind',
+    'WriteBehindStats': 'supermodels.adapters.sqla.writebehind',
+    'BulkReport': 'supermodels.adapters.sqla.bulk',
+    'BulkFailure': 'supermodels.adapters.sqla.bulk',
+    'SlowLog': 'supermodels.adapters.sqla.slowlog',
+    'SlowLogConfig': 'supermodels.adapters.sqla.slowlog',
+    'SlowOperation': 'supermodels.adapters.sqla.slowlog',
+    'SlowStatement': 'supermodels.adapters.sqla.slowlog',
+    'IndexAdvisor': 'supermodels.adapters.sqla.advisor',
+    'AdvisorReport': 'supermodels.adapters.sqla.advisor',
+    'MissingIndex': 'supermodels.adapters.sqla.advisor',
+    'UnusedIndex': 'supermodels.adapters.sqla.advisor',
+    'createindex': 'supermodels.adapters.sqla.advisor',
+    'PageIterator': 'supermodels.adapters.sqla.pages',
+}
 
-SQLA = SQLAAdapter
+__all__ = [
+    'SQLAAdapter', 'SQLA', 'OrderBy', 'ASC', 'DESC', 'SessionFactory', 'PaginationResult',
+    'WriteBehindQueue', 'WriteBehindConfig', 'WriteBehindStats', 'BulkReport', 'BulkFailure',
+    'SlowLog', 'SlowLogConfig', 'SlowOperation', 'SlowStatement',
+    'IndexAdvisor', 'AdvisorReport', 'MissingIndex', 'UnusedIndex', 'createindex',
+    'PageIterator'
+]
 
-__all__ = ['SQLAAdapter', 'SQLA', 'OrderBy', 'ASC', 'DESC', 'SessionFactory', 'PaginationResult']
+__getattr__, __dir__ = lazymodule(__name__, _lazy)
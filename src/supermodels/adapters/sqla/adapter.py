@@ -8,14 +8,26 @@ database operations including advanced features like pagination and bulk operati
 from __future__ import annotations
 import typing as t
 
-from sqlalchemy import desc, asc
+from sqlalchemy import desc, asc, inspect, select, update, func
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.engine import Engine
 
 from supermodels.core.models.tvars import ModelType
+from supermodels.core.filters import Expression
+from supermodels.core.aggregates import AggregateRow, parseaggregates, shaperows
 from supermodels.core.bases.adapter import DBAdapter
+from supermodels.core.enums import CommitPolicy, ONCE
+from supermodels.core.utils.chunks import bulkitems, chunked
 from supermodels.adapters.sqla.hints import SessionFactory, PaginationResult
 from supermodels.adapters.sqla.enums import OrderBy, ASC, DESC
+from supermodels.adapters.sqla.writebehind import WriteBehindQueue, WriteBehindConfig
+from supermodels.adapters.sqla.bulk import BulkReport, savepointwrite, chunkedwrite
+from supermodels.adapters.sqla.filters import compilefilters, compileexpr, column
+from supermodels.adapters.sqla.tracking import detectchanges, snapshot
+from supermodels.adapters.sqla.slowlog import SlowLog, SlowLogConfig, observed
+from supermodels.adapters.sqla.advisor import IndexAdvisor
+from supermodels.adapters.sqla.pages import PageIterator, pagefetch
 
 class SQLAAdapter(DBAdapter[Session]):
     """SQLAlchemy implementation of the database adapter interface.
@@ -28,10 +40,50 @@ class SQLAAdapter(DBAdapter[Session]):
         self,
         engine: Engine,
         sessionfactory: t.Optional[SessionFactory] = None,
+        writebehind: t.Union[bool, WriteBehindConfig] = False,
+        slowlog: t.Union[bool, SlowLogConfig] = False,
+        advisor: t.Union[bool, IndexAdvisor] = False,
     ) -> None:
-        """Initialize adapter with SQLAlchemy engine and optional session factory."""
+        """Initialize adapter with SQLAlchemy engine and optional session factory.
+
+        Passing `writebehind=True` (or a WriteBehindConfig) makes `additem`
+        queue items for batched insertion by a background thread instead of
+        issuing an INSERT and COMMIT per call.
+
+        Passing `slowlog=True` (or a SlowLogConfig) records operations slower
+        than the threshold, with their SQL and query plans, in `self.slowlog`.
+
+        Passing `advisor=True` (or an IndexAdvisor to share) records the
+        filter and sort shapes of queries in `self.advisor` for index reports.
+        """
         self.engine = engine
         self.sessionfactory = (sessionfactory or sessionmaker(bind=engine))
+        self.writebehind: t.Optional[WriteBehindQueue] = None
+        if writebehind:
+            config = (writebehind if isinstance(writebehind, WriteBehindConfig) else WriteBehindConfig())
+            self.writebehind = WriteBehindQueue(self._writersession, config)
+        self.slowlog: t.Optional[SlowLog] = None
+        if slowlog:
+            self.slowlog = SlowLog(engine, (slowlog if isinstance(slowlog, SlowLogConfig) else SlowLogConfig()))
+        self.advisor: t.Optional[IndexAdvisor] = None
+        if advisor:
+            self.advisor = (advisor if isinstance(advisor, IndexAdvisor) else IndexAdvisor())
+
+    def _writersession(self) -> Session:
+        """Create a session for the write-behind thread that keeps items loaded after commit."""
+        return Session(bind=self.engine, expire_on_commit=False)
+
+    def flush(self) -> None:
+        """Write all items pending in the write-behind queue, if enabled."""
+        if self.writebehind is not None:
+            self.writebehind.flush()
+
+    def shutdown(self) -> None:
+        """Flush pending write-behind items, stop the writer thread and close the slow log."""
+        if self.writebehind is not None:
+            self.writebehind.close()
+        if self.slowlog is not None:
+            self.slowlog.close()
 
     def createsession(self) -> Session:
         """Create a new SQLAlchemy session."""
@@ -41,46 +93,120 @@ class SQLAAdapter(DBAdapter[Session]):
         """Close a SQLAlchemy session."""
         session.close()
 
+    @observed
     def queryall(self, session: Session, model: t.Type[ModelType]) -> t.List[ModelType]:
         """Query all records of a model type."""
         return session.query(model).all()
 
-    def queryby(self, session: Session, model: t.Type[ModelType], **filters: t.Any) -> t.List[ModelType]:
-        """Query records with filter criteria."""
-        query = session.query(model)
+    @observed
+    def queryby(self, session: Session, model: t.Type[ModelType], *where: Expression, **filters: t.Any) -> t.List[ModelType]:
+        """Query records with filter criteria.
 
-        for k,v in filters.items():
-            if hasattr(model, k):
-                query = query.filter(getattr(model, k) == v)
+        Keyword filters support operators (`age__gte=18`, `id__in=[...]`,
+        `name__startswith='jo'`, `email__isnull=True`) and positional AND/OR
+        groups; all are compiled into the SQL WHERE clause.
+        """
+        if self.advisor is not None:
+            self.advisor.record(model, *where, **filters)
+        return session.query(model).filter(*compilefilters(model, *where, **filters)).all()
 
-        return query.all()
-
-    def queryoneby(self, session: Session, model: t.Type[ModelType], **kwargs: t.Any) -> t.Optional[ModelType]:
+    @observed
+    def queryoneby(self, session: Session, model: t.Type[ModelType], *where: Expression, **kwargs: t.Any) -> t.Optional[ModelType]:
         """Query a single record with filter criteria."""
-        results = self.queryby(session, model, **kwargs)
-        if results:
-            return results[0]
-        return None
+        if self.advisor is not None:
+            self.advisor.record(model, *where, **kwargs)
+        return session.query(model).filter(*compilefilters(model, *where, **kwargs)).first()
 
+    @observed
     def querybyid(self, session: Session, model: t.Type[ModelType], **kwargs: t.Any) -> t.Optional[ModelType]:
         """Query a record by its ID."""
         idval = kwargs.get('id')
         if idval is None: return None
         return session.query(model).get(idval)
 
+    @observed
     def additem(self, session: Session, item: t.Any) -> t.Any:
-        """Add an item to the database."""
+        """Add an item to the database.
+
+        With write-behind enabled the item is queued and returned immediately;
+        it is inserted by the next batch flush.
+        """
+        if self.writebehind is not None:
+            return self.writebehind.put(item)
         session.add(item)
         session.commit()
         return item
 
-    def updateitem(self, session: Session, item: t.Any) -> t.Any:
-        """Update an existing item in the database."""
-        merged = session.merge(item)
+    @observed
+    def updateitem(self, session: Session, item: t.Any, changes: t.Optional[t.Dict[str, t.Any]] = None) -> t.Any:
+        """Update an existing item in the database.
+
+        Persistent or detached items are written with an UPDATE of only the
+        changed columns, taken from `changes` or from the item's attribute
+        history; nothing is executed when no column changed. Tracked typed
+        columns are compared against their loaded snapshots, so in-place
+        mutations are written and equal reassignments are not. Transient items
+        fall back to merge + refresh, and items with changed relationships to
+        merge (which cascades them) + commit.
+        """
+        state = inspect(item)
+        if (changes is None) and (state.key is None):
+            merged = session.merge(item)
+            session.commit()
+            session.refresh(merged)
+            return merged
+
+        mapper = state.mapper
+        if (changes is None) and any(state.attrs[rel.key].history.has_changes() for rel in mapper.relationships):
+            merged = session.merge(item)
+            session.commit()
+            return merged
+        columns = mapper.column_attrs.keys()
+        if changes is None:
+            detectchanges(state)
+            changes = {
+                attr.key: attr.value
+                for attr in state.attrs
+                if (attr.key in columns) and attr.history.has_changes()
+            }
+        else:
+            unknown = [k for k in changes if k not in columns]
+            if unknown:
+                raise ValueError(f"Cannot update unknown columns {unknown} on model '{mapper.class_.__name__}'")
+
+        if not changes:
+            return item
+
+        identity = (state.identity or mapper.primary_key_from_instance(item))
+        criteria = [
+            (mapper.get_property_by_column(col).class_attribute == val)
+            for col, val in zip(mapper.primary_key, identity)
+        ]
+        # only columns rewritten by the database or an onupdate default need reading back
+        generated = [
+            prop for prop in mapper.column_attrs
+            if any((col.server_onupdate is not None) or (col.onupdate is not None) for col in prop.columns)
+        ]
+        with session.no_autoflush:
+            session.execute(
+                update(mapper.class_).where(*criteria).values(**changes),
+                execution_options={'synchronize_session': False}
+            )
+            # mark values committed only once the UPDATE succeeded, so a failure keeps their history
+            for k, v in changes.items():
+                set_committed_value(item, k, v)
+            if generated:
+                row = session.execute(
+                    select(*(prop.class_attribute for prop in generated)).where(*criteria)
+                ).one()
+                for prop, v in zip(generated, row):
+                    set_committed_value(item, prop.key, v)
+        snapshot(state, changes)
+
         session.commit()
-        session.refresh(merged)
-        return merged
+        return item
 
+    @observed
     def deleteitem(self, session: Session, item: t.Any) -> bool:
         """Delete an item from the database."""
         try:
@@ -93,6 +219,7 @@ class SQLAAdapter(DBAdapter[Session]):
             warnings.warn(f"Failed to delete item {item!r}: {e}")
             return False
 
+    @observed
     def querypage(
         self,
         session: Session,
@@ -101,42 +228,155 @@ class SQLAAdapter(DBAdapter[Session]):
         hits: int = 25,
         sortby: str = 'id',
         orderby: OrderBy = DESC,
+        where: t.Optional[Expression] = None,
+        nullsfirst: t.Optional[bool] = None,
         **filters: t.Any
     ) -> PaginationResult:
-        """Query records with pagination and sorting."""
-        query = session.query(model)
+        """Query records with pagination and sorting.
 
-        for k,v in filters.items():
-            if hasattr(model, k):
-                query = query.filter(getattr(model, k) == v)
+        Accepts the same filter operators as `queryby`, plus an optional
+        `where` expression for AND/OR groups. NULLs in `sortby` go where the
+        dialect puts them unless `nullsfirst` is given (see `OrderBy.order`).
+        """
+        if self.advisor is not None:
+            self.advisor.record(model, *((where,) if where is not None else ()), sortby=sortby, **filters)
+        criteria = compilefilters(model, **filters)
+        if where is not None:
+            criteria.append(compileexpr(model, where))
+        query = session.query(model).filter(*criteria)
 
         total = query.count()
 
         if hasattr(model, sortby):
-            query = query.order_by(orderby.func(getattr(model, sortby)))
+            query = query.order_by(*orderby.order(getattr(model, sortby), nullsfirst))
         offset = ((page - 1) * hits)
 
         items = query.offset(offset).limit(hits).all()
 
         return (items, total)
 
-    def bulkadd(self, session: Session, *items: t.Any) -> t.List[t.Any]:
-        """Add multiple items to the database in a single transaction."""
-        session.add_all(list(items))
-        session.commit()
-        return list(items)
+    def iterpages(
+        self,
+        session: t.Optional[Session],
+        model: t.Type[ModelType],
+        hits: int = 25,
+        sortby: str = 'id',
+        orderby: OrderBy = ASC,
+        where: t.Optional[Expression] = None,
+        keyset: bool = False,
+        prefetch: int = 1,
+        nullsfirst: t.Optional[bool] = None,
+        **filters: t.Any
+    ) -> PageIterator:
+        """Iterate all matching records page by page, fetching ahead on a background thread.
 
-    def bulkupdate(self, session: Session, *items: t.Any) -> t.List[t.Any]:
-        """Update multiple items in the database in a single transaction."""
-        for item in items:
-            session.merge(item)
-        session.commit()
-        return list(items)
+        Up to `prefetch` pages are loaded by a worker with its own session
+        while the caller processes the current one; pages are merged into
+        `session` (if given). The worker only sees committed rows, not the
+        caller's pending changes. `keyset=True` seeks past the last row
+        instead of using OFFSET, so deep pages stay cheap. `nullsfirst` places
+        NULL sort values like `querypage`. Stop early with `close()` or by
+        using the iterator as a context manager.
+        """
+        if self.advisor is not None:
+            self.advisor.record(model, *((where,) if where is not None else ()), sortby=sortby, **filters)
+        fetch = pagefetch(model, hits, sortby, orderby, where, keyset, filters, nullsfirst)
+        return PageIterator(self.sessionfactory, fetch, session, prefetch)
+
+    @observed
+    def aggregate(
+        self,
+        session: Session,
+        model: t.Type[ModelType],
+        *where: Expression,
+        groupby: t.Sequence[str] = (),
+        astuples: bool = False,
+        **kwargs: t.Any
+    ) -> t.List[AggregateRow]:
+        """Compute grouped aggregates with SQL GROUP BY.
+
+        Aggregates are given as keywords (`count=True`, `sum='amount'`,
+        `avg=['a', 'b']`, `min=...`, `max=...`); remaining keywords are
+        filters. Returns one dict (or tuple) per group, keyed by the group
+        fields and labels like `sum_amount`.
+        """
+        aggregates, filters = parseaggregates(model, **kwargs)
+        if self.advisor is not None:
+            self.advisor.record(model, *where, **filters)
+        groupcols = [column(model, f) for f in groupby]
+        aggcols = [
+            (func.count() if a.field is None else getattr(func, a.func)(column(model, a.field))).label(a.label)
+            for a in aggregates
+        ]
+        statement = select(*groupcols, *aggcols).where(*compilefilters(model, *where, **filters))
+        if groupcols:
+            statement = statement.group_by(*groupcols)
+        return shaperows(session.execute(statement), groupby, aggregates, astuples)
+
+    @observed
+    def bulkadd(
+        self,
+        session: Session,
+        *items: t.Any,
+        chunksize: t.Optional[int] = None,
+        commit: CommitPolicy = ONCE,
+        collect: bool = True
+    ) -> t.Union[t.List[t.Any], int]:
+        """Add multiple items (or one iterable of items) to the database.
 
-    def bulkdelete(self, session: Session, *items: t.Any) -> bool:
-        """Delete multiple items from the database in a single transaction."""
+        Items are consumed `chunksize` at a time and flushed per chunk; with
+        `commit=PERCHUNK` each chunk is committed instead of one transaction
+        for all. `collect=False` returns only the count of items written.
+        """
+        def apply(s: Session, item: t.Any) -> t.Any:
+            s.add(item)
+            return item
+        return chunkedwrite(session, bulkitems(items), apply, chunksize, commit, collect)
+
+    @observed
+    def bulkupdate(
+        self,
+        session: Session,
+        *items: t.Any,
+        chunksize: t.Optional[int] = None,
+        commit: CommitPolicy = ONCE,
+        collect: bool = True
+    ) -> t.Union[t.List[t.Any], int]:
+        """Update multiple items (or one iterable of items), chunked like `bulkadd`."""
+        def apply(s: Session, item: t.Any) -> t.Any:
+            s.merge(item)
+            return item
+        return chunkedwrite(session, bulkitems(items), apply, chunksize, commit, collect)
+
+    @observed
+    def safebulkadd(self, session: Session, *items: t.Any, chunksize: int = 1000) -> BulkReport:
+        """Add multiple items (or one iterable) in savepoint-isolated chunks, reporting rejected rows."""
+        def apply(s: Session, item: t.Any) -> t.Any:
+            s.add(item)
+            return item
+        return savepointwrite(session, list(bulkitems(items)), apply, chunksize)
+
+    @observed
+    def safebulkupdate(self, session: Session, *items: t.Any, chunksize: int = 1000) -> BulkReport:
+        """Update multiple items (or one iterable) in savepoint-isolated chunks, reporting rejected rows."""
+        return savepointwrite(session, list(bulkitems(items)), Session.merge, chunksize)
+
+    @observed
+    def bulkdelete(
+        self,
+        session: Session,
+        *items: t.Any,
+        chunksize: t.Optional[int] = None,
+        commit: CommitPolicy = ONCE
+    ) -> bool:
+        """Delete multiple items (or one iterable of items), chunked like `bulkadd`."""
         try:
-            for item in items: session.delete(item)
+            for chunk in chunked(bulkitems(items), chunksize):
+                for item in chunk: session.delete(item)
+                if commit is CommitPolicy.PERCHUNK:
+                    session.commit()
+                else:
+                    session.flush()
             session.commit()
             return True
         except Exception as e:
@@ -146,6 +386,9 @@ class SQLAAdapter(DBAdapter[Session]):
             return False
 
 
+SQLA = SQLAAdapter
+
+
 """
 - bulkdelete // should probably add way to track individual failures, variate return type // keep it simple for now tho
     if `deletion` wasnt unbound this would be so sexy:
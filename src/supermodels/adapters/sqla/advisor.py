@@ -0,0 +1,165 @@
+# ~/supermodels/src/supermodels/adapters/sqla/advisor.py
+"""
+SQLAlchemy Index Advisor
+
+Records the filter shapes (which columns are compared by equality, which by
+range, and the sort column) that queries actually use per model, and
+compares them with the indexes declared in the table metadata to report
+missing and unused indexes together with how often each shape was seen.
+"""
+from __future__ import annotations
+import threading, collections, typing as t, dataclasses as dcs
+
+from sqlalchemy import Index, Table, UniqueConstraint, inspect
+from sqlalchemy.schema import CreateIndex
+
+from supermodels.core.filters import Expression, parsefilters, fields, equalities
+
+if t.TYPE_CHECKING:
+    from sqlalchemy.engine import Dialect
+
+Columns = t.Tuple[str, ...]
+
+
+@dcs.dataclass(frozen=True)
+class QueryShape:
+    """Columns a query filtered and sorted on, independent of values.
+
+    Attributes:
+        equals: Columns compared by top-level equality, sorted
+        ranges: Other filtered columns (ranges, IN, LIKE, OR groups), sorted
+        sortby: Column the query ordered by, if any
+    """
+    equals: Columns = ()
+    ranges: Columns = ()
+    sortby: t.Optional[str] = None
+
+    @property
+    def columns(self) -> Columns:
+        """Columns an ideal index for this shape would have, in order."""
+        columns = (*self.equals, *self.ranges)
+        if self.sortby and (self.sortby not in columns):
+            columns = (*columns, self.sortby)
+        return columns
+
+    def usable(self, index: Columns) -> bool:
+        """Whether an index with these columns can narrow or order this query."""
+        lead = index[0]
+        return (lead in self.equals) or (lead in self.ranges) or ((not self.equals) and (not self.ranges) and (lead == self.sortby))
+
+
+@dcs.dataclass
+class MissingIndex:
+    """An index that no declared index covers, with how often it was needed."""
+    table: Table
+    columns: Columns
+    frequency: int
+    share: float
+
+    def ddl(self, dialect: t.Optional[Dialect] = None, name: t.Optional[str] = None) -> str:
+        """CREATE INDEX statement for this suggestion."""
+        return createindex(self.table, self.columns, name, dialect)
+
+
+@dcs.dataclass
+class UnusedIndex:
+    """A declared index that no recorded query could use."""
+    table: Table
+    name: t.Optional[str]
+    columns: Columns
+
+
+@dcs.dataclass
+class AdvisorReport:
+    """Missing and unused indexes, most frequently needed first."""
+    missing: t.List[MissingIndex] = dcs.field(default_factory=list)
+    unused: t.List[UnusedIndex] = dcs.field(default_factory=list)
+
+
+def createindex(table: Table, columns: t.Sequence[str], name: t.Optional[str] = None, dialect: t.Optional[Dialect] = None) -> str:
+    """Render `CREATE INDEX` DDL for columns of a table."""
+    name = (name or f"ix_{table.name}_{'_'.join(columns)}")
+    index = Index(name, *(table.c[c] for c in columns))
+    try:
+        return str(CreateIndex(index).compile(dialect=dialect)).strip()
+    finally:
+        table.indexes.discard(index) # Index() attaches itself to the table; keep metadata unchanged
+
+
+def tableindexes(table: Table) -> t.List[t.Tuple[t.Optional[str], Columns, bool]]:
+    """Declared indexes of a table as `(name, columns, primary)`; unique columns count as indexed."""
+    indexes: t.List[t.Tuple[t.Optional[str], Columns, bool]] = []
+    if table.primary_key.columns:
+        indexes.append((table.primary_key.name, tuple(c.name for c in table.primary_key.columns), True))
+    for index in table.indexes:
+        indexes.append((index.name, tuple(c.name for c in index.columns), False))
+    for constraint in table.constraints:
+        if isinstance(constraint, UniqueConstraint):
+            indexes.append((constraint.name, tuple(c.name for c in constraint.columns), False))
+    return indexes
+
+
+class IndexAdvisor:
+    """Collects query shapes per model and reports index coverage."""
+
+    def __init__(self) -> None:
+        self._shapes: t.Dict[type, t.Counter[QueryShape]] = collections.defaultdict(collections.Counter)
+        self._names: t.Dict[type, t.Dict[str, str]] = {}
+        self._lock = threading.Lock()
+
+    def shape(self, model: type, *where: Expression, sortby: t.Optional[str] = None, **filters: t.Any) -> QueryShape:
+        """Describe a query by the columns it filters and sorts on."""
+        names = self._names.get(model)
+        if names is None:
+            names = self._names[model] = {attr.key: attr.columns[0].name for attr in inspect(model).column_attrs}
+        group = parsefilters(*where, **filters)
+        equals = {names[f] for f in equalities(group) if f in names}
+        ranges = {names[f] for f in fields(group) if f in names} - equals
+        return QueryShape(tuple(sorted(equals)), tuple(sorted(ranges)), names.get(sortby) if sortby else None)
+
+    def record(self, model: type, *where: Expression, sortby: t.Optional[str] = None, **filters: t.Any) -> None:
+        """Count one query against a model."""
+        shape = self.shape(model, *where, sortby=sortby, **filters)
+        with self._lock:
+            self._shapes[model][shape] += 1
+
+    def shapes(self, model: type) -> t.Dict[QueryShape, int]:
+        """Recorded shapes of a model with their counts."""
+        with self._lock:
+            return dict(self._shapes.get(model, {}))
+
+    def clear(self) -> None:
+        """Forget all recorded shapes."""
+        with self._lock:
+            self._shapes.clear()
+
+    def report(self) -> AdvisorReport:
+        """Compare recorded shapes with declared indexes."""
+        with self._lock:
+            recorded = {model: dict(counter) for model, counter in self._shapes.items()}
+
+        report = AdvisorReport()
+        for model, shapes in recorded.items():
+            table = inspect(model).local_table
+            indexes = tableindexes(table)
+            total = sum(shapes.values())
+            used: t.Set[Columns] = set()
+            missing: t.Counter[Columns] = collections.Counter()
+            for shape, count in shapes.items():
+                if not shape.columns:
+                    continue
+                usable = [cols for _, cols, _ in indexes if shape.usable(cols)]
+                used.update(usable)
+                if not usable:
+                    missing[shape.columns] += count
+            report.missing.extend(
+                MissingIndex(table, columns, count, (count / total))
+                for columns, count in missing.items()
+            )
+            report.unused.extend(
+                UnusedIndex(table, name, cols)
+                for name, cols, primary in indexes
+                if (not primary) and (cols not in used)
+            )
+        report.missing.sort(key=lambda m: m.frequency, reverse=True)
+        return report
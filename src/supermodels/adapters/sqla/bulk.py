@@ -0,0 +1,120 @@
+# ~/supermodels/src/supermodels/adapters/sqla/bulk.py
+"""
+SQLAlchemy Resilient Bulk Writes
+
+Chunked bulk writes isolated in savepoints. A failing chunk is bisected
+until the offending rows are found, so one bad row costs a handful of
+extra round trips instead of a row-by-row retry of the whole batch.
+
+Plain bulk writes consume any iterable in chunks, flushing (or committing)
+each chunk so multi-million-row jobs run in bounded memory. Typed columns
+of each chunk are converted with one batch converter call per column.
+"""
+from __future__ import annotations
+import typing as t, dataclasses as dcs
+
+from sqlalchemy.orm import Session
+
+from supermodels.core.enums import CommitPolicy
+from supermodels.core.utils.chunks import chunked
+from supermodels.adapters.sqla.typer import batchencoded
+
+
+@dcs.dataclass(frozen=True)
+class BulkFailure:
+    """A single item rejected by the database during a resilient bulk write."""
+    index: int
+    item: t.Any
+    error: BaseException
+
+
+@dcs.dataclass
+class BulkReport:
+    """Outcome of a resilient bulk write.
+
+    Attributes:
+        written: Items (or merged instances) committed to the database
+        failures: Per-row failures in input order
+    """
+    written: t.List[t.Any] = dcs.field(default_factory=list)
+    failures: t.List[BulkFailure] = dcs.field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """Whether every item was written."""
+        return not self.failures
+
+
+def savepointwrite(
+    session: Session,
+    items: t.Sequence[t.Any],
+    apply: t.Callable[[Session, t.Any], t.Any],
+    chunksize: int = 1000
+) -> BulkReport:
+    """Write items in savepoint-isolated chunks, bisecting chunks that fail.
+
+    `apply` stages one item on the session (e.g. `Session.add`) and returns
+    the instance to report as written. Good rows are committed once at the
+    end; rejected rows are returned in the report with their errors.
+    """
+    if chunksize < 1:
+        raise ValueError(f"Bulk chunksize must be positive, got {chunksize}")
+
+    report = BulkReport()
+    pending: t.List[t.Tuple[int, int]] = [
+        (start, min(start + chunksize, len(items)))
+        for start in range(0, len(items), chunksize)
+    ]
+    pending.reverse()
+
+    while pending:
+        start, stop = pending.pop()
+        try:
+            with session.begin_nested(), batchencoded(items[start:stop]):
+                written = [apply(session, items[i]) for i in range(start, stop)]
+        except Exception as e:
+            if (stop - start) == 1:
+                report.failures.append(BulkFailure(start, items[start], e))
+                continue
+            mid = ((start + stop) // 2)
+            pending.append((mid, stop))
+            pending.append((start, mid))
+            continue
+        report.written.extend(written)
+
+    session.commit()
+    return report
+
+
+def chunkedwrite(
+    session: Session,
+    items: t.Iterable[t.Any],
+    apply: t.Callable[[Session, t.Any], t.Any],
+    chunksize: t.Optional[int] = None,
+    commit: CommitPolicy = CommitPolicy.ONCE,
+    collect: bool = True
+) -> t.Union[t.List[t.Any], int]:
+    """Stage items chunk by chunk, flushing (ONCE) or committing (PERCHUNK) each chunk.
+
+    Returns the written items, or only their count when `collect` is False so
+    nothing outlives its chunk. On failure the open transaction is rolled
+    back; with PERCHUNK, chunks already committed are kept.
+    """
+    written: t.List[t.Any] = []
+    count = 0
+    try:
+        for chunk in chunked(items, chunksize):
+            with batchencoded(chunk):
+                results = [apply(session, item) for item in chunk]
+                if commit is CommitPolicy.PERCHUNK:
+                    session.commit()
+                else:
+                    session.flush()
+            count += len(results)
+            if collect:
+                written.extend(results)
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    return (written if collect else count)
@@ -25,5 +25,31 @@ class OrderBy(str, enum.Enum):
                 # unreachable
                 raise ValueError(f"Invalid OrderBy value: {self.value}")
 
+    def order(self, column: t.Any, nullsfirst: t.Optional[bool] = None) -> t.Tuple[t.Any, ...]:
+        """Get the ordering clauses for a column.
+
+        NULLs are placed where the dialect puts them unless `nullsfirst` is
+        given; an explicit placement is emulated with a leading
+        `CASE WHEN column IS NULL` key, which every dialect accepts (unlike
+        `NULLS FIRST`/`NULLS LAST`) but a plain index cannot serve.
+        """
+        clause = self.func(column)
+        if nullsfirst is None:
+            return (clause,)
+        from sqlalchemy import case
+        return (case((column.is_(None), (0 if nullsfirst else 1)), else_=(1 if nullsfirst else 0)), clause)
+
+    def nullsfirst(self, dialect: str) -> t.Optional[bool]:
+        """Whether the named dialect orders NULLs first in this direction by default (None if unknown)."""
+        if dialect in NULLSLOW:
+            return (self is OrderBy.ASC)
+        if dialect in NULLSHIGH:
+            return (self is OrderBy.DESC)
+        return None
+
+# dialects sorting NULLs below every value, and above every value, by default
+NULLSLOW = frozenset({'sqlite', 'mysql', 'mariadb', 'mssql'})
+NULLSHIGH = frozenset({'postgresql', 'oracle'})
+
 ASC = OrderBy.ASC
 DESC = OrderBy.DESC
@@ -0,0 +1,53 @@
+# ~/supermodels/src/supermodels/adapters/sqla/filters.py
+"""
+SQLAlchemy Filter Compiler
+
+Compiles supermodels filter expressions into SQLAlchemy WHERE clauses so
+filtering runs inside the database and can use its indexes.
+"""
+from __future__ import annotations
+import typing as t
+
+from sqlalchemy import and_, or_, inspect
+from sqlalchemy.sql.elements import ColumnElement
+
+from supermodels.core.filters import Expression, Condition, Group, parsefilters
+
+Compilers: t.Dict[str, t.Callable[[t.Any, t.Any], ColumnElement]] = {
+    'eq': lambda col, v: (col == v),
+    'ne': lambda col, v: (col != v),
+    'lt': lambda col, v: (col < v),
+    'lte': lambda col, v: (col <= v),
+    'gt': lambda col, v: (col > v),
+    'gte': lambda col, v: (col >= v),
+    'in': lambda col, v: col.in_(list(v)),
+    'notin': lambda col, v: col.not_in(list(v)),
+    'startswith': lambda col, v: col.startswith(v, autoescape=True),
+    'endswith': lambda col, v: col.endswith(v, autoescape=True),
+    'contains': lambda col, v: col.contains(v, autoescape=True),
+    'isnull': lambda col, v: (col.is_(None) if v else col.is_not(None)),
+}
+
+
+def column(model: t.Type[t.Any], field: str) -> t.Any:
+    """Get the mapped column attribute for a field, rejecting unknown fields."""
+    attrs = inspect(model).all_orm_descriptors
+    if field not in attrs:
+        raise ValueError(f"Cannot filter on unknown field '{field}' of model '{model.__name__}'")
+    return getattr(model, field)
+
+
+def compileexpr(model: t.Type[t.Any], expr: Expression) -> ColumnElement:
+    """Compile a filter expression into a SQLAlchemy boolean clause."""
+    if isinstance(expr, Condition):
+        return Compilers[expr.op](column(model, expr.field), expr.value)
+    if not expr.children:
+        raise ValueError(f"Cannot compile empty {expr.conjunction.upper()} group")
+    clauses = [compileexpr(model, child) for child in expr.children]
+    return (and_(*clauses) if expr.conjunction == 'and' else or_(*clauses))
+
+
+def compilefilters(model: t.Type[t.Any], *where: Expression, **filters: t.Any) -> t.List[ColumnElement]:
+    """Compile positional expressions and keyword filters into WHERE criteria."""
+    group = parsefilters(*where, **filters)
+    return [compileexpr(model, child) for child in group.children]
@@ -0,0 +1,250 @@
+# ~/supermodels/src/supermodels/adapters/sqla/pages.py
+"""
+SQLAlchemy Page Iteration
+
+Iterates a query page by page while a background thread, on its own
+session, fetches the next pages into a bounded queue. The consumer works on
+page N while page N+1 is in flight; stopping early (break, close, garbage
+collection) stops the worker and closes its session. Typed columns of a
+page are decoded with one batch converter call per column.
+
+Because the worker reads on its own session (and connection), pages only
+contain rows committed when each page is fetched; rows the caller added or
+changed without committing are not seen.
+"""
+from __future__ import annotations
+import queue, threading, typing as t
+
+from sqlalchemy import and_, or_, inspect
+from sqlalchemy.orm import Session
+
+from supermodels.core.filters import Expression
+from supermodels.adapters.sqla.enums import OrderBy, ASC
+from supermodels.adapters.sqla.filters import compilefilters, compileexpr, column
+from supermodels.adapters.sqla.typer import batchdecoded, decodeloaded
+
+# fetches one page given the cursor from the previous one: (items, next cursor or None when done)
+PageFetch = t.Callable[[Session, t.Any], t.Tuple[t.List[t.Any], t.Any]]
+
+_DONE = object()
+
+
+class _Failure:
+    """Exception raised by the worker, re-raised in the consumer."""
+    __slots__ = ('error',)
+
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+def _put(pages: queue.Queue, stop: threading.Event, value: t.Any, poll: float) -> bool:
+    """Queue a value, giving up if the consumer stopped; returns whether it was queued."""
+    while not stop.is_set():
+        try:
+            pages.put(value, timeout=poll)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _produce(sessionfactory: t.Callable[[], Session], fetch: PageFetch, pages: queue.Queue, stop: threading.Event, poll: float) -> None:
+    """Worker loop: fetch pages on an own session until done, stopped or failed."""
+    session = sessionfactory()
+    try:
+        cursor = None
+        while not stop.is_set():
+            items, cursor = fetch(session, cursor)
+            session.expunge_all()
+            if items and not _put(pages, stop, items, poll):
+                return
+            if (cursor is None) or (not items):
+                break
+        _put(pages, stop, _DONE, poll)
+    except BaseException as e:
+        _put(pages, stop, _Failure(e), poll)
+    finally:
+        session.close()
+
+
+class PageIterator:
+    """Iterator over pages fetched ahead by a worker thread.
+
+    At most `prefetch` pages wait in the queue, bounding memory. Pages are
+    lists of instances loaded by the worker's session and merged, without
+    reloading, into `session` (the caller's session) when given. Unlike
+    `querypage`, which reads on the caller's session, pages do not include
+    the caller's uncommitted changes, and an instance already in `session`
+    is overwritten with the committed state the worker read.
+    """
+
+    def __init__(
+        self,
+        sessionfactory: t.Callable[[], Session],
+        fetch: PageFetch,
+        session: t.Optional[Session] = None,
+        prefetch: int = 1,
+        poll: float = 0.1
+    ) -> None:
+        """Start the worker fetching pages with `fetch` on a session from `sessionfactory`."""
+        if prefetch < 1:
+            raise ValueError(f"Page prefetch must be positive, got {prefetch}")
+        self.session = session
+        self.pages = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=prefetch)
+        self._stop = threading.Event()
+        self._finished = False
+        # the worker holds no reference to the iterator, so an abandoned iterator is collected and stops it
+        self._worker = threading.Thread(
+            target=_produce, args=(sessionfactory, fetch, self._queue, self._stop, poll),
+            name='supermodels-pages', daemon=True
+        )
+        self._worker.start()
+
+    def __iter__(self) -> 'PageIterator':
+        return self
+
+    def __next__(self) -> t.List[t.Any]:
+        if self._finished:
+            raise StopIteration
+        value = self._queue.get()
+        if (value is _DONE) or isinstance(value, _Failure):
+            self.close()
+            if isinstance(value, _Failure):
+                raise value.error
+            raise StopIteration
+        self.pages += 1
+        if self.session is not None:
+            merge = self.session.merge
+            return [merge(item, load=False) for item in value]
+        return value
+
+    def close(self) -> None:
+        """Stop the worker, discard prefetched pages and wait for it to exit."""
+        self._finished = True
+        self._stop.set()
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        if self._worker is not threading.current_thread():
+            self._worker.join()
+
+    def __enter__(self) -> 'PageIterator':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        if not getattr(self, '_finished', True): # partially initialized if __init__ raised
+            self._stop.set()
+
+
+def _primarykey(model: t.Type[t.Any]) -> t.Tuple[t.Any, t.Any]:
+    """The model's first primary key column and its mapped attribute."""
+    pk = inspect(model).primary_key[0]
+    return pk, getattr(model, inspect(model).get_property_by_column(pk).key)
+
+
+def offsetfetch(
+    model: t.Type[t.Any],
+    criteria: t.List[t.Any],
+    hits: int,
+    sortby: str,
+    orderby: OrderBy,
+    nullsfirst: t.Optional[bool] = None
+) -> PageFetch:
+    """Page by LIMIT/OFFSET; the cursor is the next offset.
+
+    Rows are ordered by `sortby` then the primary key, so ties on `sortby`
+    keep the same order on every page.
+    """
+    sortcol = column(model, sortby)
+    pk, pkcol = _primarykey(model)
+    order = [*orderby.order(sortcol, nullsfirst)] + ([] if (sortcol.property.columns[0] is pk) else [orderby.func(pkcol)])
+    def fetch(session: Session, offset: t.Any) -> t.Tuple[t.List[t.Any], t.Any]:
+        offset = (offset or 0)
+        with batchdecoded():
+            items = session.query(model).filter(*criteria).order_by(*order).offset(offset).limit(hits).all()
+        decodeloaded(items)
+        return items, ((offset + hits) if (len(items) == hits) else None)
+    return fetch
+
+
+def keysetfetch(
+    model: t.Type[t.Any],
+    criteria: t.List[t.Any],
+    hits: int,
+    sortby: str,
+    orderby: OrderBy,
+    nullsfirst: t.Optional[bool] = None
+) -> PageFetch:
+    """Page by seeking past the last row's `(sortby, primary key)`; the cursor is that pair.
+
+    Unlike OFFSET, each page costs the same however deep the walk goes when
+    `sortby` is indexed. NULLs in a nullable `sortby` are seeked past by
+    primary key, where the dialect orders them unless `nullsfirst` is given;
+    dialects whose default is unknown get an explicit placement (first
+    ascending, last descending).
+    """
+    sortcol = column(model, sortby)
+    pk, pkcol = _primarykey(model)
+    unique = (sortcol.property.columns[0] is pk)
+    nullable = ((not unique) and sortcol.property.columns[0].nullable)
+    after = ((lambda c, v: c > v) if (orderby is ASC) else (lambda c, v: c < v))
+    tiebreak = ([] if unique else [orderby.func(pkcol)])
+
+    def placement(session: Session) -> t.Tuple[bool, t.Optional[bool]]:
+        """Where NULLs come in the walk, and the placement to request explicitly (None for the default)."""
+        if (not nullable) or (nullsfirst is not None):
+            return bool(nullsfirst), nullsfirst
+        default = orderby.nullsfirst(session.get_bind().dialect.name)
+        if default is None:
+            return (orderby is ASC), (orderby is ASC)
+        return default, None
+
+    def seek(value: t.Any, key: t.Any, first: bool) -> t.Any:
+        """Criterion for rows after `(value, key)` in the walk order."""
+        if unique:
+            return after(sortcol, value)
+        if value is None: # within the NULL rows, then (if they come first) on to the values
+            clause = and_(sortcol.is_(None), after(pkcol, key))
+            return (or_(clause, sortcol.is_not(None)) if first else clause)
+        clause = or_(after(sortcol, value), and_(sortcol == value, after(pkcol, key)))
+        return (or_(clause, sortcol.is_(None)) if (nullable and not first) else clause)
+
+    def fetch(session: Session, cursor: t.Any) -> t.Tuple[t.List[t.Any], t.Any]:
+        first, explicit = placement(session)
+        query = session.query(model).filter(*criteria)
+        if cursor is not None:
+            query = query.filter(seek(*cursor, first))
+        with batchdecoded():
+            items = query.order_by(*orderby.order(sortcol, explicit), *tiebreak).limit(hits).all()
+        decodeloaded(items)
+        if len(items) < hits:
+            return items, None
+        last = items[-1]
+        return items, (getattr(last, sortby), getattr(last, pkcol.key))
+    return fetch
+
+
+def pagefetch(
+    model: t.Type[t.Any],
+    hits: int,
+    sortby: str,
+    orderby: OrderBy,
+    where: t.Optional[Expression],
+    keyset: bool,
+    filters: t.Dict[str, t.Any],
+    nullsfirst: t.Optional[bool] = None
+) -> PageFetch:
+    """Build the page fetcher for a query."""
+    if hits < 1:
+        raise ValueError(f"Page size must be positive, got {hits}")
+    criteria = compilefilters(model, **filters)
+    if where is not None:
+        criteria.append(compileexpr(model, where))
+    build = (keysetfetch if keyset else offsetfetch)
+    return build(model, criteria, hits, sortby, orderby, nullsfirst)
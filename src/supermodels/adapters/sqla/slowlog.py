@@ -0,0 +1,289 @@
+# ~/supermodels/src/supermodels/adapters/sqla/slowlog.py
+"""
+SQLAlchemy Slow-Operation Log
+
+Opt-in log of adapter operations slower than a threshold. Each entry keeps
+the compiled SQL of the first statements the operation executed (later
+ones are only counted), the shapes (not values) of their bound parameters,
+the row count, the calling manager and model, and the
+query plan captured by re-running the SELECTs under EXPLAIN on a separate
+connection. Entries are rate limited and plans are captured on a background
+thread, so the log cannot itself become a load problem.
+"""
+from __future__ import annotations
+import sys, time, logging, threading, functools, collections, contextlib, typing as t, dataclasses as dcs
+import collections.abc as cabc
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import event
+
+if t.TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# dialect name -> statement prefix producing the query plan
+EXPLAINS: t.Dict[str, str] = {
+    'sqlite': 'EXPLAIN QUERY PLAN ',
+    'postgresql': 'EXPLAIN ',
+    'mysql': 'EXPLAIN ',
+    'mariadb': 'EXPLAIN ',
+}
+
+
+@dcs.dataclass(frozen=True)
+class SlowLogConfig:
+    """Configuration for a slow-operation log.
+
+    Attributes:
+        threshold: Seconds after which an operation is recorded
+        explain: Whether to capture query plans for recorded SELECTs
+        capacity: Number of most recent entries kept
+        rate: Maximum entries recorded per `period` (further ones are counted as dropped)
+        period: Rate limiting window in seconds
+        statements: Statements captured per operation; later ones are only counted
+    """
+    threshold: float = 0.5
+    explain: bool = True
+    capacity: int = 100
+    rate: int = 10
+    period: float = 60.0
+    statements: int = 20
+
+
+@dcs.dataclass
+class SlowStatement:
+    """One SQL statement executed by a slow operation."""
+    sql: str
+    params: t.Any
+    plan: t.Optional[t.List[str]] = None
+
+
+@dcs.dataclass
+class SlowOperation:
+    """A recorded slow adapter operation."""
+    operation: str
+    model: t.Optional[str]
+    manager: t.Optional[str]
+    duration: float
+    rows: t.Optional[int]
+    statements: t.List[SlowStatement]
+    at: float
+    skipped: int = 0 # statements executed beyond the captured ones
+
+
+def paramshape(params: t.Any) -> t.Any:
+    """Describe bound parameters by type (and length for sequences), never by value."""
+    if isinstance(params, dict):
+        return {k: paramshape(v) for k, v in params.items()}
+    if isinstance(params, (list, tuple)):
+        return [paramshape(v) for v in params]
+    if isinstance(params, (str, bytes)):
+        return f"{type(params).__name__}[{len(params)}]"
+    return type(params).__name__
+
+
+def manyshape(params: t.Any) -> t.Any:
+    """Describe executemany parameters captured as `(first rows, row count)`."""
+    if isinstance(params, tuple) and (len(params) == 2) and isinstance(params[1], int):
+        first, count = params
+        return {'rows': count, 'first': (paramshape(first[0]) if first else None)}
+    return paramshape(params)
+
+
+def rowcount(result: t.Any) -> t.Optional[int]:
+    """Number of rows an adapter operation returned, where meaningful."""
+    if result is None:
+        return 0
+    if isinstance(result, bool):
+        return None
+    if isinstance(result, int): # bulk operations called with collect=False
+        return result
+    if isinstance(result, list):
+        return len(result)
+    if isinstance(result, tuple) and (len(result) == 2) and isinstance(result[0], list):
+        return len(result[0])
+    if hasattr(result, 'written'):
+        return len(result.written)
+    return 1
+
+
+def callingmanager() -> t.Optional[str]:
+    """Name of the nearest BaseManager on the call stack, if any."""
+    from supermodels.core.bases.manager import BaseManager
+    frame = sys._getframe(1)
+    while frame is not None:
+        caller = frame.f_locals.get('self')
+        if isinstance(caller, BaseManager):
+            return type(caller).__name__
+        frame = frame.f_back
+    return None
+
+
+class _Observation:
+    """Statements captured (up to a limit, the rest counted) and result seen during one observed operation."""
+    __slots__ = ('statements', 'skipped', 'limit', 'result')
+
+    def __init__(self, limit: int) -> None:
+        self.statements: t.List[t.Tuple[str, t.Any, bool]] = []
+        self.skipped = 0
+        self.limit = limit
+        self.result: t.Any = None
+
+    def add(self, statement: t.Tuple[str, t.Any, bool]) -> None:
+        """Capture a statement, or only count it once the limit is reached.
+
+        Of an executemany parameter list only the first row and the row count are kept.
+        """
+        if len(self.statements) >= self.limit:
+            self.skipped += 1
+            return
+        sql, params, many = statement
+        if many and isinstance(params, (list, tuple)):
+            params = (params[:1], len(params))
+        self.statements.append((sql, params, many))
+
+    def merge(self, inner: '_Observation') -> None:
+        """Take over the statements of a nested observation."""
+        for statement in inner.statements:
+            self.add(statement)
+        self.skipped += inner.skipped
+
+
+class SlowLog:
+    """Records adapter operations exceeding a duration threshold."""
+
+    def __init__(self, engine: Engine, config: t.Optional[SlowLogConfig] = None) -> None:
+        """Initialize log and start capturing statements executed on the engine."""
+        self.engine = engine
+        self.config = (config or SlowLogConfig())
+        self.dropped = 0
+        self._entries: t.Deque[SlowOperation] = collections.deque(maxlen=self.config.capacity)
+        self._admitted: t.Deque[float] = collections.deque()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._explainer: t.Optional[ThreadPoolExecutor] = None
+        event.listen(engine, 'before_cursor_execute', self._capture)
+
+    @property
+    def entries(self) -> t.List[SlowOperation]:
+        """Recorded entries, oldest first."""
+        with self._lock:
+            return list(self._entries)
+
+    def close(self) -> None:
+        """Stop capturing statements and wait for pending plan captures."""
+        if event.contains(self.engine, 'before_cursor_execute', self._capture):
+            event.remove(self.engine, 'before_cursor_execute', self._capture)
+        with self._lock:
+            explainer, self._explainer = self._explainer, None
+        if explainer is not None:
+            explainer.shutdown(wait=True)
+
+    def wait(self) -> None:
+        """Block until queued plan captures have finished."""
+        with self._lock:
+            explainer = self._explainer
+        if explainer is None:
+            return
+        try:
+            explainer.submit(lambda: None).result()
+        except RuntimeError:
+            pass # closed meanwhile; close() already waited for queued captures
+
+    def _capture(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        observation = getattr(self._local, 'observation', None)
+        if observation is not None:
+            observation.add((statement, parameters, executemany))
+
+    @contextlib.contextmanager
+    def observe(self, operation: str, target: t.Any = None) -> t.Iterator[_Observation]:
+        """Time an operation, recording it if it exceeds the threshold."""
+        outer = getattr(self._local, 'observation', None)
+        observation = self._local.observation = _Observation(self.config.statements)
+        started = time.perf_counter()
+        try:
+            yield observation
+        finally:
+            duration = (time.perf_counter() - started)
+            self._local.observation = outer
+            if outer is not None:
+                outer.merge(observation)
+            if duration >= self.config.threshold:
+                self._record(operation, target, duration, observation)
+
+    def _admit(self) -> bool:
+        """Sliding-window rate limit on recorded entries."""
+        now = time.monotonic()
+        with self._lock:
+            while self._admitted and ((now - self._admitted[0]) > self.config.period):
+                self._admitted.popleft()
+            if len(self._admitted) >= self.config.rate:
+                self.dropped += 1
+                return False
+            self._admitted.append(now)
+            return True
+
+    def _record(self, operation: str, target: t.Any, duration: float, observation: _Observation) -> None:
+        if not self._admit():
+            return
+        if isinstance(target, (cabc.Iterator, list, tuple)):
+            target = None # bulk call given one iterable of items
+        model = (target if isinstance(target, type) else (type(target) if target is not None else None))
+        entry = SlowOperation(
+            operation=operation,
+            model=(model.__name__ if model is not None else None),
+            manager=callingmanager(),
+            duration=duration,
+            rows=rowcount(observation.result),
+            statements=[SlowStatement(sql, (manyshape(params) if many else paramshape(params))) for sql, params, many in observation.statements],
+            at=time.time(),
+            skipped=observation.skipped,
+        )
+        with self._lock:
+            self._entries.append(entry)
+
+        explainable = [
+            (stmt, params) for stmt, (sql, params, many) in zip(entry.statements, observation.statements)
+            if (not many) and sql.lstrip().upper().startswith('SELECT')
+        ]
+        prefix = EXPLAINS.get(self.engine.dialect.name)
+        if self.config.explain and explainable and (prefix is not None):
+            with self._lock:
+                if self._explainer is None:
+                    self._explainer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='supermodels-explain')
+                self._explainer.submit(self._explain, entry, explainable, prefix)
+        else:
+            self._emit(entry)
+
+    def _explain(self, entry: SlowOperation, explainable: t.List[t.Tuple[SlowStatement, t.Any]], prefix: str) -> None:
+        """Capture plans on a separate connection, then emit the entry."""
+        try:
+            with self.engine.connect() as conn:
+                for stmt, params in explainable:
+                    rows = conn.exec_driver_sql(prefix + stmt.sql, params).fetchall()
+                    stmt.plan = [' | '.join(str(col) for col in row) for row in rows]
+        except Exception as e:
+            logger.debug("Failed to capture plan for slow %s: %s", entry.operation, e)
+        self._emit(entry)
+
+    def _emit(self, entry: SlowOperation) -> None:
+        logger.warning(
+            "Slow %s on %s via %s: %.3fs, %s rows, %d statements%s",
+            entry.operation, entry.model, entry.manager, entry.duration, entry.rows, len(entry.statements) + entry.skipped,
+            ''.join(f"\n  {s.sql} {s.params}" + ''.join(f"\n    {p}" for p in (s.plan or ())) for s in entry.statements)
+        )
+
+
+def observed(method: t.Callable) -> t.Callable:
+    """Decorate an adapter operation `(self, session, target, ...)` for the slow log."""
+    name = method.__name__
+    @functools.wraps(method)
+    def wrapper(self, session, *args, **kwargs):
+        slowlog = self.slowlog
+        if slowlog is None:
+            return method(self, session, *args, **kwargs)
+        with slowlog.observe(name, (args[0] if args else None)) as observation:
+            observation.result = method(self, session, *args, **kwargs)
+            return observation.result
+    return wrapper
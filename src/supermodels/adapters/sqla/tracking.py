@@ -0,0 +1,205 @@
+# ~/supermodels/src/supermodels/adapters/sqla/tracking.py
+"""
+Typed Column Change Tracking
+
+Snapshot-based change tracking for tracked SQLATypeAdapter columns. Tracked
+values load as LazyValue proxies, so a value that was never read is known
+to be unchanged and costs nothing. A read value is fingerprinted (a digest
+of its stored form) when a flush needs it and compared with the digest of
+the raw value it was loaded from, so in-place mutations of nested
+dataclasses or pydantic models are flagged dirty, and assignments of a value
+equal to what was loaded are dropped from the UPDATE.
+
+Load and refresh listeners are attached only to mappers that have tracked
+columns, and the session listeners only once such a mapper exists. Each
+session remembers the instances it loaded with tracked columns and
+reconciles just those once per flush. A commit with nothing pending
+reconciles them itself, because `flush()` returns early on a session with no
+known changes, so mutations alone would not be written. After a flush the
+snapshot reuses the digests computed while binding and reconciling instead
+of serializing again.
+"""
+from __future__ import annotations
+import weakref, contextvars, typing as t
+
+from sqlalchemy import event
+from sqlalchemy.orm import Mapper, Session, InstanceState
+from sqlalchemy.orm.attributes import flag_modified, set_committed_value
+
+from supermodels.converters.lazy import LazyValue
+
+if t.TYPE_CHECKING:
+    from supermodels.adapters.sqla.typer import SQLATypeAdapter
+
+TrackedColumns = t.Tuple[t.Tuple[str, 'SQLATypeAdapter'], ...]
+# value -> digest of its stored form, by id of the value (which is kept alive alongside)
+Digests = t.Dict[int, t.Tuple[t.Any, bytes]]
+
+INFOKEY = 'supermodels.fingerprints'
+STATESKEY = 'supermodels.trackedstates'
+FLUSHKEY = 'supermodels.tracked'
+CHECKEDKEY = 'supermodels.checked'
+RECONCILEDKEY = 'supermodels.reconciled'
+
+_columns: t.Dict[Mapper, TrackedColumns] = {}
+
+# digests of tracked values bound during the current flush, recorded by SQLATypeAdapter
+bound: contextvars.ContextVar[t.Optional[Digests]] = contextvars.ContextVar('supermodels.bound', default=None)
+# stored forms of changed values found by `_reconcile`, reused when the flush binds them
+prepared: contextvars.ContextVar[t.Optional[t.Dict[int, t.Tuple[t.Any, t.Any]]]] = contextvars.ContextVar('supermodels.prepared', default=None)
+
+
+def trackedcolumns(mapper: Mapper) -> TrackedColumns:
+    """Get (cached per mapper) the attribute keys and types of tracked columns."""
+    columns = _columns.get(mapper)
+    if columns is None:
+        from supermodels.adapters.sqla.typer import SQLATypeAdapter
+        columns = _columns[mapper] = tuple(
+            (prop.key, prop.columns[0].type)
+            for prop in mapper.column_attrs
+            if isinstance(prop.columns[0].type, SQLATypeAdapter) and prop.columns[0].type.tracked
+        )
+    return columns
+
+
+def trackedstates(session: Session) -> t.MutableSet[InstanceState]:
+    """Get the instances with tracked columns a session has snapshotted."""
+    states = session.info.get(STATESKEY)
+    if states is None:
+        states = session.info[STATESKEY] = weakref.WeakSet()
+    return states
+
+
+def snapshot(
+    state: InstanceState,
+    keys: t.Optional[t.Iterable[str]] = None,
+    session: t.Optional[Session] = None,
+    digests: t.Optional[Digests] = None
+) -> None:
+    """Record the loaded (or just written) tracked values of an instance.
+
+    Unread lazy values are kept as they are and digested from their raw value
+    only once a flush finds them read or replaced. Other values use a digest
+    from `digests` when it has one for the value, and are fingerprinted
+    otherwise.
+    """
+    columns = trackedcolumns(state.mapper)
+    if not columns:
+        return
+    prints = state.info.setdefault(INFOKEY, {})
+    for key, coltype in columns:
+        if ((keys is None) or (key in keys)) and (key in state.dict):
+            value = state.dict[key]
+            if (type(value) is LazyValue) and (not value.decoded):
+                prints[key] = value
+                continue
+            known = (digests or {}).get(id(value))
+            prints[key] = (known[1] if ((known is not None) and (known[0] is value)) else coltype.fingerprint(value))
+    session = (session or state.session)
+    if session is not None:
+        trackedstates(session).add(state)
+
+
+def detectchanges(state: InstanceState) -> t.List[str]:
+    """Reconcile tracked columns of an instance with their snapshots.
+
+    Mutated values are flagged modified; assigned values whose stored form
+    equals the snapshot have their pending change discarded. Returns the keys
+    of tracked columns that will be written.
+    """
+    prints = state.info.get(INFOKEY)
+    if not prints:
+        return []
+    changed = []
+    checked: Digests = {}
+    state.info[CHECKEDKEY] = checked
+    for key, coltype in trackedcolumns(state.mapper):
+        if (key not in prints) or (key not in state.dict):
+            continue
+        value, loaded = state.dict[key], prints[key]
+        if type(loaded) is LazyValue:
+            if (value is loaded) and (not loaded.decoded):
+                continue # never read, so neither mutated nor replaced
+            loaded = prints[key] = coltype.digest(loaded.raw)
+        stored = coltype.store(value)
+        current = (coltype.digest(stored) if stored is not None else None)
+        checked[id(value)] = (value, current)
+        pending = state.attrs[key].history.has_changes()
+        if current == loaded:
+            if pending:
+                set_committed_value(state.obj(), key, value)
+        else:
+            if not pending:
+                flag_modified(state.obj(), key)
+            stash = prepared.get()
+            if stash is not None:
+                stash[id(value)] = (value, stored)
+            changed.append(key)
+    return changed
+
+
+@event.listens_for(Mapper, 'mapper_configured')
+def _onconfigured(mapper: Mapper, cls: type) -> None:
+    if not trackedcolumns(mapper):
+        return
+    event.listen(mapper, 'load', _onload)
+    event.listen(mapper, 'refresh', _onrefresh)
+    if not event.contains(Session, 'before_flush', _beforeflush):
+        event.listen(Session, 'before_flush', _beforeflush)
+        event.listen(Session, 'before_commit', _beforecommit)
+        event.listen(Session, 'after_flush_postexec', _afterflush)
+
+
+def _onload(target: t.Any, context: t.Any) -> None:
+    # merge(load=False) loads without a query context
+    snapshot(t.cast(InstanceState, target._sa_instance_state), session=(context.session if context is not None else None))
+
+
+def _onrefresh(target: t.Any, context: t.Any, attrs: t.Optional[t.Iterable[str]]) -> None:
+    snapshot(t.cast(InstanceState, target._sa_instance_state), (set(attrs) if attrs else None), context.session)
+
+
+def _reconcile(session: Session) -> t.List[InstanceState]:
+    """Run change detection on the session's tracked instances, returning those with pending writes."""
+    states = session.info.get(STATESKEY)
+    if not states:
+        return []
+    pending = []
+    prepared.set({})
+    for state in list(states):
+        if state.session is not session: # expunged, deleted or merged elsewhere
+            states.discard(state)
+        elif detectchanges(state) or state.modified:
+            pending.append(state)
+    return pending
+
+
+def _beforeflush(session: Session, context: t.Any, instances: t.Any) -> None:
+    # a commit with nothing else pending has already reconciled
+    flushed = session.info.pop(RECONCILEDKEY, None)
+    if flushed is None:
+        flushed = _reconcile(session)
+    for obj in session.new:
+        state = t.cast(InstanceState, obj._sa_instance_state)
+        if trackedcolumns(state.mapper):
+            flushed.append(state)
+    session.info[FLUSHKEY] = flushed
+    bound.set({})
+
+
+def _beforecommit(session: Session) -> None:
+    # with changes pending, the commit's flush reconciles; otherwise flush()
+    # would skip the session, so in-place mutations are flagged here
+    if session.new or session.dirty or session.deleted:
+        return
+    flushed = _reconcile(session)
+    if flushed:
+        session.info[RECONCILEDKEY] = flushed
+
+
+def _afterflush(session: Session, context: t.Any) -> None:
+    digests = (bound.get() or {})
+    bound.set(None)
+    prepared.set(None)
+    for state in session.info.pop(FLUSHKEY, ()):
+        snapshot(state, session=session, digests={**state.info.pop(CHECKEDKEY, {}), **digests})
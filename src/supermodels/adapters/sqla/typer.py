@@ -3,11 +3,24 @@
 ...
 """
 from __future__ import annotations
-import typing as t
+import json, hashlib, contextlib, contextvars, typing as t
 
-from sqlalchemy.types import TypeDecorator, JSON
+from sqlalchemy import inspect
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.types import TypeDecorator, JSON, LargeBinary
 
 from supermodels.converters.base import BaseConverter, ConversionTarget, ConversionOptions
+from supermodels.converters.codecs import Codec
+from supermodels.converters.lazy import LazyValue
+from supermodels.adapters.sqla import tracking # registers change-tracking events
+
+# stored forms computed by `batchencoded`, keyed by (id of converter, id of value); the
+# converter identifies the column, as dialects bind with copies of the column type
+_encoded: contextvars.ContextVar[t.Optional[t.Dict[t.Tuple[int, int], t.Tuple[t.Any, t.Any]]]] = contextvars.ContextVar(
+    'supermodels.encoded', default=None
+)
+# set by `batchdecoded`: loaded values are left undecoded for `decodeloaded`
+_deferring: contextvars.ContextVar[bool] = contextvars.ContextVar('supermodels.deferring', default=False)
 
 class SQLATypeAdapter(TypeDecorator):
     """
@@ -20,28 +33,118 @@ class SQLATypeAdapter(TypeDecorator):
         self,
         converter: t.Type[BaseConverter],
         targeting: ConversionTarget,
+        codec: t.Optional[Codec] = None,
+        lazy: bool = False,
+        tracked: bool = False,
         **options: ConversionOptions
     ) -> None:
-        """..."""
+        """...
+
+        With a `codec` (e.g. `BinaryCodec(compress=4096)` or `JSONCodec()`),
+        values are stored as encoded bytes in a LargeBinary column instead of
+        going through the dialect's JSON serializer.
+
+        With `lazy=True`, loaded values are LazyValue proxies that decode on
+        first use; proxies never used are written back as their raw value.
+
+        With `tracked=True`, in-place mutations are flagged dirty on flush and
+        reassigning an equal value does not issue an UPDATE (see `tracking`).
+        Tracked values load as LazyValue proxies, like `lazy=True`, so values
+        that are never read are never converted or fingerprinted.
+        """
         super().__init__()
         self.converter: BaseConverter = converter(targeting, **options)
+        self.codec: t.Optional[Codec] = codec
+        self.lazy = lazy
+        self.tracked = tracked
+
+    def load_dialect_impl(self, dialect):
+        """Use a binary column when a codec is configured."""
+        if self.codec is not None:
+            return dialect.type_descriptor(LargeBinary())
+        return dialect.type_descriptor(JSON())
 
     def compare_against_backend(self, dialect, conn_type):
         """..."""
-        return isinstance(conn_type, JSON)
+        return isinstance(conn_type, (JSON if self.codec is None else LargeBinary))
 
     def process_bind_param(self, value, dialect) -> t.Any:
         """..."""
+        stored = self.store(value)
+        if self.tracked and (stored is not None):
+            digests = tracking.bound.get()
+            if digests is not None: # flushing: keep the digest for the snapshot taken after it
+                digests[id(value)] = (value, self.digest(stored))
+        return stored
+
+    def store(self, value: t.Any) -> t.Any:
+        """Convert a value to its stored form (raw for unread LazyValues)."""
         if value is None:
             return None
+        if self.tracked: # already converted while detecting changes for this flush
+            hit = (tracking.prepared.get() or {}).get(id(value))
+            if (hit is not None) and (hit[0] is value):
+                return hit[1]
+        if type(value) is LazyValue:
+            if not value.decoded:
+                return value.raw
+            value = value.resolve()
+        encoded = _encoded.get()
+        if encoded is not None:
+            hit = encoded.get((id(self.converter), id(value)))
+            if (hit is not None) and (hit[0] is value):
+                return hit[1]
+        if self.codec is not None:
+            return self.codec.encode(self.converter.serialize(value))
         return self.converter.serialize(value)
 
     def process_result_value(self, value, dialect):
         """..."""
         if value is None:
             return None
+        if self.lazy or self.tracked or _deferring.get():
+            return LazyValue(value, self.decode)
+        return self.decode(value)
+
+    def decode(self, value: t.Any) -> t.Any:
+        """Decode a stored (non-null) value with the codec and converter."""
+        if self.codec is not None:
+            value = self.codec.decode(value)
         return self.converter.deserialize(value)
 
+    def fingerprint(self, value: t.Any) -> t.Optional[bytes]:
+        """Digest of a value's stored form (None for None).
+
+        Undecoded LazyValues digest their raw value without running the
+        converter.
+        """
+        if value is None:
+            return None
+        return self.digest(self.store(value))
+
+    @staticmethod
+    def digest(stored: t.Any) -> bytes:
+        """Digest a stored (bound or loaded) column value."""
+        if not isinstance(stored, (bytes, bytearray, memoryview)):
+            stored = json.dumps(stored, sort_keys=True, separators=(',', ':'), default=str).encode('utf-8')
+        return hashlib.blake2b(stored, digest_size=16).digest()
+
+    def encodemany(self, values: t.Sequence[t.Any]) -> t.List[t.Any]:
+        """Convert a batch of values to their stored form with one converter call."""
+        present = [v for v in values if v is not None]
+        encoded = iter(self.converter.serializemany(present))
+        if self.codec is not None:
+            encoded = iter([self.codec.encode(v) for v in encoded])
+        return [(None if v is None else next(encoded)) for v in values]
+
+    def decodemany(self, values: t.Sequence[t.Any]) -> t.List[t.Any]:
+        """Convert a batch of stored values back with one converter call."""
+        present = [v for v in values if v is not None]
+        if self.codec is not None:
+            present = [self.codec.decode(v) for v in present]
+        decoded = iter(self.converter.deserializemany(present))
+        return [(None if v is None else next(decoded)) for v in values]
+
     @classmethod
     def Dataclasses(cls, targeting: ConversionTarget, **options: t.Any) -> 'SQLATypeAdapter':
         """..."""
@@ -63,5 +166,78 @@ class SQLATypeAdapter(TypeDecorator):
         )
 
 
+def typedcolumns(model: t.Type[t.Any]) -> t.List[t.Tuple[str, SQLATypeAdapter]]:
+    """Mapped attributes of a model stored in SQLATypeAdapter columns."""
+    mapper = inspect(model, raiseerr=False)
+    if mapper is None:
+        return []
+    return [
+        (prop.key, col.type)
+        for prop in mapper.column_attrs for col in prop.columns
+        if isinstance(col.type, SQLATypeAdapter)
+    ]
+
+
+def _bymodel(items: t.Iterable[t.Any]) -> t.Dict[t.Type[t.Any], t.List[t.Any]]:
+    groups: t.Dict[t.Type[t.Any], t.List[t.Any]] = {}
+    for item in items:
+        groups.setdefault(type(item), []).append(item)
+    return groups
+
+
+@contextlib.contextmanager
+def batchencoded(items: t.Iterable[t.Any]) -> t.Iterator[None]:
+    """Encode the typed columns of `items` with one `encodemany` per column for the flush inside the block.
+
+    Values the ORM binds inside the block are looked up instead of being
+    serialized one at a time; undecoded LazyValues keep writing their raw value.
+    """
+    encoded: t.Dict[t.Tuple[int, int], t.Tuple[t.Any, t.Any]] = {}
+    for model, group in _bymodel(items).items():
+        for key, coltype in typedcolumns(model):
+            values = [
+                value for value in (item.__dict__.get(key) for item in group)
+                if (value is not None) and (type(value) is not LazyValue)
+            ]
+            if values:
+                for value, stored in zip(values, coltype.encodemany(values)):
+                    encoded[(id(coltype.converter), id(value))] = (value, stored)
+    token = _encoded.set(encoded)
+    try:
+        yield
+    finally:
+        _encoded.reset(token)
+
+
+@contextlib.contextmanager
+def batchdecoded() -> t.Iterator[None]:
+    """Leave typed values loaded inside the block undecoded; pass the loaded items to `decodeloaded` afterwards."""
+    token = _deferring.set(True)
+    try:
+        yield
+    finally:
+        _deferring.reset(token)
+
+
+def decodeloaded(items: t.Sequence[t.Any]) -> t.Sequence[t.Any]:
+    """Decode the typed columns of items loaded in `batchdecoded` with one `decodemany` per column.
+
+    Lazy and tracked columns keep their LazyValue proxies.
+    """
+    for model, group in _bymodel(items).items():
+        for key, coltype in typedcolumns(model):
+            if coltype.lazy or coltype.tracked:
+                continue
+            pending = [
+                (item, value) for item, value in ((item, item.__dict__.get(key)) for item in group)
+                if (type(value) is LazyValue) and (not value.decoded)
+            ]
+            if pending:
+                decoded = coltype.decodemany([value.raw for _, value in pending])
+                for (item, _), value in zip(pending, decoded):
+                    set_committed_value(item, key, value)
+    return items
+
+
 DCType: t.Callable = SQLATypeAdapter.Dataclasses
 PydType: t.Callable = SQLATypeAdapter.Pydantic
@@ -0,0 +1,254 @@
+# ~/supermodels/src/supermodels/adapters/sqla/writebehind.py
+"""
+SQLAlchemy Write-Behind Queue
+
+Opt-in write-behind batching for high-rate inserts. Items handed to
+`additem` are queued in memory and flushed by a background thread in
+batches, triggered by batch size or elapsed time. A batch containing bad
+rows is bisected in savepoints, so only the offending rows are rejected;
+they go to a dead-letter list and callback.
+"""
+from __future__ import annotations
+import time, queue, atexit, weakref, warnings, threading, collections, typing as t, dataclasses as dcs
+
+from supermodels.adapters.sqla.bulk import BulkFailure, savepointwrite
+
+if t.TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+    from supermodels.adapters.sqla.hints import SessionFactory
+
+
+class _Marker:
+    """Flush or stop request; `done` is set once every item queued before it is written."""
+    __slots__ = ('stop', 'done')
+
+    def __init__(self, stop: bool = False) -> None:
+        self.stop = stop
+        self.done = threading.Event()
+
+
+@dcs.dataclass(frozen=True)
+class WriteBehindConfig:
+    """Configuration for a write-behind queue.
+
+    Attributes:
+        batchsize: Maximum number of items written per batch
+        interval: Maximum seconds an item waits before its batch is written
+        maxsize: Maximum number of queued items before producers block
+        timeout: Seconds a producer blocks on a full queue (None blocks forever)
+        deadletters: Number of most recent rejected rows kept in `WriteBehindQueue.deadletters`
+        ondeadletter: Called (on the writer thread) with each rejected row
+    """
+    batchsize: int = 500
+    interval: float = 0.25
+    maxsize: int = 10_000
+    timeout: t.Optional[float] = None
+    deadletters: int = 1000
+    ondeadletter: t.Optional[t.Callable[[BulkFailure], None]] = None
+
+
+@dcs.dataclass(frozen=True)
+class WriteBehindStats:
+    """Point-in-time metrics snapshot for a write-behind queue."""
+    depth: int
+    enqueued: int
+    written: int
+    failed: int
+    flushes: int
+    lastlatency: float
+    maxlatency: float
+    totallatency: float
+
+    @property
+    def avglatency(self) -> float:
+        """Average batch flush latency in seconds."""
+        return (self.totallatency / self.flushes) if self.flushes else 0.0
+
+
+class WriteBehindQueue:
+    """Bounded in-memory queue flushed to the database by a background thread.
+
+    Producers block once `maxsize` items are pending (backpressure). Pending
+    items are always written before `close()` returns, and `close()` is
+    registered to run at interpreter shutdown.
+
+    Queued instances are handed over to the writer thread, which attaches
+    them to its own session: callers must not modify an item after `put`
+    until a `flush()` (or `close()`) has returned.
+    """
+
+    def __init__(
+        self,
+        sessionfactory: SessionFactory,
+        config: t.Optional[WriteBehindConfig] = None
+    ) -> None:
+        """Initialize queue and start the background writer thread."""
+        self.config = (config or WriteBehindConfig())
+        if self.config.batchsize < 1:
+            raise ValueError(f"Write-behind batchsize must be positive, got {self.config.batchsize}")
+        self.sessionfactory = sessionfactory
+        self.lasterror: t.Optional[BaseException] = None
+        self.deadletters: t.Deque[BulkFailure] = collections.deque(maxlen=self.config.deadletters)
+
+        self._queue: queue.Queue = queue.Queue(maxsize=self.config.maxsize)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._enqueued = 0
+        self._written = 0
+        self._failed = 0
+        self._flushes = 0
+        self._lastlatency = 0.0
+        self._maxlatency = 0.0
+        self._totallatency = 0.0
+
+        self._thread = threading.Thread(target=self._run, name='supermodels-writebehind', daemon=True)
+        self._thread.start()
+
+        ref = weakref.ref(self)
+        def _shutdown() -> None:
+            wb = ref()
+            if wb is not None: wb.close()
+        self._atexit = _shutdown
+        atexit.register(_shutdown)
+
+    @property
+    def closed(self) -> bool:
+        """Whether the queue has been closed."""
+        return self._closed
+
+    @property
+    def stats(self) -> WriteBehindStats:
+        """Current queue depth and flush metrics."""
+        with self._lock:
+            return WriteBehindStats(
+                depth=self._queue.qsize(),
+                enqueued=self._enqueued,
+                written=self._written,
+                failed=self._failed,
+                flushes=self._flushes,
+                lastlatency=self._lastlatency,
+                maxlatency=self._maxlatency,
+                totallatency=self._totallatency,
+            )
+
+    def put(self, item: t.Any) -> t.Any:
+        """Queue an item for insertion, blocking while the queue is full.
+
+        The item belongs to the writer thread from now on; do not modify it
+        until a later `flush()` returns.
+        """
+        if self._closed:
+            raise RuntimeError("Cannot queue item: write-behind queue is closed")
+        try:
+            self._queue.put(item, timeout=self.config.timeout)
+        except queue.Full:
+            raise RuntimeError(
+                f"Write-behind queue full ({self.config.maxsize} items pending) after waiting {self.config.timeout}s"
+            )
+        with self._lock:
+            self._enqueued += 1
+        return item
+
+    def flush(self) -> None:
+        """Write every item queued before this call and wait until it is committed.
+
+        Items other producers queue after the call are not waited for.
+        """
+        if self._closed: return
+        marker = _Marker()
+        self._queue.put(marker)
+        marker.done.wait()
+
+    def close(self) -> None:
+        """Flush pending items and stop the writer thread."""
+        if self._closed: return
+        self._closed = True
+        self._queue.put(_Marker(stop=True))
+        self._thread.join()
+        atexit.unregister(self._atexit)
+
+    def _run(self) -> None:
+        """Writer loop: gather batches by size or interval and write them."""
+        batchsize, interval = self.config.batchsize, self.config.interval
+        stopping = False
+        while not stopping:
+            batch: t.List[t.Any] = []
+            marker: t.Optional[_Marker] = None
+            item = self._queue.get()
+            if isinstance(item, _Marker):
+                marker = item
+            else:
+                batch.append(item)
+                deadline = (time.monotonic() + interval)
+                while len(batch) < batchsize:
+                    remaining = (deadline - time.monotonic())
+                    if remaining <= 0: break
+                    try:
+                        item = self._queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                    if isinstance(item, _Marker):
+                        marker = item
+                        break
+                    batch.append(item)
+
+            if batch: self._write(batch)
+            if marker is not None:
+                stopping = marker.stop
+                marker.done.set()
+
+        # drain anything queued behind the stop marker
+        leftover, markers = [], []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            (markers if isinstance(item, _Marker) else leftover).append(item)
+        for start in range(0, len(leftover), batchsize):
+            self._write(leftover[start:start + batchsize])
+        for marker in markers:
+            marker.done.set()
+
+    def _write(self, batch: t.List[t.Any]) -> None:
+        """Insert a batch, isolating bad rows in savepoints, and record metrics."""
+        started = time.perf_counter()
+        session = self.sessionfactory()
+        failures: t.List[BulkFailure] = []
+        try:
+            report = savepointwrite(session, batch, _stage, chunksize=len(batch))
+            session.expunge_all()
+            written, failures = len(report.written), report.failures
+        except Exception as e:
+            session.rollback()
+            written = 0
+            failures = [BulkFailure(i, item, e) for i, item in enumerate(batch)]
+        finally:
+            session.close()
+
+        if failures:
+            self.lasterror = failures[-1].error
+            self.deadletters.extend(failures)
+            warnings.warn(f"Write-behind rejected {len(failures)} of {len(batch)} items: {self.lasterror}")
+            if self.config.ondeadletter is not None:
+                for failure in failures:
+                    try:
+                        self.config.ondeadletter(failure)
+                    except Exception as e:
+                        warnings.warn(f"Write-behind dead-letter callback failed: {e}")
+        failed = len(failures)
+
+        latency = (time.perf_counter() - started)
+        with self._lock:
+            self._written += written
+            self._failed += failed
+            self._flushes += 1
+            self._lastlatency = latency
+            self._maxlatency = max(self._maxlatency, latency)
+            self._totallatency += latency
+
+
+def _stage(session: Session, item: t.Any) -> t.Any:
+    """Stage one queued item on the writer session."""
+    session.add(item)
+    return item
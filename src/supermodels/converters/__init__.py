@@ -1 +1,32 @@
-# ~/supermodels/src/supermodels/converters/__init__.py 
+# ~/supermodels/src/supermodels/converters/__init__.py
+"""
+Converters
+
+Framework-agnostic converters between Python objects (dataclasses, Pydantic
+models) and JSON-compatible values. Converters are imported on first access,
+so pydantic is only loaded when the Pydantic converter is used.
+"""
+from __future__ import annotations
+
+from supermodels.core.utils.lazymodules import lazymodule, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base import BaseConverter
+    from .dc import DataclassConverter
+    from .pyd import PydanticConverter
+    from .codecs import Codec, JSONCodec, BinaryCodec
+    from .lazy import LazyValue
+
+_lazy = {
+    'BaseConverter': 'supermodels.converters.base',
+    'DataclassConverter': 'supermodels.converters.dc',
+    'PydanticConverter': 'supermodels.converters.pyd',
+    'Codec': 'supermodels.converters.codecs',
+    'JSONCodec': 'supermodels.converters.codecs',
+    'BinaryCodec': 'supermodels.converters.codecs',
+    'LazyValue': 'supermodels.converters.lazy',
+}
+
+__all__ = ['BaseConverter', 'DataclassConverter', 'PydanticConverter', 'Codec', 'JSONCodec', 'BinaryCodec', 'LazyValue']
+
+__getattr__, __dir__ = lazymodule(__name__, _lazy)
@@ -33,3 +33,17 @@ class BaseConverter(abc.ABC):
     def deserialize(self, value: t.Any, **kwargs) -> t.Any:
         """..."""
         pass
+
+    def serializemany(self, values: t.Iterable[t.Any], **kwargs) -> t.List[t.Any]:
+        """Serialize a sequence of values in one call.
+
+        Subclasses override this to amortize per-call setup across the batch.
+        """
+        return [self.serialize(value, **kwargs) for value in values]
+
+    def deserializemany(self, values: t.Iterable[t.Any], **kwargs) -> t.List[t.Any]:
+        """Deserialize a sequence of values in one call.
+
+        Subclasses override this to amortize per-call setup across the batch.
+        """
+        return [self.deserialize(value, **kwargs) for value in values]
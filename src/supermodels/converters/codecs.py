@@ -0,0 +1,139 @@
+# ~/supermodels/src/supermodels/converters/codecs.py
+"""
+Codecs
+
+Byte-level encodings for converted (JSON-compatible) values, used by typed
+columns stored as binary. Every payload starts with a one byte header
+recording whether it was zlib-compressed (and, for the binary codec,
+whether it fell back to JSON), so settings and installed packages can
+change without breaking rows already written.
+"""
+from __future__ import annotations
+import abc, json, zlib, typing as t
+
+Payload = t.Union[bytes, bytearray, memoryview]
+
+RAW = b'\x00'
+ZLIB = b'\x01'
+# written by BinaryCodec when msgpack is not installed
+JSONRAW = b'\x02'
+JSONZLIB = b'\x03'
+
+
+class Codec(abc.ABC):
+    """Encodes JSON-compatible values to bytes, optionally compressing them.
+
+    Payloads larger than `compress` bytes (when set) are zlib-compressed at
+    `level`.
+    """
+    name: str = 'codec'
+
+    def __init__(self, compress: t.Optional[int] = None, level: int = 6) -> None:
+        self.compress = compress
+        self.level = level
+
+    @abc.abstractmethod
+    def dumps(self, value: t.Any) -> bytes:
+        """Encode a value to uncompressed bytes."""
+        pass
+
+    @abc.abstractmethod
+    def loads(self, data: Payload) -> t.Any:
+        """Decode uncompressed bytes to a value."""
+        pass
+
+    def encode(self, value: t.Any) -> bytes:
+        """Encode a value to a framed (and possibly compressed) payload."""
+        return self.frame(self.dumps(value), RAW, ZLIB)
+
+    def frame(self, data: bytes, raw: bytes, compressed: bytes) -> bytes:
+        """Prefix encoded bytes with a header, compressing them above the threshold."""
+        if (self.compress is not None) and (len(data) > self.compress):
+            return compressed + zlib.compress(data, self.level)
+        return raw + data
+
+    def decode(self, payload: Payload) -> t.Any:
+        """Decode a payload written by `encode`."""
+        view = memoryview(payload)
+        header = bytes(view[:1])
+        if header == ZLIB:
+            return self.loads(zlib.decompress(view[1:]))
+        if header == RAW:
+            return self.loads(view[1:])
+        raise ValueError(f"Unknown {self.name} payload header {header!r}")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(compress={self.compress!r}, level={self.level!r})"
+
+
+class JSONCodec(Codec):
+    """JSON as UTF-8 bytes, using orjson when installed and the stdlib otherwise."""
+    name = 'json'
+
+    def __init__(self, compress: t.Optional[int] = None, level: int = 6, fast: bool = True) -> None:
+        super().__init__(compress, level)
+        self.backend = 'json'
+        if fast:
+            try:
+                import orjson
+                self._dumps, self._loads = orjson.dumps, orjson.loads
+                self.backend = 'orjson'
+                return
+            except ImportError:
+                pass
+        encoder = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False)
+        self._dumps = (lambda value: encoder.encode(value).encode('utf-8'))
+        self._loads = json.loads
+
+    def dumps(self, value: t.Any) -> bytes:
+        return self._dumps(value)
+
+    def loads(self, data: Payload) -> t.Any:
+        return self._loads(bytes(data) if isinstance(data, memoryview) else data)
+
+
+class BinaryCodec(Codec):
+    """Compact MessagePack encoding via the optional `msgpack` package
+    (`pip install supermodels[msgpack]`).
+
+    Without msgpack, values are written as JSON under their own headers, so
+    those rows stay readable once msgpack is installed; reading MessagePack
+    rows then requires it.
+    """
+    name = 'binary'
+
+    def __init__(self, compress: t.Optional[int] = None, level: int = 6) -> None:
+        super().__init__(compress, level)
+        self._json = JSONCodec()
+        try:
+            import msgpack
+            self._dumps = (lambda value: msgpack.packb(value, use_bin_type=True))
+            self._loads = (lambda data: msgpack.unpackb(data, raw=False, strict_map_key=False))
+            self.backend = 'msgpack'
+        except ImportError:
+            self._dumps = self._loads = None
+            self.backend = self._json.backend
+
+    def dumps(self, value: t.Any) -> bytes:
+        if self._dumps is None:
+            return self._json.dumps(value)
+        return self._dumps(value)
+
+    def loads(self, data: Payload) -> t.Any:
+        if self._loads is None:
+            raise ImportError(f"Decoding MessagePack {self.name} payloads requires msgpack: pip install supermodels[msgpack]")
+        return self._loads(data)
+
+    def encode(self, value: t.Any) -> bytes:
+        if self._dumps is None:
+            return self.frame(self._json.dumps(value), JSONRAW, JSONZLIB)
+        return super().encode(value)
+
+    def decode(self, payload: Payload) -> t.Any:
+        view = memoryview(payload)
+        header = bytes(view[:1])
+        if header == JSONZLIB:
+            return self._json.loads(zlib.decompress(view[1:]))
+        if header == JSONRAW:
+            return self._json.loads(view[1:])
+        return super().decode(payload)
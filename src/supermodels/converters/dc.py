@@ -4,9 +4,9 @@
 """
 from __future__ import annotations
 import typing as t, dataclasses as dcs
-from datetime import datetime
 
 from supermodels.converters.base import BaseConverter, DateTimeFields, ConversionTarget, ConversionOptions
+from supermodels.converters.plans import encode, decoderfor
 
 class DataclassConverter(BaseConverter):
     """..."""
@@ -25,31 +25,30 @@ class DataclassConverter(BaseConverter):
 
     def serialize(self, value: t.Any, **kwargs) -> t.Any:
         """..."""
-        def convertvalue(val: t.Any) -> t.Any:
-            if dcs.is_dataclass(val) and not isinstance(val, type): return {k: convertvalue(getattr(val, k)) for k in dcs.asdict(val)}
-            elif isinstance(val, list): return [convertvalue(item) for item in val]
-            elif isinstance(val, (int, float, str, bool)): return val
-            elif isinstance(val, dict): return {k: convertvalue(v) for k,v in val.items()}
-            else: return str(val)
-
-        return convertvalue(value)
+        return encode(value)
 
 
     def deserialize(self, value: t.Any, **kwargs) -> t.Any:
         """..."""
-        def convertvalue(val: t.Any) -> t.Any:
-            if isinstance(val, dict):
-                if self.__datetimes__ and any(k in val for k in self.__datetimes__):
-                    for k in self.__datetimes__:
-                        if (k in val) and (val[k] is not None) and (val[k].lower() != 'none'):
-                            val[k] = datetime.fromisoformat(val[k])
-                return {k: convertvalue(v) for k,v in val.items()}
-            elif isinstance(val, list):
-                return [convertvalue(item) for item in val]
-            return val
-
         if isinstance(self.targeting, type) and dcs.is_dataclass(self.targeting):
+            decode = decoderfor(self.targeting, frozenset(self.__datetimes__))
             if isinstance(value, list):
-                return [self.targeting(**convertvalue(item)) for item in value]
-            return self.targeting(**convertvalue(value))
+                return [decode(item) for item in value]
+            return decode(value)
         return value
+
+
+    def serializemany(self, values: t.Iterable[t.Any], **kwargs) -> t.List[t.Any]:
+        """..."""
+        return [encode(value) for value in values]
+
+
+    def deserializemany(self, values: t.Iterable[t.Any], **kwargs) -> t.List[t.Any]:
+        """..."""
+        if not (isinstance(self.targeting, type) and dcs.is_dataclass(self.targeting)):
+            return list(values)
+        decode = decoderfor(self.targeting, frozenset(self.__datetimes__))
+        return [
+            ([decode(item) for item in value] if isinstance(value, list) else decode(value))
+            for value in values
+        ]
@@ -0,0 +1,112 @@
+# ~/supermodels/src/supermodels/converters/lazy.py
+"""
+Lazy Values
+
+Proxy that holds a raw stored value and only runs its decoder (codec and
+converter) on first use, caching the result. Attribute access, item access,
+iteration, comparison and `isinstance` checks are forwarded to the decoded
+value.
+"""
+from __future__ import annotations
+import typing as t
+
+_EMPTY = object()
+
+
+class LazyValue:
+    """Deferred-decoding proxy for a raw column value.
+
+    Until the value is used, `raw` can be written back unchanged, so rows
+    whose typed columns are never read are never converted in either
+    direction. Proxies are unhashable, like the mutable values they stand
+    for; hash `resolve()` when the decoded value is hashable.
+    """
+    __slots__ = ('_raw', '_decode', '_value')
+
+    def __init__(self, raw: t.Any, decode: t.Callable[[t.Any], t.Any]) -> None:
+        object.__setattr__(self, '_raw', raw)
+        object.__setattr__(self, '_decode', decode)
+        object.__setattr__(self, '_value', _EMPTY)
+
+    @property
+    def raw(self) -> t.Any:
+        """The value as loaded (kept after decoding, for change detection)."""
+        return object.__getattribute__(self, '_raw')
+
+    @property
+    def decoded(self) -> bool:
+        """Whether the decoder has run."""
+        return object.__getattribute__(self, '_value') is not _EMPTY
+
+    def resolve(self) -> t.Any:
+        """Decode on first call and return the cached value."""
+        value = object.__getattribute__(self, '_value')
+        if value is _EMPTY:
+            value = object.__getattribute__(self, '_decode')(object.__getattribute__(self, '_raw'))
+            object.__setattr__(self, '_value', value)
+        return value
+
+    # resolves, so isinstance(proxy, Target) works like Django's lazy objects
+    __class__ = property(lambda self: type(self.resolve())) # type: ignore
+
+    def __getattr__(self, name: str) -> t.Any:
+        return getattr(self.resolve(), name)
+
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        setattr(self.resolve(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self.resolve(), name)
+
+    def __repr__(self) -> str:
+        return repr(self.resolve())
+
+    def __str__(self) -> str:
+        return str(self.resolve())
+
+    def __eq__(self, other: t.Any) -> bool:
+        return self.resolve() == unwrap(other)
+
+    def __ne__(self, other: t.Any) -> bool:
+        return self.resolve() != unwrap(other)
+
+    __hash__ = None # type: ignore[assignment]
+
+    def __bool__(self) -> bool:
+        return bool(self.resolve())
+
+    def __len__(self) -> int:
+        return len(self.resolve())
+
+    def __iter__(self) -> t.Iterator[t.Any]:
+        return iter(self.resolve())
+
+    def __contains__(self, item: t.Any) -> bool:
+        return item in self.resolve()
+
+    def __getitem__(self, key: t.Any) -> t.Any:
+        return self.resolve()[key]
+
+    def __setitem__(self, key: t.Any, value: t.Any) -> None:
+        self.resolve()[key] = value
+
+    def __delitem__(self, key: t.Any) -> None:
+        del self.resolve()[key]
+
+    def __copy__(self) -> t.Any:
+        import copy
+        return copy.copy(self.resolve())
+
+    def __deepcopy__(self, memo: t.Dict[int, t.Any]) -> t.Any:
+        import copy
+        return copy.deepcopy(self.resolve(), memo)
+
+    def __reduce_ex__(self, protocol: t.SupportsIndex) -> t.Any:
+        return self.resolve().__reduce_ex__(protocol)
+
+
+def unwrap(value: t.Any) -> t.Any:
+    """Return the decoded value of a LazyValue, or the value itself."""
+    if type(value) is LazyValue:
+        return value.resolve()
+    return value
@@ -0,0 +1,222 @@
+# ~/supermodels/src/supermodels/converters/plans.py
+"""
+Conversion Plans
+
+Compiled, per-type conversion functions for converters. Each dataclass gets
+one generated encode function built from its fields and type hints, cached
+per class; other values are dispatched by exact runtime type through a
+cached encoder table instead of a chain of isinstance checks. Decoders are
+built the same way from type hints and invert the encoders' output.
+"""
+from __future__ import annotations
+import uuid, types, decimal, typing as t, dataclasses as dcs
+from datetime import datetime, date
+
+Encoder = t.Callable[[t.Any], t.Any]
+Decoder = t.Callable[[t.Any], t.Any]
+
+SCALARS: t.Tuple[type, ...] = (int, float, str, bool)
+
+_encoders: t.Dict[type, Encoder] = {}
+_decoders: t.Dict[t.Tuple[t.Any, t.FrozenSet[str]], Decoder] = {}
+
+
+def identity(value: t.Any) -> t.Any:
+    return value
+
+
+def encode(value: t.Any) -> t.Any:
+    """Encode any value to its JSON-compatible form."""
+    cls = value.__class__
+    encoder = _encoders.get(cls)
+    if encoder is None:
+        encoder = encoderfor(cls)
+    return encoder(value)
+
+
+def encoderfor(cls: type) -> Encoder:
+    """Get (building and caching on first use) the encoder for a runtime type.
+
+    Mirrors the converter rules: dataclass instances become dicts of their
+    fields, lists and dicts are encoded element-wise, int/float/str/bool pass
+    through and anything else is stringified.
+    """
+    encoder = _encoders.get(cls)
+    if encoder is not None:
+        return encoder
+
+    if dcs.is_dataclass(cls):
+        encoder = compileencoder(cls)
+    elif issubclass(cls, list):
+        encoder = (lambda v: [encode(i) for i in v])
+    elif issubclass(cls, SCALARS):
+        encoder = identity
+    elif issubclass(cls, dict):
+        encoder = (lambda v: {k: encode(i) for k, i in v.items()})
+    else:
+        encoder = str
+
+    _encoders[cls] = encoder
+    return encoder
+
+
+def fieldhints(cls: type) -> t.Dict[str, t.Any]:
+    """Resolve a dataclass' type hints, tolerating unresolvable forward references."""
+    try:
+        return t.get_type_hints(cls)
+    except Exception:
+        return {f.name: f.type for f in dcs.fields(cls)}
+
+
+def _fieldexpr(var: str, hint: t.Any) -> str:
+    """Source for encoding one field value, specialized on its declared type."""
+    if hint in SCALARS:
+        return f"({var} if {var}.__class__ in _scalars else _encode({var}))"
+    if (t.get_origin(hint) is list) and (t.get_args(hint)[:1] and t.get_args(hint)[0] in SCALARS):
+        return (
+            f"([i if i.__class__ in _scalars else _encode(i) for i in {var}] "
+            f"if {var}.__class__ is list else _encode({var}))"
+        )
+    return f"_encode({var})"
+
+
+def compileencoder(cls: type) -> Encoder:
+    """Generate a dataclass-specific encode function.
+
+    Fields are read directly (no `dataclasses.asdict` deep copy); scalar and
+    list-of-scalar fields are encoded inline, everything else goes through
+    `encode`, which dispatches nested dataclasses to their own compiled plans.
+    """
+    hints = fieldhints(cls)
+    fields = dcs.fields(cls)
+    lines = [f"def encode_{cls.__name__}(obj):"]
+    items = []
+    for n, field in enumerate(fields):
+        lines.append(f"    v{n} = obj.{field.name}")
+        items.append(f"{field.name!r}: {_fieldexpr(f'v{n}', hints.get(field.name))}")
+    lines.append(f"    return {{{', '.join(items)}}}")
+
+    namespace: t.Dict[str, t.Any] = {'_encode': encode, '_scalars': frozenset(SCALARS)}
+    exec('\n'.join(lines), namespace)
+    return namespace[f"encode_{cls.__name__}"]
+
+
+def isnull(value: t.Any) -> bool:
+    """Whether an encoded value stands for None (encoders stringify None to 'None')."""
+    return (value is None) or (isinstance(value, str) and (value.lower() == 'none'))
+
+
+def _parser(parse: t.Callable[[str], t.Any]) -> Decoder:
+    """Decoder for a value stringified on encode and parsed back from str."""
+    def decode(value: t.Any) -> t.Any:
+        if isnull(value):
+            return None
+        return (parse(value) if isinstance(value, str) else value)
+    return decode
+
+
+PARSERS: t.Dict[type, Decoder] = {
+    datetime: _parser(datetime.fromisoformat),
+    date: _parser(date.fromisoformat),
+    decimal.Decimal: _parser(decimal.Decimal),
+    uuid.UUID: _parser(uuid.UUID),
+}
+
+
+def decoderfor(hint: t.Any, datetimes: t.FrozenSet[str] = frozenset()) -> Decoder:
+    """Get (building and caching on first use) the decoder for a type hint.
+
+    `datetimes` names fields parsed as datetimes regardless of their hint,
+    at any depth (the converters' `__datetimes__` option).
+    """
+    key = (hint, datetimes)
+    try:
+        decoder = _decoders.get(key)
+    except TypeError: # unhashable hint (e.g. Annotated metadata): leave values as-is
+        return identity
+    if decoder is not None:
+        return decoder
+
+    origin, args = t.get_origin(hint), t.get_args(hint)
+    if isinstance(hint, type) and dcs.is_dataclass(hint):
+        decoder = compiledecoder(hint, datetimes)
+    elif hint in PARSERS:
+        decoder = PARSERS[hint]
+    elif origin in (list, t.List):
+        item = _deferred(args[0], datetimes) if args else untyped(datetimes)
+        decoder = (lambda v: [item(i) for i in v] if isinstance(v, list) else v)
+    elif origin in (dict, t.Dict):
+        item = _deferred(args[1], datetimes) if (len(args) == 2) else untyped(datetimes)
+        decoder = _dictdecoder(item, datetimes)
+    elif (origin in (t.Union, types.UnionType)) and (type(None) in args):
+        options = [a for a in args if a is not type(None)]
+        inner = (_deferred(options[0], datetimes) if (len(options) == 1) else untyped(datetimes))
+        decoder = (lambda v: None if isnull(v) else inner(v))
+    else:
+        decoder = untyped(datetimes)
+
+    _decoders[key] = decoder
+    return decoder
+
+
+def untyped(datetimes: t.FrozenSet[str]) -> Decoder:
+    """Decoder for values without a usable hint: `datetimes` keys are parsed in any nested dict."""
+    if not datetimes:
+        return identity
+    parse = PARSERS[datetime]
+    def decode(value: t.Any) -> t.Any:
+        if isinstance(value, dict):
+            return {k: (parse(v) if k in datetimes else decode(v)) for k, v in value.items()}
+        if isinstance(value, list):
+            return [decode(v) for v in value]
+        return value
+    return decode
+
+
+def _dictdecoder(item: Decoder, datetimes: t.FrozenSet[str]) -> Decoder:
+    """Decoder for a dict of values, parsing `datetimes` keys of the dict itself."""
+    if not datetimes:
+        return (lambda v: {k: item(i) for k, i in v.items()} if isinstance(v, dict) else v)
+    parse = PARSERS[datetime]
+    return (lambda v: {k: (parse(i) if k in datetimes else item(i)) for k, i in v.items()} if isinstance(v, dict) else v)
+
+
+def _deferred(hint: t.Any, datetimes: t.FrozenSet[str]) -> Decoder:
+    """Decoder resolved on first call, so self-referencing dataclasses compile."""
+    if not (isinstance(hint, type) and dcs.is_dataclass(hint)):
+        return decoderfor(hint, datetimes)
+    resolved: t.List[Decoder] = []
+    def decode(value: t.Any) -> t.Any:
+        if not resolved:
+            resolved.append(decoderfor(hint, datetimes))
+        return resolved[0](value)
+    return decode
+
+
+def compiledecoder(cls: type, datetimes: t.FrozenSet[str] = frozenset()) -> Decoder:
+    """Generate a dataclass-specific decode function.
+
+    Builds the instance from a dict in one pass, decoding each field with the
+    decoder chosen for its type hint at compile time. The input is never
+    mutated; keys of non-init fields are ignored, keys that are not fields
+    reach the constructor and raise its TypeError, and missing keys fall back
+    to the dataclass defaults.
+    """
+    hints = fieldhints(cls)
+    fields = dcs.fields(cls)
+    namespace: t.Dict[str, t.Any] = {'_cls': cls, '_fields': frozenset(f.name for f in fields)}
+    lines = [f"def decode_{cls.__name__}(data):", "    if not isinstance(data, dict): return data", "    kwargs = {}"]
+    for n, field in enumerate(f for f in fields if f.init):
+        hint = (datetime if (field.name in datetimes) else hints.get(field.name, t.Any))
+        decoder = _deferred(hint, datetimes)
+        if decoder is identity:
+            lines.append(f"    if {field.name!r} in data: kwargs[{field.name!r}] = data[{field.name!r}]")
+        else:
+            namespace[f"_d{n}"] = decoder
+            lines.append(f"    if {field.name!r} in data: kwargs[{field.name!r}] = _d{n}(data[{field.name!r}])")
+    lines.append("    if len(kwargs) != len(data):")
+    lines.append("        kwargs.update((k, data[k]) for k in data.keys() - _fields)")
+    lines.append("    return _cls(**kwargs)")
+
+    exec('\n'.join(lines), namespace)
+    return namespace[f"decode_{cls.__name__}"]
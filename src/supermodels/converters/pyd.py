@@ -6,9 +6,62 @@ from __future__ import annotations
 import typing as t
 from datetime import datetime
 
-from pydantic import BaseModel as PydModel
+from pydantic import BaseModel as PydModel, TypeAdapter
 
 from supermodels.converters.base import BaseConverter, DateTimeFields, ConversionTarget, ConversionOptions
+from supermodels.converters.plans import Decoder, decoderfor, identity, isnull
+
+_typeadapters: t.Dict[t.Any, TypeAdapter] = {}
+_constructors: t.Dict[type, Decoder] = {}
+
+
+def typeadapter(hint: t.Any) -> TypeAdapter:
+    """Get the cached TypeAdapter for a type (e.g. `Model` or `list[Model]`)."""
+    adapter = _typeadapters.get(hint)
+    if adapter is None:
+        adapter = _typeadapters[hint] = TypeAdapter(hint)
+    return adapter
+
+
+def constructorfor(model: t.Type[PydModel]) -> Decoder:
+    """Get the cached trusted constructor for a model.
+
+    Builds instances with `model_construct` (no validation), decoding each
+    field from its annotation: nested models and lists of models recurse,
+    other fields use the converters' type-driven decoders (datetimes etc.).
+    """
+    constructor = _constructors.get(model)
+    if constructor is not None:
+        return constructor
+
+    decoders: t.Dict[str, Decoder] = {}
+    def construct(data: t.Any) -> t.Any:
+        if not isinstance(data, dict):
+            return data
+        return model.model_construct(**{
+            k: (decoders[k](v) if k in decoders else v) for k, v in data.items()
+        })
+    _constructors[model] = construct
+
+    for name, field in model.model_fields.items():
+        decoder = _trusteddecoder(field.annotation)
+        if decoder is not identity:
+            decoders[name] = decoder
+    return construct
+
+
+def _trusteddecoder(hint: t.Any) -> Decoder:
+    """Decoder for a model field in trusted mode."""
+    if isinstance(hint, type) and issubclass(hint, PydModel):
+        return constructorfor(hint)
+    origin, args = t.get_origin(hint), t.get_args(hint)
+    if (origin is list) and args and isinstance(args[0], type) and issubclass(args[0], PydModel):
+        item = constructorfor(args[0])
+        return (lambda v: [item(i) for i in v] if isinstance(v, list) else v)
+    if (type(None) in args) and (len(args) == 2):
+        inner = _trusteddecoder(next(a for a in args if a is not type(None)))
+        return (lambda v: None if isnull(v) else inner(v))
+    return decoderfor(hint)
 
 
 class PydanticConverter(BaseConverter):
@@ -18,46 +71,100 @@ class PydanticConverter(BaseConverter):
         self,
         targeting: ConversionTarget,
         datetimes: t.Optional[DateTimeFields] = None,
+        trusted: bool = False,
         **options: t.Any
     ) -> None:
-        """..."""
+        """...
+
+        With `trusted=True`, values are rebuilt with `model_construct` and no
+        validation; use it only for data this converter wrote itself.
+        """
         super().__init__(targeting, **options)
         if datetimes is not None:
             self.__datetimes__ = self.__datetimes__ | datetimes
+        self.trusted = trusted
+        self._decode: t.Optional[Decoder] = None
 
 
-    def serialize(self, value: t.Any, **kwargs) -> t.Any:
+    @property
+    def _ismodel(self) -> bool:
+        return isinstance(self.targeting, type) and issubclass(self.targeting, PydModel)
+
+
+    def _serializevalue(self, val: t.Any) -> t.Any:
         """..."""
-        def convertvalue(val: t.Any) -> t.Any:
-            if isinstance(val, PydModel):
-                return val.model_dump()
-            elif isinstance(val, list):
-                return [convertvalue(item) for item in val]
-            elif isinstance(val, dict):
-                return {k: convertvalue(v) for k,v in val.items()}
-            elif isinstance(val, (int, float, str, bool)):
-                return val
-            else:
-                return str(val)
+        if isinstance(val, PydModel):
+            return val.model_dump(mode="json")
+        elif isinstance(val, list):
+            return [self._serializevalue(item) for item in val]
+        elif isinstance(val, dict):
+            return {k: self._serializevalue(v) for k,v in val.items()}
+        elif isinstance(val, (int, float, str, bool)):
+            return val
+        else:
+            return str(val)
 
-        return convertvalue(value)
 
+    def _deserializevalue(self, val: t.Any) -> t.Any:
+        """..."""
+        if isinstance(val, dict):
+            return {
+                k: (datetime.fromisoformat(v) if ((k in self.__datetimes__) and isinstance(v, str) and not isnull(v)) else self._deserializevalue(v))
+                for k,v in val.items()
+            }
+        elif isinstance(val, list):
+            return [self._deserializevalue(item) for item in val]
+        return val
 
-    def deserialize(self, value: t.Any, **kwargs) -> t.Any:
+
+    def _decoder(self) -> Decoder:
+        """Get (building once) the per-value decoder for the configured mode."""
+        if self._decode is None:
+            self._decode = self._builddecoder()
+        return self._decode
+
+
+    def _builddecoder(self) -> Decoder:
         """..."""
-        def convertvalue(val: t.Any) -> t.Any:
-            if isinstance(val, dict):
-                if self.__datetimes__ and any(k in val for k in self.__datetimes__):
-                    for k in self.__datetimes__:
-                        if (k in val) and (val[k] is not None) and (val[k].lower() != 'none'):
-                            val[k] = datetime.fromisoformat(val[k])
-                return {k: convertvalue(v) for k,v in val.items()}
-            elif isinstance(val, list):
-                return [convertvalue(item) for item in val]
-            return val
+        target = t.cast(t.Type[PydModel], self.targeting)
+        if self.trusted:
+            construct = constructorfor(target)
+            prepare = (self._deserializevalue if self.__datetimes__ else identity)
+            return (lambda v: [construct(prepare(i)) for i in v] if isinstance(v, list) else construct(prepare(v)))
+
+        single, many = typeadapter(target), typeadapter(t.List[target]) # type: ignore
+        def validate(value: t.Any) -> t.Any:
+            if isinstance(value, (str, bytes)):
+                return (many if value.lstrip()[:1] in ('[', b'[') else single).validate_json(value)
+            if self.__datetimes__:
+                value = self._deserializevalue(value)
+            return (many if isinstance(value, list) else single).validate_python(value)
+        return validate
+
+
+    def serialize(self, value: t.Any, **kwargs) -> t.Any:
+        """..."""
+        if isinstance(value, PydModel):
+            return value.model_dump(mode="json")
+        return self._serializevalue(value)
 
-        if isinstance(self.targeting, type) and issubclass(self.targeting, PydModel):
-            if isinstance(value, list):
-                return [self.targeting(**convertvalue(item)) for item in value]
-            return self.targeting(**convertvalue(value))
+
+    def deserialize(self, value: t.Any, **kwargs) -> t.Any:
+        """..."""
+        if self._ismodel:
+            return self._decoder()(value)
         return value
+
+
+    def serializemany(self, values: t.Iterable[t.Any], **kwargs) -> t.List[t.Any]:
+        """..."""
+        convert = self._serializevalue
+        return [(value.model_dump(mode="json") if isinstance(value, PydModel) else convert(value)) for value in values]
+
+
+    def deserializemany(self, values: t.Iterable[t.Any], **kwargs) -> t.List[t.Any]:
+        """..."""
+        if not self._ismodel:
+            return list(values)
+        decode = self._decoder()
+        return [decode(value) for value in values]
@@ -0,0 +1,119 @@
+# ~/supermodels/src/supermodels/core/aggregates.py
+"""
+Aggregations
+
+Framework-agnostic aggregation specs. Calls such as
+`aggregate(Order, groupby=['user_id'], sum='amount', count=True)` are
+parsed into aggregate specs that adapters compile to GROUP BY queries,
+with a pure Python evaluator for adapters without a query engine.
+"""
+from __future__ import annotations
+import typing as t, dataclasses as dcs
+
+FUNCTIONS = ('count', 'sum', 'avg', 'min', 'max')
+
+AggregateRow = t.Union[t.Dict[str, t.Any], t.Tuple[t.Any, ...]]
+
+
+@dcs.dataclass(frozen=True)
+class Aggregate:
+    """A single aggregate function over a field (None meaning `COUNT(*)`)."""
+    func: str
+    field: t.Optional[str]
+
+    @property
+    def label(self) -> str:
+        """Result key for this aggregate, e.g. `sum_amount` or `count`."""
+        return (self.func if self.field is None else f"{self.func}_{self.field}")
+
+
+def hasfield(model: t.Type[t.Any], name: str) -> bool:
+    """Whether a model declares a field (attribute or annotation) called `name`."""
+    return (hasattr(model, name) or any(name in getattr(c, '__annotations__', {}) for c in model.__mro__))
+
+
+def parseaggregates(model: t.Optional[t.Type[t.Any]] = None, /, **kwargs: t.Any) -> t.Tuple[t.List[Aggregate], t.Dict[str, t.Any]]:
+    """Split keyword arguments into aggregate specs and remaining filters.
+
+    Each function keyword takes a field name or a list of field names;
+    `count=True` (or `'*'`) counts rows. A function keyword that is also a
+    field of `model` is ambiguous and rejected; filter such fields with a
+    `where` expression (e.g. `AND(count=3)`) instead.
+    """
+    aggregates: t.List[Aggregate] = []
+    filters: t.Dict[str, t.Any] = {}
+    for k, v in kwargs.items():
+        if k not in FUNCTIONS:
+            filters[k] = v
+            continue
+        if (model is not None) and hasfield(model, k):
+            raise ValueError(
+                f"Keyword '{k}' is ambiguous: '{model.__name__}' has a field named '{k}'. "
+                f"Filter on it with a where expression such as AND({k}=...) instead"
+            )
+        targets = ([v] if isinstance(v, (str, bool)) else list(v))
+        for target in targets:
+            if (target is True) or (target == '*'):
+                if k != 'count':
+                    raise ValueError(f"Aggregate '{k}' requires a field name")
+                aggregates.append(Aggregate('count', None))
+            elif target:
+                aggregates.append(Aggregate(k, target))
+
+    if not aggregates:
+        raise ValueError(f"At least one aggregate must be provided. Available aggregates: {list(FUNCTIONS)}")
+    return aggregates, filters
+
+
+def shaperows(
+    rows: t.Iterable[t.Sequence[t.Any]],
+    groupby: t.Sequence[str],
+    aggregates: t.Sequence[Aggregate],
+    astuples: bool = False
+) -> t.List[AggregateRow]:
+    """Shape raw `(groups..., aggregates...)` rows into tuples or dicts."""
+    if astuples:
+        return [tuple(row) for row in rows]
+    labels = [*groupby, *(a.label for a in aggregates)]
+    return [dict(zip(labels, row)) for row in rows]
+
+
+def computeaggregates(
+    items: t.Iterable[t.Any],
+    groupby: t.Sequence[str],
+    aggregates: t.Sequence[Aggregate]
+) -> t.List[t.Tuple[t.Any, ...]]:
+    """Compute aggregate rows over objects in Python.
+
+    Follows SQL semantics: None values are skipped by every function except
+    `COUNT(*)`, and SUM/AVG/MIN/MAX of no values are None.
+    """
+    groups: t.Dict[t.Tuple[t.Any, ...], t.List[t.Any]] = {}
+    for item in items:
+        key = tuple(getattr(item, f, None) for f in groupby)
+        groups.setdefault(key, []).append(item)
+    if (not groupby) and (not groups):
+        groups[()] = []
+
+    rows = []
+    for key, members in groups.items():
+        values = []
+        for agg in aggregates:
+            if agg.field is None:
+                values.append(len(members))
+                continue
+            present = [v for v in (getattr(m, agg.field, None) for m in members) if v is not None]
+            if agg.func == 'count':
+                values.append(len(present))
+            elif not present:
+                values.append(None)
+            elif agg.func == 'sum':
+                values.append(sum(present))
+            elif agg.func == 'avg':
+                values.append(sum(present) / len(present))
+            elif agg.func == 'min':
+                values.append(min(present))
+            else:
+                values.append(max(present))
+        rows.append((*key, *values))
+    return rows
@@ -9,6 +9,9 @@ from __future__ import annotations
 import abc, typing as t
 
 from supermodels.core.models.tvars import ModelType, SessionType
+from supermodels.core.filters import Expression
+from supermodels.core.aggregates import AggregateRow
+from supermodels.core.enums import CommitPolicy, ONCE
 
 
 class DBAdapter(abc.ABC, t.Generic[SessionType]):
@@ -35,12 +38,12 @@ class DBAdapter(abc.ABC, t.Generic[SessionType]):
         pass
 
     @abc.abstractmethod
-    def queryby(self, session: SessionType, model: t.Type[ModelType], **filters: t.Any) -> t.List[ModelType]:
-        """Query records with filter criteria."""
+    def queryby(self, session: SessionType, model: t.Type[ModelType], *where: Expression, **filters: t.Any) -> t.List[ModelType]:
+        """Query records with filter criteria (keyword operators and AND/OR expressions)."""
         pass
 
     @abc.abstractmethod
-    def queryoneby(self, session: SessionType, model: t.Type[ModelType], **kwargs: t.Any) -> t.Optional[ModelType]:
+    def queryoneby(self, session: SessionType, model: t.Type[ModelType], *where: Expression, **kwargs: t.Any) -> t.Optional[ModelType]:
         """Query a single record with filter criteria."""
         pass
 
@@ -49,14 +52,26 @@ class DBAdapter(abc.ABC, t.Generic[SessionType]):
         """Query a record by its ID."""
         pass
 
+    @abc.abstractmethod
+    def querypage(
+        self,
+        session: SessionType,
+        model: t.Type[ModelType],
+        page: int = 1,
+        hits: int = 25,
+        **options: t.Any
+    ) -> t.Tuple[t.List[ModelType], int]:
+        """Query one page of records and the total match count (`sortby`, `orderby`, `where`, filters)."""
+        pass
+
     @abc.abstractmethod
     def additem(self, session: SessionType, item: t.Any) -> t.Any:
         """Add an item to the database."""
         pass
 
     @abc.abstractmethod
-    def updateitem(self, session: SessionType, item: t.Any) -> t.Any:
-        """Update an item in the database."""
+    def updateitem(self, session: SessionType, item: t.Any, changes: t.Optional[t.Dict[str, t.Any]] = None) -> t.Any:
+        """Update an item in the database, optionally restricted to explicit column changes."""
         pass
 
     @abc.abstractmethod
@@ -65,16 +80,66 @@ class DBAdapter(abc.ABC, t.Generic[SessionType]):
         pass
 
     @abc.abstractmethod
-    def bulkadd(self, session: SessionType, *items: t.Any) -> t.List[t.Any]:
-        """Add multiple items to the database in a single transaction."""
+    def bulkadd(
+        self,
+        session: SessionType,
+        *items: t.Any,
+        chunksize: t.Optional[int] = None,
+        commit: CommitPolicy = ONCE,
+        collect: bool = True
+    ) -> t.Union[t.List[t.Any], int]:
+        """Add multiple items to the database.
+
+        Accepts `*items` or a single iterable (e.g. a generator), consumed
+        `chunksize` items at a time; `commit` chooses one transaction (ONCE)
+        or a commit per chunk (PERCHUNK). With `collect=False` only the count
+        is returned, so written items are not kept alive.
+        """
+        pass
+
+    @abc.abstractmethod
+    def bulkupdate(
+        self,
+        session: SessionType,
+        *items: t.Any,
+        chunksize: t.Optional[int] = None,
+        commit: CommitPolicy = ONCE,
+        collect: bool = True
+    ) -> t.Union[t.List[t.Any], int]:
+        """Update multiple items in the database, chunked like `bulkadd`."""
+        pass
+
+    @abc.abstractmethod
+    def bulkdelete(
+        self,
+        session: SessionType,
+        *items: t.Any,
+        chunksize: t.Optional[int] = None,
+        commit: CommitPolicy = ONCE
+    ) -> bool:
+        """Delete multiple items from the database, chunked like `bulkadd`."""
         pass
 
     @abc.abstractmethod
-    def bulkupdate(self, session: SessionType, *items: t.Any) -> t.List[t.Any]:
-        """Update multiple items in the database in a single transaction."""
+    def aggregate(
+        self,
+        session: SessionType,
+        model: t.Type[ModelType],
+        *where: Expression,
+        groupby: t.Sequence[str] = (),
+        astuples: bool = False,
+        **kwargs: t.Any
+    ) -> t.List[AggregateRow]:
+        """Compute grouped aggregates (count/sum/avg/min/max) inside the database."""
         pass
 
     @abc.abstractmethod
-    def bulkdelete(self, session: SessionType, *items: t.Any) -> bool:
-        """Delete multiple items from the database in a single transaction."""
+    def iterpages(
+        self,
+        session: SessionType,
+        model: t.Type[ModelType],
+        hits: int = 25,
+        **options: t.Any
+    ) -> t.Iterator[t.List[ModelType]]:
+        """Iterate all matching records in pages of `hits` (`sortby`, `orderby`, `where`, filters)."""
         pass
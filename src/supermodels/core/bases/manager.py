@@ -9,6 +9,8 @@ from __future__ import annotations
 import abc, typing as t
 
 from supermodels.core.models.tvars import SessionType, ModelType
+from supermodels.core.filters import Expression, AND
+from supermodels.core.aggregates import AggregateRow
 from supermodels.core.bases.adapter import DBAdapter
 from supermodels.core.metas.manager import ManagerMeta
 from supermodels.core.utils.decorators import registeroperations
@@ -36,10 +38,12 @@ class BaseManager(abc.ABC, metaclass=ManagerMeta):
     def _getinstancemodel(self, item: t.Any) -> t.Type[t.Any]:
         """Get the model class for a given instance."""
         itype = type(item)
-        if (self.__models__ and itype in self.__models__):
+        managed = (self.__models__ or ((self.__model__,) if self.__model__ else ()))
+        if itype in managed:
             return itype
-        elif (self.__model__ and isinstance(item, self.__model__)):
-            return self.__model__
+        resolved = ManagerMeta.ResolveModel(itype, tuple(managed))
+        if resolved is not None:
+            return resolved
         raise ValueError(
             f"""No model found for instance type '{itype.__name__}'.
             Available models: {
@@ -56,9 +60,11 @@ class BaseManager(abc.ABC, metaclass=ManagerMeta):
         """Add an item to the database."""
         return self.adapter.additem(self.session, item)
 
-    def update(self, item: t.Any) -> t.Any:
-        """Update an existing item in the database."""
-        return self.adapter.updateitem(self.session, item)
+    def update(self, item: t.Any, changes: t.Optional[t.Dict[str, t.Any]] = None) -> t.Any:
+        """Update an existing item in the database, optionally with explicit column changes."""
+        if changes is None:
+            return self.adapter.updateitem(self.session, item)
+        return self.adapter.updateitem(self.session, item, changes=changes)
 
     def delete(self, item: t.Any) -> bool:
         """Delete an item from the database."""
@@ -71,27 +77,43 @@ class BaseManager(abc.ABC, metaclass=ManagerMeta):
             raise ValueError("No model provided and no default model configured for this manager")
         return self.adapter.querybyid(self.session, m, id=id)
 
-    def getby(self, model: t.Optional[t.Type[ModelType]], **kwargs: t.Any) -> t.List[ModelType]:
+    def getby(self, model: t.Optional[t.Type[ModelType]], *where: Expression, **kwargs: t.Any) -> t.List[ModelType]:
         """Get items by filter criteria, optionally specifying model type."""
         m = model or self.__model__
         if not m:
             raise ValueError("No model provided and no default model configured for this manager")
 
-        result =  self.adapter.queryby(self.session, m, **kwargs)
+        result =  self.adapter.queryby(self.session, m, *where, **kwargs)
         return t.cast(t.List[ModelType], result)
 
+    def querypage(
+        self,
+        model: t.Optional[t.Type[ModelType]],
+        *where: Expression,
+        page: int = 1,
+        hits: int = 25,
+        **options: t.Any
+    ) -> t.Tuple[t.List[ModelType], int]:
+        """Get one page of items and the total match count; options: `sortby`, `orderby` and filters."""
+        m = model or self.__model__
+        if not m:
+            raise ValueError("No model provided and no default model configured for this manager")
+        if where:
+            options['where'] = (where[0] if len(where) == 1 else AND(*where))
+        return self.adapter.querypage(self.session, m, page=page, hits=hits, **options) # type: ignore
+
     ## BULK ##
-    def bulkadd(self, *items: t.Any) -> t.List[t.Any]:
-        """Add multiple items in bulk."""
-        return self.adapter.bulkadd(self.session, *items)
+    def bulkadd(self, *items: t.Any, **options: t.Any) -> t.Union[t.List[t.Any], int]:
+        """Add multiple items (or one iterable) in bulk; options: `chunksize`, `commit`, `collect`."""
+        return self.adapter.bulkadd(self.session, *items, **options)
 
-    def bulkupdate(self, *items: t.Any) -> t.List[t.Any]:
-        """Update multiple items in bulk."""
-        return self.adapter.bulkupdate(self.session, *items)
+    def bulkupdate(self, *items: t.Any, **options: t.Any) -> t.Union[t.List[t.Any], int]:
+        """Update multiple items (or one iterable) in bulk; options: `chunksize`, `commit`, `collect`."""
+        return self.adapter.bulkupdate(self.session, *items, **options)
 
-    def bulkdelete(self, *items: t.Any) -> bool:
-        """Delete multiple items in bulk."""
-        return self.adapter.bulkdelete(self.session, *items)
+    def bulkdelete(self, *items: t.Any, **options: t.Any) -> bool:
+        """Delete multiple items (or one iterable) in bulk; options: `chunksize`, `commit`."""
+        return self.adapter.bulkdelete(self.session, *items, **options)
 
     ## ADVANCED QUERYING ##
     def getall(self, model: t.Optional[t.Type[ModelType]] = None) -> t.List[ModelType]:
@@ -101,12 +123,33 @@ class BaseManager(abc.ABC, metaclass=ManagerMeta):
             raise ValueError("No model provided and no default model configured for this manager")
         return self.adapter.queryall(self.session, m) # type: ignore
 
-    def getone(self, model: t.Optional[t.Type[ModelType]], **kwargs: t.Any) -> t.Optional[ModelType]:
+    def getone(self, model: t.Optional[t.Type[ModelType]], *where: Expression, **kwargs: t.Any) -> t.Optional[ModelType]:
         """Get single item by filter criteria, optionally specifying model type."""
         m = model or self.__model__
         if not m:
             raise ValueError("No model provided and no default model configured for this manager")
-        return self.adapter.queryoneby(self.session, m, **kwargs)
+        return self.adapter.queryoneby(self.session, m, *where, **kwargs)
+
+    def aggregate(
+        self,
+        model: t.Optional[t.Type[ModelType]],
+        *where: Expression,
+        groupby: t.Sequence[str] = (),
+        astuples: bool = False,
+        **kwargs: t.Any
+    ) -> t.List[AggregateRow]:
+        """Compute grouped aggregates (e.g. `sum='amount', count=True`) in the database."""
+        m = model or self.__model__
+        if not m:
+            raise ValueError("No model provided and no default model configured for this manager")
+        return self.adapter.aggregate(self.session, m, *where, groupby=groupby, astuples=astuples, **kwargs)
+
+    def iterpages(self, model: t.Optional[t.Type[ModelType]] = None, **options: t.Any) -> t.Iterator[t.List[ModelType]]:
+        """Iterate all matching items page by page, with the next page prefetched where supported."""
+        m = model or self.__model__
+        if not m:
+            raise ValueError("No model provided and no default model configured for this manager")
+        return self.adapter.iterpages(self.session, m, **options)
 
     ## SESSION MANAGEMENT ##
     def close(self) -> None:
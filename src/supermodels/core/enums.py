@@ -0,0 +1,20 @@
+# ~/supermodels/src/supermodels/core/enums.py
+"""
+Core Enumerations
+
+Enums shared by all database adapters.
+"""
+from __future__ import annotations
+import enum
+
+class CommitPolicy(str, enum.Enum):
+    """When chunked bulk operations commit.
+
+    ONCE writes every chunk in a single transaction (all or nothing);
+    PERCHUNK commits after each chunk, so a failure keeps earlier chunks.
+    """
+    ONCE = "once"
+    PERCHUNK = "perchunk"
+
+ONCE = CommitPolicy.ONCE
+PERCHUNK = CommitPolicy.PERCHUNK
@@ -0,0 +1,127 @@
+# ~/supermodels/src/supermodels/core/filters.py
+"""
+Filter Expressions
+
+Framework-agnostic filter expression layer. Keyword filters such as
+`age__gte=18`, `id__in=[1, 2]` or `name__startswith='jo'` are parsed into
+conditions that adapters compile to their native query language, and
+`AND`/`OR` groups combine them.
+"""
+from __future__ import annotations
+import operator, typing as t, dataclasses as dcs
+
+SEPARATOR = '__'
+
+Comparators: t.Dict[str, t.Callable[[t.Any, t.Any], bool]] = {
+    'eq': operator.eq,
+    'ne': operator.ne,
+    'lt': operator.lt,
+    'lte': operator.le,
+    'gt': operator.gt,
+    'gte': operator.ge,
+    'in': lambda a, b: a in b,
+    'notin': lambda a, b: a not in b,
+    'startswith': lambda a, b: a.startswith(b),
+    'endswith': lambda a, b: a.endswith(b),
+    'contains': lambda a, b: b in a,
+    'isnull': lambda a, b: ((a is None) == bool(b)),
+}
+
+OPERATORS = frozenset(Comparators)
+
+
+@dcs.dataclass(frozen=True)
+class Condition:
+    """A single `field <op> value` comparison."""
+    field: str
+    op: str
+    value: t.Any
+
+    def __post_init__(self) -> None:
+        if self.op not in OPERATORS:
+            raise ValueError(f"Unknown filter operator '{self.op}'. Available operators: {sorted(OPERATORS)}")
+        if (self.op in ('in', 'notin')) and isinstance(self.value, (str, bytes)):
+            raise ValueError(f"Filter operator '{self.op}' on '{self.field}' requires a collection, got {type(self.value).__name__}")
+
+
+@dcs.dataclass(frozen=True)
+class Group:
+    """Conditions or nested groups joined by AND or OR."""
+    conjunction: t.Literal['and', 'or']
+    children: t.Tuple['Expression', ...]
+
+
+Expression = t.Union[Condition, Group]
+
+
+def parsekey(key: str) -> t.Tuple[str, str]:
+    """Split a filter key like `age__gte` into `(field, operator)`; bare keys mean equality."""
+    field, sep, op = key.rpartition(SEPARATOR)
+    if sep and field and (op in OPERATORS):
+        return field, op
+    return key, 'eq'
+
+
+def parsefilters(*where: Expression, **filters: t.Any) -> Group:
+    """Combine positional expressions and keyword filters into one AND group."""
+    conditions = [Condition(*parsekey(k), v) for k, v in filters.items()]
+    return Group('and', (*where, *conditions))
+
+
+def AND(*where: Expression, **filters: t.Any) -> Group:
+    """Group expressions and keyword filters that must all match."""
+    if not (where or filters):
+        raise ValueError("AND() requires at least one expression or filter")
+    return parsefilters(*where, **filters)
+
+
+def OR(*where: Expression, **filters: t.Any) -> Group:
+    """Group expressions and keyword filters of which at least one must match."""
+    if not (where or filters):
+        raise ValueError("OR() requires at least one expression or filter")
+    conditions = [Condition(*parsekey(k), v) for k, v in filters.items()]
+    return Group('or', (*where, *conditions))
+
+
+def fields(expr: Expression) -> t.Iterator[str]:
+    """Iterate every field referenced by an expression."""
+    if isinstance(expr, Condition):
+        yield expr.field
+    else:
+        for child in expr.children:
+            yield from fields(child)
+
+
+def equalities(expr: Expression) -> t.Dict[str, t.Any]:
+    """Get top-level `field == value` conditions of an AND group (used for index lookups)."""
+    if isinstance(expr, Condition):
+        return ({expr.field: expr.value} if expr.op == 'eq' else {})
+    if expr.conjunction != 'and':
+        return {}
+    return {
+        child.field: child.value
+        for child in expr.children
+        if isinstance(child, Condition) and (child.op == 'eq')
+    }
+
+
+def evaluate(expr: Expression, item: t.Any) -> bool:
+    """Evaluate an expression against an object in Python.
+
+    Comparisons against None follow SQL semantics and never match, except
+    through `isnull` (and `eq`/`ne` with a None value).
+    """
+    if isinstance(expr, Group):
+        if expr.conjunction == 'and':
+            return all(evaluate(child, item) for child in expr.children)
+        return any(evaluate(child, item) for child in expr.children)
+
+    value = getattr(item, expr.field, None)
+    if (expr.op == 'isnull') or ((expr.op in ('eq', 'ne')) and (expr.value is None)):
+        return Comparators[expr.op](value, expr.value)
+    if value is None:
+        return False
+    try:
+        return Comparators[expr.op](value, expr.value)
+    except TypeError:
+        return False
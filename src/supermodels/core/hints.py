@@ -14,3 +14,5 @@ if t.TYPE_CHECKING:
 MetaModelRegistry = t.Dict[t.Type[t.Any], t.Type['BaseManager']]
 
 ManagerInstanceRegistry = t.Dict[t.Type[t.Any], 'BaseManager']
+
+ResolutionIndex = t.Dict[t.Tuple[t.Type[t.Any], t.Optional[t.Tuple[t.Type[t.Any], ...]]], t.Optional[t.Type[t.Any]]]
@@ -7,7 +7,7 @@ method dispatch and model registration. Provides the primary user interface
 for context-managed database operations.
 """
 from __future__ import annotations
-import typing as t
+import contextlib, contextvars, typing as t
 
 from supermodels.core.models.tvars import SessionType
 from supermodels.core.bases.adapter import DBAdapter
@@ -18,22 +18,39 @@ if t.TYPE_CHECKING:
    from sqlalchemy.engine import Engine as SQLAEngine
 
 
+# contexts entered with `with manager:`, keyed by id of the Manager; each value
+# is replaced, never mutated, so copied contexts (threads, tasks) stay independent
+_entered: contextvars.ContextVar[t.Dict[int, t.Tuple[ManagerContext, ...]]] = contextvars.ContextVar('supermodels.entered', default={})
+
+# adapter set by `Manager.scoped`, taking precedence over the process-wide default
+_scopedadapter: contextvars.ContextVar[t.Optional[DBAdapter]] = contextvars.ContextVar('supermodels.scopedadapter', default=None)
+
+
 class Manager:
     """Main manager factory for creating database operation contexts.
 
     Provides factory methods for different database adapters and supports
     global default adapter configuration via __getitem__.
+
+    A single Manager can be shared by threads and asyncio tasks: the contexts
+    opened with `with manager:` are kept in a module context variable keyed
+    by manager, so each thread or task sees only its own (possibly nested) active contexts.
     """
     _defaultadapter: t.Optional[DBAdapter] = None
 
     def __init__(self, adapter: t.Optional[DBAdapter[SessionType]] = None, *models: t.Type[t.Any]) -> None:
-        """Initialize manager with adapter or use global default."""
-        _adapter = (adapter or self._defaultadapter)
+        """Initialize manager with adapter or use the scoped or global default."""
+        _adapter = (adapter or _scopedadapter.get() or self._defaultadapter)
         if not _adapter:
             raise ValueError("No adapter provided and no default adapter configured")
         self.adapter: DBAdapter = _adapter
         self.models = models
-        self._context: t.Optional[ManagerContext] = None
+
+    @property
+    def context(self) -> t.Optional[ManagerContext]:
+        """The innermost context the current thread or task entered with `with manager:`."""
+        stack = _entered.get().get(id(self))
+        return (stack[-1] if stack else None)
 
     def __enter__(self) -> 'ManagerContext':
         """Enter context manager mode using models provided during init."""
@@ -41,15 +58,20 @@ class Manager:
             raise ValueError("At least one model must be provided")
         if (len(self.models) != len(set(self.models))):
             raise ValueError("Duplicate models provided")
-        self._context = self(*self.models)
-        return self._context.__enter__()
+        context = self(*self.models)
+        entered = context.__enter__()
+        stacks = _entered.get()
+        _entered.set({**stacks, id(self): (*stacks.get(id(self), ()), context)})
+        return entered
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Exit context manager mode."""
-        if self._context:
-            result = self._context.__exit__(exc_type, exc_val, exc_tb)
-            self._context = None
-            return result
+        stacks = dict(_entered.get())
+        stack = stacks.pop(id(self), ())
+        if stack:
+            if len(stack) > 1: stacks[id(self)] = stack[:-1]
+            _entered.set(stacks)
+            return stack[-1].__exit__(exc_type, exc_val, exc_tb)
 
     def __call__(self, *models: t.Type[t.Any]) -> 'ManagerContext':
         """Create a ManagerContext for the specified models."""
@@ -74,6 +96,16 @@ class Manager:
         cls._defaultadapter = adapter
         return cls
 
+    @classmethod
+    @contextlib.contextmanager
+    def scoped(cls, adapter: DBAdapter) -> t.Iterator[t.Type['Manager']]:
+        """Use an adapter as the default for Managers created in the current thread or task only."""
+        token = _scopedadapter.set(adapter)
+        try:
+            yield cls
+        finally:
+            _scopedadapter.reset(token)
+
     @classmethod
     def SQLA(cls, engine: 'SQLAEngine') -> 'Manager':
         """Factory method for SQLAlchemy adapter."""
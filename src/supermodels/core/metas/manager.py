@@ -4,11 +4,15 @@ Manager Metaclass
 
 Metaclass for automatic model-to-manager registration. When manager classes
 are defined, they automatically register which models they handle.
+Lookups resolve subclasses of registered models through their MRO, cached
+per concrete type.
 """
 from __future__ import annotations
-import abc, typing as t
+import abc, threading, itertools, typing as t
 
-from supermodels.core.hints import MetaModelRegistry
+from supermodels.core.hints import MetaModelRegistry, ResolutionIndex
+
+_MISSING = object()
 
 if t.TYPE_CHECKING:
    from supermodels.core.bases.manager import BaseManager
@@ -19,9 +23,21 @@ class ManagerMeta(abc.ABCMeta):
     When a manager class is created with __model__ or __models__ attributes,
     this metaclass automatically registers those models in a global registry.
     This enables dynamic manager lookup at runtime.
+
+    Resolutions (concrete type -> nearest registered model in its MRO) are
+    cached in a bounded snapshot dict that is never mutated once published,
+    so readers use it without locking. A miss builds a new snapshot under
+    the lock and publishes it with one assignment, but only if no
+    registration happened while it was computed (tracked by a generation
+    counter), so a stale resolution is never cached; registering a manager
+    resets the cache.
     """
 
     _modelregistry: MetaModelRegistry = {}
+    _resolved: ResolutionIndex = {}
+    _resolvecapacity: int = 4096
+    _generation: int = 0
+    _resolvelock = threading.Lock()
 
     def __new__(cls, name: str, bases: tuple, attrs: dict): #! should add return hint
         """Create new manager class and register its models."""
@@ -48,18 +64,54 @@ class ManagerMeta(abc.ABCMeta):
 
         for managed in managing:
             cls._modelregistry[managed] = t.cast(t.Type['BaseManager'], newclass)
+        cls.Invalidate()
 
         return newclass
 
+    @classmethod
+    def Invalidate(cls) -> None:
+        """Drop all cached resolutions (after the registry changed)."""
+        with cls._resolvelock:
+            ManagerMeta._generation += 1
+            ManagerMeta._resolved = {}
+
+    @classmethod
+    def ResolveModel(
+        cls,
+        itype: t.Type[t.Any],
+        models: t.Optional[t.Tuple[t.Type[t.Any], ...]] = None
+    ) -> t.Optional[t.Type[t.Any]]:
+        """Get the nearest class in a type's MRO that is a registered model.
+
+        With `models`, resolves against those classes instead of the global
+        registry (e.g. the models of one context or manager).
+        """
+        key = (itype, models)
+        resolved = ManagerMeta._resolved.get(key, _MISSING)
+        if resolved is not _MISSING:
+            return resolved
+
+        generation = ManagerMeta._generation
+        pool = (cls._modelregistry if models is None else models)
+        resolved = next((base for base in getattr(itype, '__mro__', (itype,)) if base in pool), None)
+        with cls._resolvelock:
+            if ManagerMeta._generation == generation:
+                cache = ManagerMeta._resolved
+                if len(cache) >= cls._resolvecapacity: # evict the oldest resolutions
+                    cache = dict(itertools.islice(cache.items(), len(cache) - cls._resolvecapacity + 1, None))
+                ManagerMeta._resolved = {**cache, key: resolved}
+        return resolved
+
     @classmethod
     def GetModelManager(cls, model: t.Type[t.Any]) -> t.Optional[t.Type['BaseManager']]:
-        """Get the manager class registered for a model type."""
-        return cls._modelregistry.get(model)
+        """Get the manager class registered for a model type or its nearest registered base."""
+        resolved = cls.ResolveModel(model)
+        return (None if resolved is None else cls._modelregistry.get(resolved))
 
     @classmethod
     def GetInstanceMangager(cls, instance: t.Any) -> t.Optional[t.Type['BaseManager']]:
-        """Get the manager class registered for an instance's type."""
-        return cls._modelregistry.get(type(instance))
+        """Get the manager class registered for an instance's type or its nearest registered base."""
+        return cls.GetModelManager(type(instance))
 
     @classmethod
     def GetManager(cls, obj: t.Union[t.Type[t.Any], t.Any]) -> t.Optional[t.Type['BaseManager']]:
@@ -72,3 +124,10 @@ class ManagerMeta(abc.ABCMeta):
     def GetRegistry(cls) -> MetaModelRegistry:
         """Get a copy of the complete model registry."""
         return cls._modelregistry.copy()
+
+    @classmethod
+    def ResetRegistry(cls, registry: t.Optional[MetaModelRegistry] = None) -> None:
+        """Replace the model registry (e.g. with a `GetRegistry` copy), clearing it by default."""
+        cls._modelregistry.clear()
+        cls._modelregistry.update(registry or {})
+        cls.Invalidate()
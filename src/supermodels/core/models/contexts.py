@@ -7,14 +7,31 @@ dispatch. Provides context-managed interfaces that automatically route
 operations to appropriate managers based on object types.
 """
 from __future__ import annotations
-import typing as t
+import threading, contextlib, contextvars, typing as t, dataclasses as dcs
 
 from supermodels.core.hints import ManagerInstanceRegistry
 from supermodels.core.models.tvars import SessionType
 from supermodels.core.bases.adapter import DBAdapter
 from supermodels.core.bases.manager import BaseManager
 from supermodels.core.metas.manager import ManagerMeta
-from supermodels.core.utils.decorators import registeroperations
+from supermodels.core.models.loader import BatchLoader
+from supermodels.core.utils.decorators import registeroperations, agnosticops
+
+
+@dcs.dataclass
+class ContextStats:
+    """Counters of contexts entered and the sessions/managers they created.
+
+    Sessions and managers are created lazily, so `sessions < entered` shows
+    contexts that never touched the database.
+    """
+    entered: int = 0
+    sessions: int = 0
+    managers: int = 0
+
+
+# read operation run by `gather`, given its own context
+GatherCall = t.Callable[['ManagerContext'], t.Any]
 
 
 @registeroperations
@@ -24,31 +41,123 @@ class ManagerContext(t.Generic[SessionType]):
     Provides a context-managed interface for database operations that automatically
     routes method calls to appropriate managers based on object types. Supports
     both default CRUD operations and custom model-specific operations.
+
+    The session is created on first use inside the context and each manager on
+    the first operation for its model; `stats` (per context) and `totals`
+    (process wide) count what was actually created.
     """
+    totals: t.ClassVar[ContextStats] = ContextStats()
+    _totalslock: t.ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self, adapter: DBAdapter[SessionType], *models: t.Type[t.Any]) -> None:
         """Initialize context with adapter and models to manage."""
         self.adapter = adapter
         self.models = models
-        self.session: t.Optional[SessionType] = None
+        self.stats = ContextStats()
+        self._session: t.Optional[SessionType] = None
+        self._active = False
         self._managersregistry: ManagerInstanceRegistry = {}
 
-    def __enter__(self) -> t.Self:
-        """Enter context and create session with manager instances."""
-        self.session = self.adapter.createsession()
+    def _record(self, counter: str) -> None:
+        """Increment a counter on this context and on the process-wide totals."""
+        setattr(self.stats, counter, getattr(self.stats, counter) + 1)
+        with self._totalslock:
+            setattr(self.totals, counter, getattr(self.totals, counter) + 1)
 
-        for model in self.models:
-            managerclass = ManagerMeta.GetModelManager(model)
-            if managerclass:
-                self._managersregistry[model] = managerclass(self.session, self.adapter)
+    @property
+    def session(self) -> t.Optional[SessionType]:
+        """The context's session, created on first access inside the context."""
+        if (self._session is None) and self._active:
+            self._session = self.adapter.createsession()
+            self._record('sessions')
+        return self._session
+
+    @session.setter
+    def session(self, value: t.Optional[SessionType]) -> None:
+        self._session = value
 
+    def __enter__(self) -> t.Self:
+        """Enter context; the session and managers are created on first use."""
+        self._active = True
+        self._record('entered')
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Exit context and clean up session."""
-        if self.session:
+        """Exit context and clean up session, if one was created."""
+        self._active = False
+        if self._session:
             if exc_type:
-                self.session.rollback() # type: ignore
-            self.adapter.closesession(self.session)
+                self._session.rollback() # type: ignore
+            self.adapter.closesession(self._session)
+            self._session = None
+        self._managersregistry.clear()
+
+    @contextlib.contextmanager
+    def batch(self, key: str = 'id', chunksize: int = 500) -> t.Iterator[BatchLoader]:
+        """Open a batch scope in which `get` requests are loaded together.
+
+        Sync code collects futures and reads them after the scope (or calls
+        `result()`, which dispatches early); async code awaits `aload`, and
+        requests made in the same event loop tick share one query per model:
+
+            with ctx.batch() as loader:
+                futures = [loader.load(User, id) for id in ids]
+            users = [f.result() for f in futures]
+
+        If the scope raises, pending requests fail with its exception instead
+        of being loaded.
+        """
+        loader = BatchLoader(self, key, chunksize)
+        try:
+            yield loader
+        except BaseException as e:
+            loader.fail(e)
+            raise
+        loader.dispatch()
+
+    def _isolated(self, call: GatherCall) -> t.Any:
+        """Run a call in a fresh read-only context (own session) for the same adapter and models."""
+        with ReadOnlyContext(self.adapter, *self.models) as context:
+            return call(context)
+
+    def gather(self, *calls: GatherCall, workers: t.Optional[int] = None) -> t.List[t.Any]:
+        """Run independent read operations concurrently and return their results in order.
+
+        Each call receives its own ManagerContext, with its own session, and
+        runs on a worker thread, so latency approaches the slowest call rather
+        than the sum: `users, page = ctx.gather(lambda c: c.getby(User, active=True),
+        lambda c: c.querypage(Order, page=2))`. Calls must not depend on each
+        other or on this context's uncommitted changes. Each call gets a
+        `ReadOnlyContext`: `add`/`update`/`delete` raise ValueError and its
+        session is rolled back before closing. The first failing call's
+        exception is raised once all calls have finished.
+        """
+        if len(calls) <= 1:
+            return [self._isolated(call) for call in calls]
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=(workers or len(calls)), thread_name_prefix='supermodels-gather') as pool:
+            futures = [pool.submit(contextvars.copy_context().run, self._isolated, call) for call in calls]
+        return [future.result() for future in futures]
+
+    async def agather(self, *calls: GatherCall) -> t.List[t.Any]:
+        """Awaitable `gather`: runs each call in the event loop's default executor."""
+        import asyncio
+        loop = asyncio.get_running_loop()
+        futures = [
+            loop.run_in_executor(None, contextvars.copy_context().run, self._isolated, call)
+            for call in calls
+        ]
+        return list(await asyncio.gather(*futures))
+
+    def _getmodelmanager(self, model: t.Type[t.Any]) -> t.Optional[BaseManager]:
+        """Get (instantiating on first use) the manager for one of the context's models."""
+        manager = self._managersregistry.get(model)
+        if (manager is None) and (model in self.models):
+            managerclass = ManagerMeta.GetModelManager(model)
+            if managerclass:
+                manager = self._managersregistry[model] = managerclass(self.session, self.adapter)
+                self._record('managers')
+        return manager
 
     def _getmanager(self, item: t.Any) -> BaseManager:
         """Get the appropriate manager for an item instance."""
@@ -56,12 +165,33 @@ class ManagerContext(t.Generic[SessionType]):
             raise ValueError("Cannot get manager for None item")
 
         itype = type(item)
+        manager = self._managersregistry.get(itype)
+        if manager is not None:
+            return manager
+
+        model = ManagerMeta.ResolveModel(itype, self.models)
+        if (model is not None) and ((manager := self._getmodelmanager(model)) is not None):
+            return manager
 
-        if (itype in self._managersregistry):
-            return self._managersregistry[itype]
+        raise ValueError(f"No manager found for type '{itype.__name__}'. Available types: {[t.__name__ for t in self.models]}")
 
-        for model, manager in self._managersregistry.items():
-            if isinstance(item, model):
-                return manager
 
-        raise ValueError(f"No manager found for type '{itype.__name__}'. Available types: {[t.__name__ for t in self._managersregistry.keys()]}")
+class ReadOnlyContext(ManagerContext[SessionType]):
+    """Context handed to `gather` calls: rejects writes and discards its session's changes.
+
+    `add`, `update` and `delete` raise ValueError, and the session is rolled
+    back before it is closed. Custom model operations are not inspected, so
+    one that commits by itself is not undone.
+    """
+
+    def _dispatch(self, opname: str, *args, **kwargs) -> t.Any:
+        """Route operations like ManagerContext, refusing the write operations."""
+        if opname in agnosticops:
+            raise ValueError(f"Cannot perform '{opname}': context is read-only")
+        return super()._dispatch(opname, *args, **kwargs)
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Roll back the session, if one was created, then exit as usual."""
+        if self._session:
+            self._session.rollback() # type: ignore
+        return super().__exit__(exc_type, exc_val, exc_tb)
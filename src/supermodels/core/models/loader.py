@@ -0,0 +1,158 @@
+# ~/supermodels/src/supermodels/core/models/loader.py
+"""
+Batch Loader
+
+DataLoader-style batching of `get` calls: requests made within one batch
+scope (sync) or one event loop tick (async) are deduplicated and resolved
+with a single `id__in` query per model instead of one SELECT per call.
+"""
+from __future__ import annotations
+import contextvars, typing as t
+from concurrent.futures import Future
+
+from supermodels.core.utils.chunks import chunked
+
+if t.TYPE_CHECKING:
+    import asyncio
+    from supermodels.core.models.contexts import ManagerContext
+
+# (model, id) a request was made for
+LoadKey = t.Tuple[t.Type[t.Any], t.Any]
+# (model, ids, items or the error their query raised) for one dispatched chunk
+Fetched = t.Tuple[t.Type[t.Any], t.List[t.Any], t.Union[t.Sequence[t.Any], BaseException]]
+
+
+class BatchFuture(Future):
+    """Future for a batched `get`; asking for its result dispatches the pending batch."""
+
+    def __init__(self, loader: 'BatchLoader') -> None:
+        super().__init__()
+        self._loader = loader
+
+    def result(self, timeout: t.Optional[float] = None) -> t.Any:
+        if not self.done():
+            self._loader.dispatch()
+        return super().result(timeout)
+
+
+class BatchLoader:
+    """Collects `get(model, id)` requests and loads them in one query per model.
+
+    Results are cached for the lifetime of the loader, so repeated requests
+    for the same id (in the same or a later batch) reuse the first result.
+    A loader belongs to one context and is not meant to be shared between
+    threads.
+    """
+
+    def __init__(self, context: 'ManagerContext', key: str = 'id', chunksize: int = 500) -> None:
+        """Initialize loader for a context; `key` is the attribute ids are matched on.
+
+        At most `chunksize` ids go into one `id__in` query, keeping each under
+        the database's bound parameter limit.
+        """
+        if chunksize < 1:
+            raise ValueError(f"Batch chunksize must be positive, got {chunksize}")
+        self.context = context
+        self.key = key
+        self.chunksize = chunksize
+        self.queries = 0
+        self._futures: t.Dict[LoadKey, BatchFuture] = {}
+        self._pending: t.Dict[t.Type[t.Any], t.List[t.Any]] = {}
+        self._waiters: t.Dict[LoadKey, t.List['asyncio.Future']] = {}
+        self._scheduled = False
+
+    def load(self, model: t.Type[t.Any], id: t.Any) -> BatchFuture:
+        """Request an item; the returned future resolves when the batch is dispatched."""
+        future = self._futures.get((model, id))
+        if future is None:
+            future = self._futures[(model, id)] = BatchFuture(self)
+            self._pending.setdefault(model, []).append(id)
+        return future
+
+    def loadmany(self, model: t.Type[t.Any], ids: t.Iterable[t.Any]) -> t.List[BatchFuture]:
+        """Request several items of one model."""
+        return [self.load(model, id) for id in ids]
+
+    async def aload(self, model: t.Type[t.Any], id: t.Any) -> t.Any:
+        """Request an item and await it; requests made in the same tick share one query.
+
+        The queries run in the event loop's default executor, so the loop
+        keeps serving other tasks while the batch loads.
+        """
+        import asyncio
+        future = self.load(model, id)
+        if future.done():
+            return future.result()
+
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        self._waiters.setdefault((model, id), []).append(waiter)
+        if not self._scheduled:
+            self._scheduled = True
+            loop.create_task(self._adispatch())
+        return await waiter
+
+    def dispatch(self) -> None:
+        """Run `id__in` queries (one per model and chunk) for pending requests and resolve their futures."""
+        self._resolve(self._fetch(self._take()))
+
+    def fail(self, error: BaseException) -> None:
+        """Fail pending requests with an error instead of loading them."""
+        for model, ids in self._take().items():
+            for id in ids:
+                self._settle((model, id), error=error)
+
+    async def _adispatch(self) -> None:
+        """Dispatch on the loop's default executor; futures are resolved back on the loop."""
+        import asyncio
+        loop = asyncio.get_running_loop()
+        pending = self._take()
+        fetched = await loop.run_in_executor(None, contextvars.copy_context().run, self._fetch, pending)
+        self._resolve(fetched)
+
+    def _take(self) -> t.Dict[t.Type[t.Any], t.List[t.Any]]:
+        """Detach the pending requests so later loads start a new batch."""
+        self._scheduled = False
+        pending, self._pending = self._pending, {}
+        return pending
+
+    def _fetch(self, pending: t.Dict[t.Type[t.Any], t.List[t.Any]]) -> t.List[Fetched]:
+        """Run the queries for detached requests, capturing each chunk's items or error."""
+        fetched: t.List[Fetched] = []
+        for model, pendingids in pending.items():
+            for ids in chunked(pendingids, self.chunksize):
+                try:
+                    items = self.context.getby(model, **{f'{self.key}__in': ids})
+                    self.queries += 1
+                except Exception as e:
+                    fetched.append((model, ids, e))
+                    continue
+                fetched.append((model, ids, items))
+        return fetched
+
+    def _resolve(self, fetched: t.List[Fetched]) -> None:
+        """Settle the requests of fetched chunks."""
+        for model, ids, items in fetched:
+            if isinstance(items, BaseException):
+                for id in ids:
+                    self._settle((model, id), error=items)
+                continue
+            found = {getattr(item, self.key): item for item in items}
+            for id in ids:
+                self._settle((model, id), found.get(id))
+
+    def _settle(self, key: LoadKey, value: t.Any = None, error: t.Optional[BaseException] = None) -> None:
+        """Resolve the future (and any async waiters) for one request."""
+        future = self._futures[key]
+        if error is not None:
+            future.set_exception(error)
+            self._futures.pop(key) # failed requests are retried by the next load
+        else:
+            future.set_result(value)
+        for waiter in self._waiters.pop(key, ()):
+            if waiter.cancelled():
+                continue
+            if error is not None:
+                waiter.set_exception(error)
+            else:
+                waiter.set_result(value)
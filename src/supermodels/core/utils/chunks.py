@@ -0,0 +1,45 @@
+# ~/supermodels/src/supermodels/core/utils/chunks.py
+"""
+Chunking
+
+Helpers letting bulk operations take either `*items` or one iterable
+(including generators) and consume it in bounded chunks.
+"""
+from __future__ import annotations
+import itertools, collections.abc as cabc, typing as t
+
+from supermodels.core.metas.manager import ManagerMeta
+
+# iterable single arguments still treated as one item rather than a collection of items
+_SCALARS = (str, bytes, bytearray, cabc.Mapping)
+
+
+def bulkitems(items: t.Tuple[t.Any, ...]) -> t.Iterable[t.Any]:
+    """Items of a bulk call: `op(a, b, c)` or `op(iterable)`.
+
+    A single iterable argument is unpacked unless it is a string, bytes, a
+    mapping or an instance of a registered model (e.g. an iterable pydantic
+    model).
+    """
+    if len(items) != 1:
+        return items
+    item = items[0]
+    if (not isinstance(item, cabc.Iterable)) or isinstance(item, _SCALARS):
+        return items
+    if ManagerMeta.GetInstanceMangager(item) is not None:
+        return items
+    return item
+
+
+def chunked(items: t.Iterable[t.Any], size: t.Optional[int] = None) -> t.Iterator[t.List[t.Any]]:
+    """Yield lists of at most `size` items (all items at once when `size` is None)."""
+    if size is None:
+        chunk = list(items)
+        if chunk:
+            yield chunk
+        return
+    if size < 1:
+        raise ValueError(f"Bulk chunksize must be positive, got {size}")
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
@@ -14,7 +14,9 @@ if t.TYPE_CHECKING:
 
 
 agnosticops = {'add', 'update', 'delete'}
-defaultops = agnosticops | {'get', 'getby'}
+defaultops = agnosticops | {'get', 'getby', 'querypage', 'aggregate'}
+
+_opmethods: t.Dict[str, t.Callable] = {}
 
 def createopmethod(opname: str) -> t.Callable:
     """Create a bound method for an operation."""
@@ -24,69 +26,142 @@ def createopmethod(opname: str) -> t.Callable:
     return opmethod
 
 
+def opmethod(opname: str) -> t.Callable:
+    """Get the shared (cached) operation method for an operation name."""
+    method = _opmethods.get(opname)
+    if method is None:
+        method = _opmethods.setdefault(opname, createopmethod(opname))
+    return method
+
+
+def _agnostichandler(opname: str) -> t.Callable:
+    """Build a handler routing an instance-first operation to its manager."""
+    def handler(ctx, *args, **kwargs):
+        try:
+            manager = ctx._getmanager(args[0])
+            return getattr(manager, opname)(*args, **kwargs)
+        except Exception as e:
+            raise ValueError(f"Cannot perform '{opname}': {e}")
+    return handler
+
+
+def _modelhandler(opname: str) -> t.Callable:
+    """Build a handler routing a model-first operation (get/getby/querypage/aggregate) to its manager."""
+    def handler(ctx, *args, **kwargs):
+        model = args[0]
+        if not isinstance(model, type):
+            raise ValueError(f"Operation '{opname}' requires model class as first argument, got {type(model).__name__}")
+        manager = ctx._getmodelmanager(model)
+        if manager is None:
+            raise ValueError(f"No manager registered for model '{model.__name__}'")
+        try:
+            return getattr(manager, opname)(*args, **kwargs)
+        except Exception as e:
+            raise ValueError(f"Cannot perform '{opname}': {e}")
+    return handler
+
+
+def _customhandler(opname: str, method: t.Callable) -> t.Callable:
+    """Build a handler calling a model's custom operation with the context session."""
+    def handler(ctx, *args, **kwargs):
+        try:
+            return method(ctx.session, *args, **kwargs)
+        except Exception as e:
+            raise RuntimeError(f"Error executing custom operation '{opname}': {e}")
+    return handler
+
+
+_defaulthandlers: t.Dict[str, t.Callable] = {
+    opname: (_agnostichandler(opname) if opname in agnosticops else _modelhandler(opname))
+    for opname in defaultops
+}
+
+
+class OpTable:
+    """Precompiled operation dispatch table for one ordered set of models.
+
+    Maps every operation name (defaults plus custom `__super__` operations)
+    to its handler, so dispatch is a single dict lookup. Tables are cached
+    per model tuple and rebuilt if a model's `__super__` is reassigned.
+    """
+    _cache: t.Dict[t.Tuple[t.Type[t.Any], ...], 'OpTable'] = {}
+
+    def __init__(self, models: t.Tuple[t.Type[t.Any], ...]) -> None:
+        """Compile handlers for the given models."""
+        self.models = models
+        self.supers = tuple(getattr(model, '__super__', None) for model in models)
+        self.handlers: t.Dict[str, t.Callable] = dict(_defaulthandlers)
+
+        customops = set()
+        for model in models:
+            if getattr(model, '__super__', None):
+                customops.update(model.__super__)
+        self.customops = frozenset(customops - defaultops)
+
+        # custom operations resolve to the first model (in context order) defining them
+        for opname in sorted(self.customops):
+            for model in models:
+                if hasattr(model, opname):
+                    self.handlers[opname] = _customhandler(opname, getattr(model, opname))
+                    break
+
+    def current(self, models: t.Tuple[t.Type[t.Any], ...]) -> bool:
+        """Whether the table still reflects the models' `__super__` declarations."""
+        for model, declared in zip(models, self.supers):
+            if getattr(model, '__super__', None) is not declared:
+                return False
+        return True
+
+    @classmethod
+    def Get(cls, models: t.Tuple[t.Type[t.Any], ...]) -> 'OpTable':
+        """Get the cached table for a model tuple, compiling it on first use."""
+        table = cls._cache.get(models)
+        if (table is None) or (not table.current(models)):
+            table = cls._cache[models] = cls(models)
+        return table
+
+
 def _registerforctx(cls) -> t.Type['ManagerContext']:
     """Decorator to register CRUD and custom operations on ManagerContext.
 
-    Automatically adds default CRUD operations (add, update, delete, get, getby)
-    and any custom operations defined in model __super__ attributes.
+    Default CRUD operations (add, update, delete, get, getby, querypage,
+    aggregate) are added as class methods once; custom operations from model
+    `__super__` attributes are resolved through a cached per-model-set
+    OpTable, so constructing a context only looks up that table.
     """
     def dispatch(self, opname: str, *args, **kwargs) -> t.Any:
         """Route operations to appropriate managers or model methods."""
         if not args:
             raise ValueError(f"Operation '{opname}' requires at least one argument")
-
-        if (opname in defaultops):
-            if opname in agnosticops:
-                try:
-                    manager = self._getmanager(args[0])
-                    return getattr(manager, opname)(*args, **kwargs)
-                except Exception as e:
-                    raise ValueError(f"Cannot perform '{opname}': {e}")
-            else:
-                # handle get/getby
-                model = args[0]
-                if not isinstance(model, type):
-                    raise ValueError(f"Operation '{opname}' requires model class as first argument, got {type(model).__name__}")
-                if (model not in self._managersregistry):
-                    raise ValueError(f"No manager registered for model '{model.__name__}'")
-
-                try:
-                    manager = self._managersregistry[model]
-                    return getattr(manager, opname)(*args, **kwargs)
-                except Exception as e:
-                    raise ValueError(f"Cannot perform '{opname}': {e}")
-
-        for model in self.models:
-            if hasattr(model, opname):
-                try:
-                    method = getattr(model, opname)
-                    return method(self.session, *args, **kwargs)
-                except Exception as e:
-                    raise RuntimeError(f"Error executing custom operation '{opname}': {e}")
-
-        raise AttributeError(f"Operation '{opname}' not found in any registered models")
-
+        handler = self._optable.handlers.get(opname)
+        if handler is None:
+            raise AttributeError(f"Operation '{opname}' not found in any registered models")
+        return handler(self, *args, **kwargs)
+
+    def getattribute(self, name: str) -> t.Any:
+        """Resolve custom operations on first access and cache the bound method."""
+        table = self.__dict__.get('_optable')
+        if (table is None) or (name not in table.customops):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        bound = opmethod(name).__get__(self, type(self))
+        self.__dict__[name] = bound
+        return bound
+
+    for opname in defaultops:
+        if not hasattr(cls, opname):
+            setattr(cls, opname, opmethod(opname))
 
     oginit = cls.__init__
-
-    def initialize(self, adapter, *models):
-        import types
-
-        oginit(self, adapter, *models)
-
-        customops = set()
-        for model in models:
-            if hasattr(model, '__super__') and model.__super__:
-                customops.update(model.__super__)
-
-        for opname in (defaultops | customops):
-            if not hasattr(self, opname):
-                method = createopmethod(opname)
-                bound = types.MethodType(method, self) # bind to instance
-                setattr(self, opname, bound)
+    if not getattr(oginit, '__registered__', False):
+        def initialize(self, adapter, *models):
+            oginit(self, adapter, *models)
+            self._optable = OpTable.Get(self.models)
+        initialize.__registered__ = True # type: ignore
+        cls.__init__ = initialize
 
     cls._dispatch = dispatch
-    cls.__init__ = initialize
+    if '__getattr__' not in cls.__dict__:
+        cls.__getattr__ = getattribute
 
     return cls
 
@@ -147,6 +222,11 @@ def _registerforbase(cls) -> t.Type['BaseManager']:
     return cls
 
 
+def _derives(cls: t.Type, module: str, name: str) -> bool:
+    """Check whether a class is (or subclasses) the class `module.name`."""
+    return any(((base.__module__ == module) and (base.__name__ == name)) for base in cls.__mro__)
+
+
 @t.overload
 def registeroperations(cls: t.Type['ManagerContext']) -> t.Type['ManagerContext']: ...
 
@@ -162,12 +242,10 @@ def registeroperations(cls: t.Type):
     - ManagerContext: Operations route through manager registry
     - BaseManager: Operations route directly to class methods or models
     """
-    from supermodels.core.bases.manager import BaseManager
-    from supermodels.core.models.contexts import ManagerContext
-
-    if issubclass(cls, ManagerContext):
+    # matched by qualified name: the decorator runs while these modules are still initializing
+    if _derives(cls, 'supermodels.core.models.contexts', 'ManagerContext'):
         return _registerforctx(cls)
-    elif issubclass(cls, BaseManager):
+    elif _derives(cls, 'supermodels.core.bases.manager', 'BaseManager'):
         return _registerforbase(cls)
     else:
         raise TypeError(f"registeroperations can only be applied to BaseManager or ManagerContext subclasses, got {cls}")
@@ -0,0 +1,40 @@
+# ~/supermodels/src/supermodels/core/utils/lazymodules.py
+"""
+Lazy Modules
+
+Module `__getattr__`/`__dir__` for packages whose public names are imported
+on first access, so importing the package stays cheap.
+
+Packages import `TYPE_CHECKING` from here rather than from `typing`, which
+would load typing at startup; type checkers treat any `TYPE_CHECKING` name
+as true, so names imported under it stay visible to them and to IDEs.
+"""
+from __future__ import annotations
+import sys, importlib
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing as t
+
+
+def lazymodule(name: str, lazy: t.Dict[str, str]) -> t.Tuple[t.Callable[[str], object], t.Callable[[], t.List[str]]]:
+    """Build `(__getattr__, __dir__)` for module `name` importing `lazy` names from their modules.
+
+    Use as `__getattr__, __dir__ = lazymodule(__name__, _lazy)`; each name is
+    imported once and then cached on the module.
+    """
+    module = sys.modules[name]
+
+    def __getattr__(attr: str) -> object:
+        """Import public names from their modules on first access."""
+        if attr in lazy:
+            value = getattr(importlib.import_module(lazy[attr]), attr)
+            setattr(module, attr, value)
+            return value
+        raise AttributeError(f"module {name!r} has no attribute {attr!r}")
+
+    def __dir__() -> t.List[str]:
+        return sorted(set(vars(module)) | set(getattr(module, '__all__', ())))
+
+    return __getattr__, __dir__
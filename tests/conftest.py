@@ -3,6 +3,14 @@ import pytest
 from tests.fixtures.models import User, Order
 from tests.fixtures.managers import UserManager, OrderManager
 from tests.fixtures.adapters import MockAdapter
+from supermodels.core.metas.manager import ManagerMeta
+
+@pytest.fixture(autouse=True)
+def isolated_registry():
+    """Restore the global model registry after tests that define managers"""
+    saved = ManagerMeta.GetRegistry()
+    yield
+    ManagerMeta.ResetRegistry(saved)
 
 @pytest.fixture
 def mock_adapter():
@@ -19,3 +27,10 @@ def sample_order():
 @pytest.fixture
 def sample_models():
     return (User, Order)
+
+@pytest.fixture
+def sqla_engine(tmp_path):
+    from tests.fixtures.tables import make_engine
+    engine = make_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    yield engine
+    engine.dispose()
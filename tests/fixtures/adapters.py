@@ -1,5 +1,5 @@
 # ~/supermodels/tests/fixtures/adapters.py
-from typing import Type, Optional, List, Any
+from typing import Type, Optional, List, Tuple, Iterator, Any
 from supermodels.core.bases.adapter import DBAdapter
 
 class MockSession:
@@ -44,6 +44,12 @@ class MockAdapter(DBAdapter[MockSession]):
     def querybyid(self, session: MockSession, model: Type[Any], **kwargs) -> Optional[Any]:
         return model(id=kwargs.get('id', 1))
 
+    def querypage(self, session: MockSession, model: Type[Any], page: int = 1, hits: int = 25, **kwargs) -> Tuple[List[Any], int]:
+        return [model(id=((page - 1) * hits) + 1)], (page * hits)
+
+    def iterpages(self, session: MockSession, model: Type[Any], hits: int = 25, **kwargs) -> Iterator[List[Any]]:
+        return iter([])
+
     def additem(self, session: MockSession, item: Any) -> Any:
         self.added_items.append(item)
         session.commit()
@@ -58,3 +64,21 @@ class MockAdapter(DBAdapter[MockSession]):
         self.deleted_items.append(item)
         session.commit()
         return True
+
+    def bulkadd(self, session: MockSession, *items: Any) -> List[Any]:
+        self.added_items.extend(items)
+        session.commit()
+        return list(items)
+
+    def bulkupdate(self, session: MockSession, *items: Any) -> List[Any]:
+        self.updated_items.extend(items)
+        session.commit()
+        return list(items)
+
+    def bulkdelete(self, session: MockSession, *items: Any) -> bool:
+        self.deleted_items.extend(items)
+        session.commit()
+        return True
+
+    def aggregate(self, session: MockSession, model: Type[Any], *where, groupby=(), astuples: bool = False, **kwargs) -> List[Any]:
+        return []
@@ -0,0 +1,61 @@
+import dataclasses as dcs
+import typing as t
+from datetime import datetime
+
+from sqlalchemy import create_engine, Column, Integer, String, Float
+from sqlalchemy.orm import declarative_base
+from supermodels.core.bases.manager import BaseManager
+from supermodels.adapters.sqla.typer import DCType
+from supermodels.converters.codecs import BinaryCodec
+
+@dcs.dataclass
+class Section:
+    heading: str
+    words: t.List[str] = dcs.field(default_factory=list)
+
+@dcs.dataclass
+class Profile:
+    name: str
+    created: datetime
+    sections: t.List[Section] = dcs.field(default_factory=list)
+    rating: t.Optional[float] = None
+
+Base = declarative_base()
+
+class Event(Base):
+    __tablename__ = 'events'
+    id = Column(Integer, primary_key=True)
+    kind = Column(String, nullable=False)
+    payload = Column(String)
+
+class Account(Base):
+    __tablename__ = 'accounts'
+    id = Column(Integer, primary_key=True)
+    tenant = Column(String, nullable=False)
+    name = Column(String, unique=True)
+    age = Column(Integer)
+    balance = Column(Float, default=0.0)
+
+class Document(Base):
+    __tablename__ = 'documents'
+    id = Column(Integer, primary_key=True)
+    title = Column(String)
+    profile = Column(DCType(Profile))
+    packed = Column(DCType(Profile, codec=BinaryCodec(compress=64)))
+    deferred = Column(DCType(Profile, lazy=True))
+    watched = Column(DCType(Profile, tracked=True))
+    journal = Column(DCType(Profile, lazy=True, tracked=True))
+
+class EventManager(BaseManager):
+    __model__ = Event
+
+class AccountManager(BaseManager):
+    __model__ = Account
+
+class DocumentManager(BaseManager):
+    __model__ = Document
+
+def make_engine(url: str):
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    return engine
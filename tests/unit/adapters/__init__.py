@@ -0,0 +1 @@
+# ~/supermodels/tests/unit/adapters/__init__.py
@@ -0,0 +1 @@
+# ~/supermodels/tests/unit/adapters/memory/__init__.py
@@ -0,0 +1,202 @@
+import pytest
+from supermodels.core.manager import Manager
+from supermodels.adapters.memory import MemoryAdapter
+from supermodels.adapters.sqla import ASC, DESC
+from tests.fixtures.models import User, Order
+
+class TestMemoryAdapter:
+
+    @pytest.fixture
+    def adapter(self):
+        return MemoryAdapter(indexes={User: ['email']}, sortable={Order: ['amount']})
+
+    @pytest.fixture
+    def session(self, adapter):
+        return adapter.createsession()
+
+    def test_add_assigns_ids(self, adapter, session):
+        """Test additem assigns autoincrement IDs"""
+        first = adapter.additem(session, User(name='a'))
+        second = adapter.additem(session, User(id=10, name='b'))
+        third = adapter.additem(session, User(name='c'))
+
+        assert (first.id, second.id, third.id) == (1, 10, 11)
+        assert adapter.querybyid(session, User, id=10) is second
+
+    def test_duplicate_id_raises_error(self, adapter, session):
+        """Test adding an existing primary key raises error"""
+        adapter.additem(session, User(id=1))
+        with pytest.raises(ValueError):
+            adapter.additem(session, User(id=1))
+
+    def test_indexed_queryby_avoids_scan(self, adapter, session):
+        """Test equality on an indexed field is served by the hash index"""
+        adapter.bulkadd(session, *[User(name=f'u{i}', email=f'u{i}@x') for i in range(100)])
+        table = adapter.table(User)
+
+        assert table.lookup('email', 'u42@x') == {43: None}
+        assert [u.name for u in adapter.queryby(session, User, email='u42@x')] == ['u42']
+        assert [u.name for u in adapter.queryby(session, User, email='u42@x', name='other')] == []
+
+    def test_unindexed_queryby_scans(self, adapter, session):
+        """Test filters on unindexed fields still match"""
+        adapter.bulkadd(session, User(name='a'), User(name='b'), User(name='a'))
+        assert len(adapter.queryby(session, User, name='a')) == 2
+        assert adapter.queryoneby(session, User, name='b').name == 'b'
+        assert adapter.queryoneby(session, User, name='z') is None
+
+    def test_update_reindexes(self, adapter, session):
+        """Test updates move items between index buckets"""
+        user = adapter.additem(session, User(name='a', email='old@x'))
+
+        user.email = 'new@x'
+        adapter.updateitem(session, user)
+
+        assert adapter.queryby(session, User, email='old@x') == []
+        assert adapter.queryby(session, User, email='new@x') == [user]
+
+        adapter.updateitem(session, user, changes={'email': 'newer@x'})
+        assert adapter.queryby(session, User, email='newer@x') == [user]
+
+    def test_update_moves_changed_primary_key(self, adapter, session):
+        """Test a changed id re-keys the row instead of storing it twice"""
+        user, other = adapter.bulkadd(session, User(name='a', email='a@x'), User(name='b'))
+
+        user.id = 10
+        adapter.updateitem(session, user)
+        assert sorted(u.id for u in adapter.queryall(session, User)) == [other.id, 10]
+        assert adapter.querybyid(session, User, id=10) is user
+        assert adapter.queryby(session, User, email='a@x') == [user]
+        assert adapter.additem(session, User(name='c')).id == 11
+
+        with pytest.raises(ValueError):
+            adapter.updateitem(session, user, changes={'id': other.id})
+        assert user.id == 10
+
+    def test_delete(self, adapter, session):
+        """Test deletes remove items and index entries"""
+        users = adapter.bulkadd(session, User(email='a'), User(email='b'))
+
+        assert adapter.deleteitem(session, users[0])
+        assert not adapter.deleteitem(session, users[0])
+        assert adapter.queryby(session, User, email='a') == []
+        assert adapter.bulkdelete(session, users[1])
+        assert adapter.queryall(session, User) == []
+
+    def test_bulkadd_is_atomic(self, adapter, session):
+        """Test bulkadd stores nothing if any item is rejected"""
+        adapter.additem(session, User(id=5))
+        with pytest.raises(ValueError):
+            adapter.bulkadd(session, User(id=6), User(id=5))
+        assert [u.id for u in adapter.queryall(session, User)] == [5]
+
+    def test_bulkadd_iterable_perchunk(self, adapter, session):
+        """Test bulkadd takes a generator and PERCHUNK keeps chunks before a rejected one"""
+        from supermodels.core.enums import PERCHUNK
+        adapter.additem(session, User(id=5))
+
+        with pytest.raises(ValueError):
+            adapter.bulkadd(session, (User(id=i) for i in (1, 2, 3, 5)), chunksize=2, commit=PERCHUNK)
+
+        assert sorted(u.id for u in adapter.queryall(session, User)) == [1, 2, 5]
+        assert adapter.bulkadd(session, iter([User(id=8), User(id=9)]), collect=False) == 2
+
+    @pytest.mark.parametrize('orderby', [ASC, DESC])
+    def test_querypage_sorted_index(self, adapter, session, orderby):
+        """Test paging over a sorted index"""
+        amounts = [5, 3, 9, 1, 7, 2, 8]
+        adapter.bulkadd(session, *[Order(user_id=(a % 2), amount=a) for a in amounts])
+        expected = sorted(amounts, reverse=(orderby == DESC))
+
+        items, total = adapter.querypage(session, Order, page=2, hits=3, sortby='amount', orderby=orderby)
+        assert [o.amount for o in items] == expected[3:6]
+        assert total == 7
+
+        items, total = adapter.querypage(session, Order, page=1, hits=10, sortby='amount', orderby=orderby, user_id=1)
+        assert [o.amount for o in items] == [a for a in expected if a % 2]
+        assert total == 5
+
+    def test_querypage_unindexed_sort(self, adapter, session):
+        """Test paging sorts in Python when no sorted index is declared"""
+        adapter.bulkadd(session, *[User(name=n) for n in 'dbca'])
+        items, total = adapter.querypage(session, User, page=1, hits=2, sortby='name', orderby=ASC)
+        assert [u.name for u in items] == ['a', 'b']
+        assert total == 4
+
+    def test_iterpages(self, adapter, session):
+        """Test walking all matching rows page by page"""
+        adapter.bulkadd(session, *[Order(user_id=(a % 2), amount=a) for a in range(1, 8)])
+
+        pages = list(adapter.iterpages(session, Order, hits=2, sortby='amount', user_id=1))
+        assert [[o.amount for o in page] for page in pages] == [[1, 3], [5, 7]]
+        with pytest.raises(ValueError):
+            adapter.iterpages(session, Order, hits=0)
+
+    @pytest.mark.parametrize('sortby', ['amount', 'user_id'])
+    def test_querypage_explicit_nulls(self, adapter, session, sortby):
+        """Test nullsfirst moves None values on sorted and unsorted fields"""
+        adapter.bulkadd(session, Order(user_id=2, amount=2), Order(user_id=None, amount=None), Order(user_id=1, amount=1))
+
+        items, _ = adapter.querypage(session, Order, sortby=sortby, orderby=ASC, nullsfirst=False)
+        assert [getattr(o, sortby) for o in items] == [1, 2, None]
+        items, _ = adapter.querypage(session, Order, sortby=sortby, orderby=DESC, nullsfirst=True)
+        assert [getattr(o, sortby) for o in items] == [None, 2, 1]
+
+    def test_sorted_index_follows_updates(self, adapter, session):
+        """Test sorted index stays ordered after updates and deletes"""
+        orders = adapter.bulkadd(session, *[Order(amount=a) for a in (1, 2, 3)])
+        adapter.updateitem(session, orders[0], changes={'amount': 10})
+        adapter.deleteitem(session, orders[1])
+
+        items, _ = adapter.querypage(session, Order, sortby='amount', orderby=DESC)
+        assert [o.amount for o in items] == [10, 3]
+
+    def test_drop_in_with_manager(self, adapter):
+        """Test adapter works through Manager contexts"""
+        with Manager(adapter)(User, Order) as mgr:
+            user = mgr.add(User(name='x', email='x@x'))
+            mgr.add(Order(user_id=user.id, amount=1.0))
+            assert mgr.get(User, user.id) is user
+            assert mgr.getby(User, email='x@x') == [user]
+            assert mgr.delete(user)
+
+    def test_operators_and_groups(self, adapter, session):
+        """Test filter operators evaluate in memory"""
+        from supermodels.core.filters import AND, OR
+        adapter.bulkadd(session, *[User(name=n, email=(f'{n}@x' if n != 'c' else None)) for n in 'abcd'])
+
+        assert [u.name for u in adapter.queryby(session, User, email__in=['a@x', 'd@x'])] == ['a', 'd']
+        assert [u.name for u in adapter.queryby(session, User, id__in=[2, 3, 99])] == ['b', 'c']
+        assert [u.name for u in adapter.queryby(session, User, email__isnull=True)] == ['c']
+        assert [u.name for u in adapter.queryby(session, User, OR(AND(name='a'), AND(name='d')), id__gt=1)] == ['d']
+
+        items, total = adapter.querypage(session, User, sortby='name', orderby=ASC, where=OR(AND(name='b'), AND(name='c')))
+        assert [u.name for u in items] == ['b', 'c'] and total == 2
+
+    def test_aggregate(self, adapter, session):
+        """Test aggregates computed in memory follow SQL semantics"""
+        adapter.bulkadd(session, *[Order(user_id=u, amount=a) for u, a in [(1, 5.0), (1, None), (2, 7.0)]])
+
+        rows = adapter.aggregate(session, Order, groupby=['user_id'], count=True, sum='amount', avg='amount')
+        assert rows == [
+            {'user_id': 1, 'count': 2, 'sum_amount': 5.0, 'avg_amount': 5.0},
+            {'user_id': 2, 'count': 1, 'sum_amount': 7.0, 'avg_amount': 7.0},
+        ]
+        assert adapter.aggregate(session, Order, max='amount', user_id=9) == [{'max_amount': None}]
+
+    def test_aggregate_keyword_clash_raises_error(self, adapter, session):
+        """Test a function keyword that is also a model field is rejected"""
+        from supermodels.core.filters import AND
+
+        class Tally:
+            id: int
+            count: int
+
+            def __init__(self, id=None, count=0):
+                self.id = id
+                self.count = count
+
+        adapter.bulkadd(session, Tally(count=1), Tally(count=3))
+        with pytest.raises(ValueError, match='ambiguous'):
+            adapter.aggregate(session, Tally, count=3)
+        assert adapter.aggregate(session, Tally, AND(count=3), sum='count') == [{'sum_count': 3}]
@@ -0,0 +1 @@
+# ~/supermodels/tests/unit/adapters/sharding/__init__.py
@@ -0,0 +1,218 @@
+import pytest
+from sqlalchemy import event
+from supermodels.core.manager import Manager
+from supermodels.adapters.sqla import SQLAAdapter, ASC, DESC
+from supermodels.adapters.sharding import ShardedAdapter, hashshards
+from tests.fixtures.tables import Account, make_engine
+
+TENANTS = {'acme': 'a', 'globex': 'b', 'initech': 'c'}
+
+class TestShardedAdapter:
+
+    @pytest.fixture
+    def engines(self, tmp_path):
+        engines = {name: make_engine(f"sqlite:///{tmp_path / f'{name}.db'}") for name in 'abc'}
+        yield engines
+        for engine in engines.values(): engine.dispose()
+
+    @pytest.fixture
+    def adapter(self, engines):
+        adapter = ShardedAdapter(
+            {name: SQLAAdapter(engine) for name, engine in engines.items()},
+            shardkey='tenant',
+            shardfunc=TENANTS.__getitem__,
+        )
+        yield adapter
+        adapter.shutdown()
+
+    @pytest.fixture
+    def seeded(self, adapter):
+        session = adapter.createsession()
+        accounts = [
+            Account(id=(i * 10) + n, tenant=tenant, name=f'{tenant}-{n}', age=(i * 10) + n)
+            for i, tenant in enumerate(TENANTS)
+            for n in range(5)
+        ]
+        adapter.bulkadd(session, *accounts)
+        session.close()
+        return adapter
+
+    def shardrows(self, engines, name):
+        with engines[name].connect() as conn:
+            return [row[0] for row in conn.exec_driver_sql('SELECT tenant FROM accounts')]
+
+    def test_writes_routed_to_one_shard(self, seeded, engines):
+        """Test items land only on the shard chosen by the shard function"""
+        for tenant, name in TENANTS.items():
+            assert set(self.shardrows(engines, name)) == {tenant}
+
+    def test_keyed_read_hits_one_shard(self, seeded, engines):
+        """Test reads filtered by shard key touch a single shard"""
+        touched = []
+        for name, engine in engines.items():
+            event.listen(engine, 'before_cursor_execute', lambda *a, name=name: touched.append(name))
+
+        session = seeded.createsession()
+        results = seeded.queryby(session, Account, tenant='globex')
+        session.close()
+
+        assert len(results) == 5
+        assert set(touched) == {'b'}
+
+    def test_unkeyed_read_gathers_all_shards(self, seeded):
+        """Test unkeyed queries merge results from every shard"""
+        session = seeded.createsession()
+        everything = seeded.queryall(session, Account)
+        filtered = seeded.queryby(session, Account, age=21)
+        session.close()
+
+        assert len(everything) == 15
+        assert [a.name for a in filtered] == ['initech-1']
+
+    def test_querybyid_scatters_without_key(self, seeded):
+        """Test id lookups search every shard unless keyed"""
+        session = seeded.createsession()
+        found = seeded.querybyid(session, Account, id=12)
+        keyed = seeded.querybyid(session, Account, id=12, tenant='acme')
+        session.close()
+
+        assert found.name == 'globex-2'
+        assert keyed is None
+
+    def test_querybyid_ambiguous_raises_error(self, seeded):
+        """Test unkeyed id lookups found on several shards are rejected"""
+        session = seeded.createsession()
+        seeded.additem(session, Account(id=12, tenant='acme', name='duplicate'))
+        with pytest.raises(ValueError, match='tenant'):
+            seeded.querybyid(session, Account, id=12)
+        assert seeded.querybyid(session, Account, id=12, tenant='acme').name == 'duplicate'
+        session.close()
+
+    @pytest.mark.parametrize('orderby', [ASC, DESC])
+    def test_querypage_nulls_match_merge(self, seeded, orderby):
+        """Test NULL sort values are ordered the same by every shard and the merge"""
+        session = seeded.createsession()
+        seeded.bulkadd(session, Account(id=50, tenant='acme', name='n-a'), Account(id=51, tenant='initech', name='n-c'))
+        items, _ = seeded.querypage(session, Account, hits=20, sortby='age', orderby=orderby)
+        session.close()
+
+        ages = [a.age for a in items]
+        expected = sorted(a for a in ages if a is not None)
+        assert ages == ([None, None] + expected if orderby == ASC else expected[::-1] + [None, None])
+
+    def test_querypage_explicit_nulls(self, seeded):
+        """Test the merge places NULLs where asked, whatever the shards' default"""
+        session = seeded.createsession()
+        seeded.bulkadd(session, Account(id=50, tenant='acme', name='n-a'), Account(id=51, tenant='initech', name='n-c'))
+        items, _ = seeded.querypage(session, Account, hits=20, sortby='age', orderby=ASC, nullsfirst=False)
+        session.close()
+
+        ages = [a.age for a in items]
+        assert ages == sorted(a for a in ages if a is not None) + [None, None]
+
+    def test_querypage_unknown_sortby_raises_error(self, seeded):
+        """Test unkeyed pages cannot merge on a field the model lacks"""
+        session = seeded.createsession()
+        with pytest.raises(ValueError):
+            seeded.querypage(session, Account, sortby='missing')
+        session.close()
+
+    def test_context_manager_shuts_down(self, engines):
+        """Test leaving a with block stops the scatter thread pool"""
+        with ShardedAdapter({'a': SQLAAdapter(engines['a'])}, shardkey='tenant') as adapter:
+            session = adapter.createsession()
+            adapter.queryall(session, Account)
+            session.close()
+        with pytest.raises(RuntimeError):
+            adapter._executor.submit(print)
+
+    @pytest.mark.parametrize('orderby', [ASC, DESC])
+    def test_querypage_global_sort(self, seeded, orderby):
+        """Test pagination sorts and slices across shards"""
+        session = seeded.createsession()
+        ages = sorted(range(0, 25), reverse=(orderby == DESC))
+        ages = [a for a in ages if a % 10 < 5]
+
+        pages = [seeded.querypage(session, Account, page=p, hits=4, sortby='age', orderby=orderby) for p in (1, 2, 4)]
+        session.close()
+
+        assert [a.age for a in pages[0][0]] == ages[0:4]
+        assert [a.age for a in pages[1][0]] == ages[4:8]
+        assert [a.age for a in pages[2][0]] == ages[12:15]
+        assert all(total == 15 for _, total in pages)
+
+    @pytest.mark.parametrize('orderby', [ASC, DESC])
+    @pytest.mark.parametrize('keyset', [False, True])
+    def test_iterpages_global_sort(self, seeded, orderby, keyset):
+        """Test page walks merge every shard in global order, NULLs like querypage"""
+        session = seeded.createsession()
+        seeded.bulkadd(session, Account(id=50, tenant='acme', name='n-a'), Account(id=51, tenant='initech', name='n-c'))
+        pages = list(seeded.iterpages(session, Account, hits=4, sortby='age', orderby=orderby, keyset=keyset))
+        expected, _ = seeded.querypage(session, Account, hits=20, sortby='age', orderby=orderby)
+        session.close()
+
+        assert [len(p) for p in pages] == [4, 4, 4, 4, 1]
+        assert [a.age for p in pages for a in p] == [a.age for a in expected]
+
+    def test_iterpages_keyed_one_shard(self, seeded, engines):
+        """Test page walks filtered by shard key run on a single shard"""
+        session = seeded.createsession()
+        pages = list(seeded.iterpages(session, Account, hits=2, tenant='globex'))
+        session.close()
+
+        assert [a.name for p in pages for a in p] == [f'globex-{n}' for n in range(5)]
+        with pytest.raises(ValueError):
+            seeded.iterpages(session, Account, sortby='missing')
+
+    def test_update_and_delete_routed(self, seeded):
+        """Test updates and deletes go to the item's shard"""
+        session = seeded.createsession()
+        account = seeded.queryoneby(session, Account, tenant='acme', name='acme-0')
+        account.age = 99
+        seeded.updateitem(session, account)
+        assert seeded.queryoneby(session, Account, tenant='acme', name='acme-0').age == 99
+
+        assert seeded.deleteitem(session, account)
+        assert seeded.queryoneby(session, Account, name='acme-0') is None
+        session.close()
+
+    def test_missing_shard_key_raises_error(self, adapter):
+        """Test items without a shard key value cannot be routed"""
+        session = adapter.createsession()
+        with pytest.raises(ValueError):
+            adapter.additem(session, Account(name='orphan'))
+        session.close()
+
+    def test_unknown_shard_raises_error(self, engines):
+        """Test shard functions returning unknown shards are rejected"""
+        adapter = ShardedAdapter({'a': SQLAAdapter(engines['a'])}, shardkey='tenant', shardfunc=lambda k: 'z')
+        with pytest.raises(ValueError):
+            adapter.route('acme')
+        adapter.shutdown()
+
+    def test_hashshards_is_stable(self):
+        """Test default shard function is deterministic and in range"""
+        shardfunc = hashshards(['a', 'b', 'c'])
+        assert shardfunc('acme') == hashshards(['a', 'b', 'c'])('acme')
+        assert {shardfunc(i) for i in range(100)} <= {'a', 'b', 'c'}
+
+    def test_drop_in_with_manager(self, seeded):
+        """Test sharded adapter works through Manager contexts"""
+        with Manager(seeded)(Account) as mgr:
+            mgr.add(Account(id=100, tenant='initech', name='new'))
+            found = mgr.getby(Account, tenant='initech')
+
+        assert len(found) == 6
+
+    def test_aggregate_combines_shards(self, seeded):
+        """Test aggregates merge exactly across shards, including AVG"""
+        session = seeded.createsession()
+        total = seeded.aggregate(session, Account, count=True, sum='age', avg='age', min='age', max='age')
+        keyed = seeded.aggregate(session, Account, groupby=['tenant'], count=True, tenant='acme')
+        grouped = seeded.aggregate(session, Account, groupby=['tenant'], avg='age', astuples=True)
+        session.close()
+
+        ages = [(i * 10) + n for i in range(3) for n in range(5)]
+        assert total == [{'count': 15, 'sum_age': sum(ages), 'avg_age': sum(ages) / 15, 'min_age': 0, 'max_age': 24}]
+        assert keyed == [{'tenant': 'acme', 'count': 5}]
+        assert sorted(grouped) == [('acme', 2.0), ('globex', 12.0), ('initech', 22.0)]
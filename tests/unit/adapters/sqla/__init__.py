@@ -0,0 +1 @@
+# ~/supermodels/tests/unit/adapters/sqla/__init__.py
@@ -0,0 +1,62 @@
+import pytest
+from supermodels.core.filters import OR
+from supermodels.adapters.sqla import SQLAAdapter, IndexAdvisor, createindex
+from supermodels.adapters.sqla.enums import ASC
+from tests.fixtures.tables import Account
+
+class TestIndexAdvisor:
+
+    @pytest.fixture
+    def adapter(self, sqla_engine):
+        return SQLAAdapter(sqla_engine, advisor=True)
+
+    def test_disabled_by_default(self, sqla_engine):
+        """Test no advisor is created unless requested"""
+        assert SQLAAdapter(sqla_engine).advisor is None
+
+    def test_shape(self):
+        """Test equality, range and sort columns are separated"""
+        shape = IndexAdvisor().shape(Account, OR(age__lt=18, age__gt=65), tenant='a', sortby='balance')
+
+        assert shape.equals == ('tenant',)
+        assert shape.ranges == ('age',)
+        assert shape.columns == ('tenant', 'age', 'balance')
+
+    def test_missing_with_frequency(self, adapter):
+        """Test unindexed filter shapes are reported most frequent first"""
+        session = adapter.createsession()
+        for _ in range(3):
+            adapter.queryby(session, Account, tenant='a', age__gte=18)
+        adapter.querypage(session, Account, sortby='balance', orderby=ASC)
+
+        report = adapter.advisor.report()
+
+        assert [(m.columns, m.frequency) for m in report.missing] == [(('tenant', 'age'), 3), (('balance',), 1)]
+        assert report.missing[0].share == pytest.approx(0.75)
+        session.close()
+
+    def test_covered_and_unused(self, adapter):
+        """Test declared indexes cover matching shapes and unused ones are listed"""
+        session = adapter.createsession()
+        adapter.queryoneby(session, Account, id=1)
+
+        report = adapter.advisor.report()
+
+        assert report.missing == []
+        assert [u.columns for u in report.unused] == [('name',)]
+
+        adapter.queryby(session, Account, name='u1')
+        assert adapter.advisor.report().unused == []
+        session.close()
+
+    def test_ddl(self, adapter):
+        """Test suggestions render CREATE INDEX without changing the table"""
+        session = adapter.createsession()
+        adapter.queryby(session, Account, tenant='a')
+
+        missing = adapter.advisor.report().missing[0]
+
+        assert missing.ddl(adapter.engine.dialect) == 'CREATE INDEX ix_accounts_tenant ON accounts (tenant)'
+        assert createindex(Account.__table__, ['tenant', 'age'], name='ix_x') == 'CREATE INDEX ix_x ON accounts (tenant, age)'
+        assert not Account.__table__.indexes
+        session.close()
@@ -0,0 +1,69 @@
+import pytest
+from sqlalchemy import event
+from supermodels.core.filters import OR, AND
+from supermodels.core.manager import Manager
+from supermodels.adapters.sqla import SQLAAdapter
+from tests.fixtures.tables import Account
+
+ROWS = [('a', 'u1', 10, 1.0), ('a', 'u2', 20, 2.0), ('a', 'u3', None, 3.0), ('b', 'u4', 40, 4.0), ('b', 'u5', 50, None)]
+
+class TestAggregate:
+
+    @pytest.fixture
+    def adapter(self, sqla_engine):
+        adapter = SQLAAdapter(sqla_engine)
+        session = adapter.createsession()
+        adapter.bulkadd(session, *[Account(tenant=t, name=n, age=a, balance=b) for t, n, a, b in ROWS])
+        session.close()
+        return adapter
+
+    @pytest.fixture
+    def session(self, adapter):
+        session = adapter.createsession()
+        yield session
+        session.close()
+
+    def test_grouped_aggregates(self, adapter, session):
+        """Test GROUP BY with several aggregate functions"""
+        rows = adapter.aggregate(session, Account, groupby=['tenant'], count=True, sum='age', avg='age', min='balance', max='balance')
+        rows = sorted(rows, key=lambda r: r['tenant'])
+
+        assert rows == [
+            {'tenant': 'a', 'count': 3, 'sum_age': 30, 'avg_age': 15.0, 'min_balance': 1.0, 'max_balance': 3.0},
+            {'tenant': 'b', 'count': 2, 'sum_age': 90, 'avg_age': 45.0, 'min_balance': 0.0, 'max_balance': 4.0},
+        ]
+
+    def test_ungrouped_with_filters(self, adapter, session):
+        """Test aggregates with filter operators and no grouping"""
+        assert adapter.aggregate(session, Account, count='age', age__gte=20) == [{'count_age': 3}]
+        assert adapter.aggregate(session, Account, OR(AND(name='u1'), AND(name='u5')), sum='age') == [{'sum_age': 60}]
+
+    def test_astuples(self, adapter, session):
+        """Test compact tuple results"""
+        rows = adapter.aggregate(session, Account, groupby=['tenant'], count=True, astuples=True)
+        assert sorted(rows) == [('a', 3), ('b', 2)]
+
+    def test_runs_single_group_by_statement(self, adapter, session, sqla_engine):
+        """Test aggregation is one GROUP BY query, not a table scan into Python"""
+        statements = []
+        event.listen(sqla_engine, 'before_cursor_execute', lambda c, cur, stmt, *a: statements.append(stmt))
+
+        adapter.aggregate(session, Account, groupby=['tenant'], sum='age')
+
+        assert len(statements) == 1
+        assert 'GROUP BY' in statements[0] and 'sum(' in statements[0]
+
+    def test_invalid_aggregates_raise_error(self, adapter, session):
+        """Test missing or malformed aggregates are rejected"""
+        with pytest.raises(ValueError):
+            adapter.aggregate(session, Account, groupby=['tenant'])
+        with pytest.raises(ValueError):
+            adapter.aggregate(session, Account, sum=True)
+        with pytest.raises(ValueError):
+            adapter.aggregate(session, Account, sum='missing')
+
+    def test_through_manager_context(self, adapter):
+        """Test aggregate dispatches through Manager contexts"""
+        with Manager(adapter)(Account) as mgr:
+            rows = mgr.aggregate(Account, groupby=['tenant'], count=True, tenant='b')
+        assert rows == [{'tenant': 'b', 'count': 2}]
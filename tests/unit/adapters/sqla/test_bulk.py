@@ -0,0 +1,202 @@
+import pytest
+from sqlalchemy import event
+from supermodels.adapters.sqla import SQLAAdapter
+from tests.fixtures.tables import Account
+
+class TestSafeBulk:
+
+    @pytest.fixture
+    def adapter(self, sqla_engine):
+        return SQLAAdapter(sqla_engine)
+
+    def names(self, adapter):
+        session = adapter.createsession()
+        try:
+            return sorted(a.name for a in session.query(Account).all())
+        finally:
+            session.close()
+
+    def test_clean_data_writes_all(self, adapter):
+        """Test resilient bulk add writes every row on clean data"""
+        session = adapter.createsession()
+        items = [Account(tenant='t', name=f'n{i}') for i in range(50)]
+
+        report = adapter.safebulkadd(session, *items, chunksize=8)
+        session.close()
+
+        assert report.ok
+        assert len(report.written) == 50
+        assert len(self.names(adapter)) == 50
+
+    def test_bad_rows_isolated(self, adapter):
+        """Test failing rows are reported and good rows committed"""
+        session = adapter.createsession()
+        items = [Account(tenant='t', name=f'n{i}') for i in range(40)]
+        items[7] = Account(tenant=None, name='bad-null')
+        items[29] = Account(tenant='t', name='n3')  # duplicate unique name
+
+        report = adapter.safebulkadd(session, *items, chunksize=16)
+        session.close()
+
+        assert [f.index for f in report.failures] == [7, 29]
+        assert report.failures[0].item is items[7]
+        assert len(report.written) == 38
+        assert len(self.names(adapter)) == 38
+        assert 'bad-null' not in self.names(adapter)
+
+    def test_savepoints_bound_round_trips(self, adapter, sqla_engine):
+        """Test a single bad row is found by bisection, not a full retry"""
+        session = adapter.createsession()
+        items = [Account(tenant='t', name=f'n{i}') for i in range(64)]
+        items[40] = Account(tenant=None, name='bad')
+
+        savepoints = []
+        event.listen(sqla_engine, 'savepoint', lambda conn, name: savepoints.append(name))
+
+        report = adapter.safebulkadd(session, *items, chunksize=64)
+        session.close()
+
+        assert [f.index for f in report.failures] == [40]
+        assert len(savepoints) <= 2 * 7
+
+    def test_bulk_update_reports_failures(self, adapter):
+        """Test resilient bulk update isolates constraint violations"""
+        session = adapter.createsession()
+        adapter.bulkadd(session, *[Account(tenant='t', name=f'n{i}') for i in range(5)])
+        loaded = session.query(Account).order_by(Account.id).all()
+        session.close()
+
+        for account in loaded:
+            account.age = 1
+        loaded[2].name = 'n0'
+
+        session = adapter.createsession()
+        report = adapter.safebulkupdate(session, *loaded, chunksize=2)
+        session.close()
+
+        assert [f.index for f in report.failures] == [2]
+        assert len(report.written) == 4
+
+    def test_invalid_chunksize_raises_error(self, adapter):
+        """Test non-positive chunksize raises error"""
+        session = adapter.createsession()
+        with pytest.raises(ValueError):
+            adapter.safebulkadd(session, Account(tenant='t'), chunksize=0)
+        session.close()
+
+    def test_accepts_generator(self, adapter):
+        """Test a generator argument is treated as the items, not as one item"""
+        session = adapter.createsession()
+
+        report = adapter.safebulkadd(session, (Account(tenant='t', name=f'g{i}') for i in range(6)), chunksize=4)
+        updated = adapter.safebulkupdate(session, iter(report.written))
+        session.close()
+
+        assert report.ok and updated.ok
+        assert len(report.written) == 6
+        assert len(self.names(adapter)) == 6
+
+
+class TestChunkedBulk:
+
+    @pytest.fixture
+    def adapter(self, sqla_engine):
+        return SQLAAdapter(sqla_engine)
+
+    def count(self, adapter):
+        session = adapter.createsession()
+        try:
+            return session.query(Account).count()
+        finally:
+            session.close()
+
+    def test_generator_in_chunks(self, adapter, sqla_engine):
+        """Test a generator is consumed lazily, one INSERT batch per chunk"""
+        consumed = []
+        def accounts():
+            for i in range(25):
+                consumed.append(i)
+                yield Account(tenant='t', name=f'g{i}')
+
+        flushes, inserted = [], []
+        def insert(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith('INSERT'):
+                inserted.append(len(consumed))
+        event.listen(sqla_engine, 'commit', lambda conn: flushes.append('commit'))
+        event.listen(sqla_engine, 'before_cursor_execute', insert)
+        session = adapter.createsession()
+
+        written = adapter.bulkadd(session, accounts(), chunksize=10)
+        session.close()
+        event.remove(sqla_engine, 'before_cursor_execute', insert)
+
+        assert len(written) == 25
+        assert consumed == list(range(25))
+        assert sorted(set(inserted)) == [10, 20, 25] # each chunk written before the next is drawn
+        assert self.count(adapter) == 25
+        assert flushes == ['commit']
+
+    def test_count_only(self, adapter):
+        """Test collect=False returns the number of rows written"""
+        session = adapter.createsession()
+
+        written = adapter.bulkadd(session, (Account(tenant='t', name=f'c{i}') for i in range(12)), chunksize=5, collect=False)
+        session.close()
+
+        assert written == 12
+
+    def test_once_rolls_back_everything(self, adapter):
+        """Test a failing chunk under ONCE discards every chunk"""
+        session = adapter.createsession()
+        items = [Account(tenant='t', name=f'o{i}') for i in range(10)]
+        items[7] = Account(tenant=None, name='bad')
+
+        with pytest.raises(Exception):
+            adapter.bulkadd(session, items, chunksize=3)
+        session.close()
+
+        assert self.count(adapter) == 0
+
+    def test_perchunk_keeps_committed_chunks(self, adapter):
+        """Test a failing chunk under PERCHUNK keeps earlier chunks"""
+        from supermodels.core.enums import PERCHUNK
+        session = adapter.createsession()
+        items = [Account(tenant='t', name=f'p{i}') for i in range(10)]
+        items[7] = Account(tenant=None, name='bad')
+
+        with pytest.raises(Exception):
+            adapter.bulkadd(session, iter(items), chunksize=3, commit=PERCHUNK)
+        session.close()
+
+        assert self.count(adapter) == 6
+
+    def test_update_and_delete_iterables(self, adapter):
+        """Test bulkupdate and bulkdelete accept iterables too"""
+        session = adapter.createsession()
+        accounts = adapter.bulkadd(session, [Account(tenant='t', name=f'u{i}') for i in range(6)])
+
+        for account in accounts:
+            account.age = 30
+        assert adapter.bulkupdate(session, iter(accounts), chunksize=4, collect=False) == 6
+        assert adapter.bulkdelete(session, (a for a in accounts), chunksize=4)
+        session.close()
+
+        assert self.count(adapter) == 0
+
+    def test_any_iterable_unpacked(self, adapter):
+        """Test a deque or a custom iterable argument is treated as the items"""
+        from collections import deque
+
+        class Batch:
+            def __init__(self, items):
+                self.items = items
+
+            def __iter__(self):
+                return iter(self.items)
+
+        session = adapter.createsession()
+        assert adapter.bulkadd(session, deque(Account(tenant='t', name=f'd{i}') for i in range(3)), collect=False) == 3
+        assert adapter.bulkadd(session, Batch([Account(tenant='t', name=f'b{i}') for i in range(4)]), collect=False) == 4
+        session.close()
+
+        assert self.count(adapter) == 7
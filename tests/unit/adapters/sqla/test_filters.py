@@ -0,0 +1,88 @@
+import pytest
+from sqlalchemy import event
+from supermodels.core.filters import AND, OR, Group
+from supermodels.adapters.sqla import SQLAAdapter, ASC
+from tests.fixtures.tables import Account
+
+class TestSQLAFilters:
+
+    @pytest.fixture
+    def adapter(self, sqla_engine):
+        adapter = SQLAAdapter(sqla_engine)
+        session = adapter.createsession()
+        adapter.bulkadd(session, *[
+            Account(tenant='t', name=name, age=age)
+            for name, age in [('alice', 30), ('bob', 17), ('carol', 70), ('al_x', None), ('dave', 45)]
+        ])
+        session.close()
+        return adapter
+
+    @pytest.fixture
+    def session(self, adapter):
+        session = adapter.createsession()
+        yield session
+        session.close()
+
+    def names(self, items):
+        return sorted(a.name for a in items)
+
+    @pytest.mark.parametrize('filters, expected', [
+        ({'age__gte': 45}, ['carol', 'dave']),
+        ({'age__lt': 18}, ['bob']),
+        ({'name__in': ['bob', 'dave', 'zed']}, ['bob', 'dave']),
+        ({'name__notin': ['bob', 'dave']}, ['al_x', 'alice', 'carol']),
+        ({'name__startswith': 'al'}, ['al_x', 'alice']),
+        ({'name__startswith': 'al_'}, ['al_x']),
+        ({'name__endswith': 'ol'}, ['carol']),
+        ({'name__contains': 'ob'}, ['bob']),
+        ({'age__isnull': True}, ['al_x']),
+        ({'age': None}, ['al_x']),
+        ({'age__ne': 30}, ['bob', 'carol', 'dave']),
+    ])
+    def test_operators(self, adapter, session, filters, expected):
+        """Test keyword operators filter in SQL"""
+        assert self.names(adapter.queryby(session, Account, **filters)) == expected
+
+    def test_or_groups(self, adapter, session):
+        """Test AND/OR groups compile to SQL"""
+        results = adapter.queryby(session, Account, OR(age__lt=18, age__gt=65), tenant='t')
+        assert self.names(results) == ['bob', 'carol']
+
+        nested = adapter.queryby(session, Account, OR(AND(age__gte=30, age__lte=45), name='bob'))
+        assert self.names(nested) == ['alice', 'bob', 'dave']
+
+    def test_filters_pushed_into_where_clause(self, adapter, session, sqla_engine):
+        """Test filtering happens in the database, not in Python"""
+        statements = []
+        event.listen(sqla_engine, 'before_cursor_execute', lambda c, cur, stmt, *a: statements.append(stmt))
+
+        adapter.queryby(session, Account, age__gte=18, name__in=['alice', 'dave'])
+
+        assert 'WHERE' in statements[-1]
+        assert 'accounts.age >=' in statements[-1]
+        assert 'IN' in statements[-1]
+
+    def test_empty_group_raises_error(self, adapter, session):
+        """Test empty groups are rejected instead of compiling to an ambiguous clause"""
+        with pytest.raises(ValueError):
+            adapter.queryby(session, Account, Group('or', ()))
+
+    def test_unknown_field_raises_error(self, adapter, session):
+        """Test unknown filter fields are rejected instead of ignored"""
+        with pytest.raises(ValueError):
+            adapter.queryby(session, Account, nickname='x')
+
+    def test_queryoneby_limits(self, adapter, session):
+        """Test queryoneby returns the first matching row"""
+        assert adapter.queryoneby(session, Account, name__startswith='car').name == 'carol'
+        assert adapter.queryoneby(session, Account, name='nobody') is None
+
+    def test_querypage_with_operators(self, adapter, session):
+        """Test pagination accepts operators and where groups"""
+        items, total = adapter.querypage(session, Account, hits=2, sortby='age', orderby=ASC, age__gte=18)
+        assert [a.name for a in items] == ['alice', 'dave']
+        assert total == 3
+
+        items, total = adapter.querypage(session, Account, sortby='age', orderby=ASC, where=OR(AND(name='bob'), AND(name='carol')))
+        assert [a.name for a in items] == ['bob', 'carol']
+        assert total == 2
@@ -0,0 +1,143 @@
+import time
+import threading
+import pytest
+from supermodels.core.manager import Manager
+from supermodels.adapters.sqla import SQLAAdapter, ASC, DESC
+from tests.fixtures.tables import Account
+
+class TestIterPages:
+
+    @pytest.fixture
+    def adapter(self, sqla_engine):
+        adapter = SQLAAdapter(sqla_engine)
+        session = adapter.createsession()
+        adapter.bulkadd(session, [Account(tenant=('a' if i % 2 else 'b'), name=f'u{i:02d}', age=(i % 5)) for i in range(1, 24)])
+        session.close()
+        return adapter
+
+    @pytest.fixture
+    def session(self, adapter):
+        session = adapter.createsession()
+        yield session
+        session.close()
+
+    def workers(self):
+        return [t for t in threading.enumerate() if t.name == 'supermodels-pages']
+
+    @pytest.mark.parametrize('keyset', [False, True])
+    def test_walks_all_pages(self, adapter, session, keyset):
+        """Test every matching row is yielded once, in order, page by page"""
+        pages = list(adapter.iterpages(session, Account, hits=5, keyset=keyset))
+
+        assert [len(p) for p in pages] == [5, 5, 5, 5, 3]
+        assert [a.id for p in pages for a in p] == list(range(1, 24))
+        assert all(a in session for p in pages for a in p)
+
+    @pytest.mark.parametrize('keyset', [False, True])
+    def test_filters_and_non_unique_sort(self, adapter, session, keyset):
+        """Test filters apply and ties on the sort column are not skipped or repeated"""
+        pages = adapter.iterpages(session, Account, hits=3, sortby='age', orderby=DESC, keyset=keyset, tenant='a')
+        rows = [(a.age, a.id) for p in pages for a in p]
+
+        assert len(rows) == 12
+        assert len(set(rows)) == 12
+        assert [age for age, _ in rows] == sorted((age for age, _ in rows), reverse=True)
+
+    def test_prefetches_next_page(self, adapter, session):
+        """Test the next page is fetched while the caller processes the current one"""
+        pages = adapter.iterpages(session, Account, hits=5, prefetch=2)
+        next(pages)
+
+        deadline = time.monotonic() + 5
+        while (pages._queue.qsize() < 2) and (time.monotonic() < deadline):
+            time.sleep(0.01)
+
+        assert pages._queue.qsize() == 2
+        pages.close()
+
+    def test_early_stop_shuts_down(self, adapter, session):
+        """Test stopping early stops the worker and closes its session"""
+        with adapter.iterpages(session, Account, hits=2, prefetch=1) as pages:
+            first = next(pages)
+
+        assert len(first) == 2
+        assert not pages._worker.is_alive()
+        assert list(pages) == []
+
+    def test_error_reraised(self, adapter, session):
+        """Test errors in the worker surface in the consumer"""
+        from supermodels.adapters.sqla import PageIterator
+        def fetch(s, cursor):
+            if cursor:
+                raise RuntimeError("page failed")
+            return [], 1
+
+        with pytest.raises(RuntimeError, match="page failed"):
+            list(PageIterator(adapter.sessionfactory, lambda s, c: ([1], 1) if c is None else fetch(s, c)))
+
+        with pytest.raises(ValueError):
+            adapter.iterpages(session, Account, keyset=True, sortby='missing')
+        with pytest.raises(ValueError):
+            adapter.iterpages(session, Account, prefetch=0)
+
+    @pytest.mark.parametrize('orderby', [ASC, DESC])
+    @pytest.mark.parametrize('keyset', [False, True])
+    def test_null_sort_values(self, adapter, session, orderby, keyset):
+        """Test rows with a NULL sort value are walked once, ordered like querypage"""
+        adapter.bulkadd(session, *[Account(tenant='c', name=f'n{i}') for i in range(4)])
+        rows = [a for p in adapter.iterpages(session, Account, hits=3, sortby='age', orderby=orderby, keyset=keyset) for a in p]
+        expected, _ = adapter.querypage(session, Account, hits=50, sortby='age', orderby=orderby)
+
+        assert len(rows) == 27
+        assert [a.age for a in rows] == [a.age for a in expected]
+        assert len({a.id for a in rows}) == 27
+
+    @pytest.mark.parametrize('dialect', ['mysql', 'mssql', 'postgresql'])
+    def test_order_portable_sql(self, dialect):
+        """Test ordering uses plain ASC/DESC by default and portable CASE keys when NULLs are placed"""
+        import importlib
+        from sqlalchemy import select
+        compiled = lambda *order: str(select(Account.id).order_by(*order).compile(
+            dialect=importlib.import_module(f'sqlalchemy.dialects.{dialect}').dialect()
+        ))
+
+        assert 'NULLS' not in compiled(*DESC.order(Account.age))
+        assert compiled(*DESC.order(Account.age)).endswith('ORDER BY accounts.age DESC')
+        explicit = compiled(*ASC.order(Account.age, nullsfirst=False))
+        assert 'NULLS' not in explicit and 'CASE WHEN' in explicit
+
+    @pytest.mark.parametrize('keyset', [False, True])
+    def test_explicit_null_placement(self, adapter, session, keyset):
+        """Test nullsfirst overrides the dialect's NULL placement"""
+        adapter.bulkadd(session, *[Account(tenant='c', name=f'n{i}') for i in range(2)])
+        rows = [a for p in adapter.iterpages(session, Account, hits=4, sortby='age', nullsfirst=False, keyset=keyset) for a in p]
+        items, _ = adapter.querypage(session, Account, hits=50, sortby='age', orderby=DESC, nullsfirst=True)
+
+        assert [a.age for a in rows][-2:] == [None, None]
+        assert len({a.id for a in rows}) == 25
+        assert [a.age for a in items][:2] == [None, None]
+
+    def test_unknown_sortby_raises_error(self, adapter, session):
+        """Test OFFSET walks reject a sort field the model lacks"""
+        with pytest.raises(ValueError):
+            adapter.iterpages(session, Account, sortby='missing')
+
+    def test_through_manager(self, adapter):
+        """Test BaseManager.iterpages uses the manager's session"""
+        with Manager(adapter)(Account) as ctx:
+            manager = ctx._getmodelmanager(Account)
+            pages = list(manager.iterpages(hits=10, tenant='b'))
+
+        assert [len(p) for p in pages] == [10, 1]
+
+    def test_abandoned_iterator_stops_worker(self, adapter, session):
+        """Test dropping an unfinished iterator lets its worker exit"""
+        import gc
+        pages = adapter.iterpages(session, Account, hits=1, prefetch=1)
+        next(pages)
+        worker = pages._worker
+        del pages
+        gc.collect()
+
+        worker.join(timeout=5)
+        assert not worker.is_alive()
@@ -0,0 +1,196 @@
+import pytest
+from sqlalchemy import event, Column, Integer, String, DateTime, func
+from supermodels.adapters.sqla import SQLAAdapter
+from tests.fixtures.tables import Account
+
+class StatementLog:
+    def __init__(self, engine):
+        self.statements = []
+        event.listen(engine, 'before_cursor_execute', self)
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def kinds(self):
+        return [s.split()[0].upper() for s in self.statements]
+
+class TestPartialUpdate:
+
+    @pytest.fixture
+    def adapter(self, sqla_engine):
+        adapter = SQLAAdapter(sqla_engine)
+        session = adapter.createsession()
+        adapter.additem(session, Account(tenant='a', name='alice', age=30, balance=10.0))
+        session.close()
+        return adapter
+
+    def load(self, adapter, name='alice'):
+        session = adapter.createsession()
+        account = session.query(Account).filter_by(name=name).one()
+        session.close()
+        return account
+
+    def test_updates_only_changed_columns(self, adapter, sqla_engine):
+        """Test detached item update emits an UPDATE of changed columns only"""
+        account = self.load(adapter)
+        account.age = 31
+
+        log = StatementLog(sqla_engine)
+        session = adapter.createsession()
+        result = adapter.updateitem(session, account)
+        session.close()
+
+        updates = [s for s in log.statements if s.upper().startswith('UPDATE')]
+        assert result is account
+        assert len(updates) == 1
+        assert 'age' in updates[0] and 'name' not in updates[0] and 'balance' not in updates[0]
+        assert 'SELECT' not in log.kinds()
+        assert self.load(adapter).age == 31
+
+    def test_explicit_changes(self, adapter, sqla_engine):
+        """Test explicit changes dict is applied to row and item"""
+        account = self.load(adapter)
+
+        session = adapter.createsession()
+        adapter.updateitem(session, account, changes={'balance': 99.5})
+        session.close()
+
+        assert account.balance == 99.5
+        assert self.load(adapter).balance == 99.5
+
+    def test_no_changes_skips_statement(self, adapter, sqla_engine):
+        """Test update without changes executes nothing"""
+        account = self.load(adapter)
+
+        log = StatementLog(sqla_engine)
+        session = adapter.createsession()
+        adapter.updateitem(session, account)
+        session.close()
+
+        assert log.statements == []
+
+    def test_failed_update_keeps_history(self, adapter):
+        """Test values are not marked committed when the UPDATE fails"""
+        from sqlalchemy import inspect
+        from sqlalchemy.exc import IntegrityError
+        session = adapter.createsession()
+        adapter.additem(session, Account(tenant='a', name='bob'))
+        session.close()
+        account = self.load(adapter)
+        account.name = 'bob'
+
+        session = adapter.createsession()
+        with pytest.raises(IntegrityError):
+            adapter.updateitem(session, account)
+        session.rollback()
+        session.close()
+
+        assert inspect(account).attrs.name.history.added == ['bob']
+        assert self.load(adapter).name == 'alice'
+
+    def test_unknown_column_raises_error(self, adapter):
+        """Test explicit changes with unknown keys raise error"""
+        account = self.load(adapter)
+        session = adapter.createsession()
+
+        with pytest.raises(ValueError):
+            adapter.updateitem(session, account, changes={'missing': 1})
+        session.close()
+
+    def test_persistent_item_in_session(self, adapter):
+        """Test update of an item loaded in the same session"""
+        session = adapter.createsession()
+        account = session.query(Account).filter_by(name='alice').one()
+        account.name = 'alicia'
+
+        adapter.updateitem(session, account)
+        session.close()
+
+        assert self.load(adapter, 'alicia').age == 30
+
+    def test_transient_item_falls_back_to_merge(self, adapter):
+        """Test transient items keep merge semantics"""
+        session = adapter.createsession()
+        existing = self.load(adapter)
+
+        merged = adapter.updateitem(session, Account(id=existing.id, tenant='a', name='alice', age=50))
+        assert merged.age == 50
+        session.close()
+
+        assert self.load(adapter).age == 50
+
+    def test_onupdate_columns_read_back(self, tmp_path):
+        """Test columns with onupdate defaults are refreshed after update"""
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import declarative_base
+
+        Base = declarative_base()
+
+        class Stamped(Base):
+            __tablename__ = 'stamped'
+            id = Column(Integer, primary_key=True)
+            label = Column(String)
+            revision = Column(Integer, default=0, onupdate=lambda: 7)
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'stamped.db'}")
+        Base.metadata.create_all(engine)
+        adapter = SQLAAdapter(engine)
+
+        session = adapter.createsession()
+        adapter.additem(session, Stamped(label='x'))
+        item = session.query(Stamped).one()
+        session.close()
+
+        item.label = 'y'
+        session = adapter.createsession()
+        adapter.updateitem(session, item)
+        session.close()
+
+        assert item.revision == 7
+
+
+class TestRelationshipUpdate:
+
+    @pytest.fixture
+    def models(self, sqla_engine):
+        from sqlalchemy import ForeignKey
+        from sqlalchemy.orm import declarative_base, relationship
+
+        Base = declarative_base()
+
+        class Team(Base):
+            __tablename__ = 'teams'
+            id = Column(Integer, primary_key=True)
+            name = Column(String)
+            members = relationship('Member', back_populates='team')
+
+        class Member(Base):
+            __tablename__ = 'members'
+            id = Column(Integer, primary_key=True)
+            name = Column(String)
+            team_id = Column(Integer, ForeignKey('teams.id'))
+            team = relationship(Team, back_populates='members')
+
+        Base.metadata.create_all(sqla_engine)
+        return Team, Member
+
+    def test_changed_relationship_is_written(self, sqla_engine, models):
+        """Test relationship changes on a detached item are merged, not dropped"""
+        Team, Member = models
+        adapter = SQLAAdapter(sqla_engine)
+        session = adapter.createsession()
+        session.add_all([Team(id=1, name='red'), Team(id=2, name='blue'), Member(id=1, name='m', team_id=1)])
+        session.commit()
+        member = session.get(Member, 1)
+        member.team
+        session.close()
+
+        other = adapter.createsession()
+        member.team = other.get(Team, 2)
+        other.expunge_all()
+        adapter.updateitem(other, member)
+        other.close()
+
+        check = adapter.createsession()
+        assert check.get(Member, 1).team_id == 2
+        check.close()
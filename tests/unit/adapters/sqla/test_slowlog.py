@@ -0,0 +1,127 @@
+import logging
+import pytest
+from supermodels.adapters.sqla import SQLAAdapter, SlowLogConfig
+from supermodels.adapters.sqla.slowlog import paramshape, manyshape
+from tests.fixtures.tables import Account, AccountManager
+
+class TestSlowLog:
+
+    def adapter(self, engine, **options):
+        return SQLAAdapter(engine, slowlog=SlowLogConfig(**{'threshold': 0, **options}))
+
+    def test_disabled_by_default(self, sqla_engine):
+        """Test no slow log is created unless requested"""
+        adapter = SQLAAdapter(sqla_engine)
+        session = adapter.createsession()
+
+        assert adapter.queryall(session, Account) == []
+        assert adapter.slowlog is None
+        session.close()
+
+    def test_records_statements_and_rows(self, sqla_engine):
+        """Test entries keep SQL, parameter shapes and row counts"""
+        adapter = self.adapter(sqla_engine, explain=False)
+        session = adapter.createsession()
+        adapter.bulkadd(session, Account(tenant='a', name='u1', age=30), Account(tenant='a', name='u2', age=40))
+
+        rows = adapter.queryby(session, Account, age__gte=35)
+        entry = adapter.slowlog.entries[-1]
+
+        assert len(rows) == 1
+        assert entry.operation == 'queryby'
+        assert entry.model == 'Account'
+        assert entry.rows == 1
+        assert len(entry.statements) == 1
+        assert entry.statements[0].sql.lstrip().upper().startswith('SELECT')
+        assert entry.statements[0].params == ['int']
+        adapter.shutdown()
+        session.close()
+
+    def test_below_threshold_not_recorded(self, sqla_engine):
+        """Test fast operations are not recorded"""
+        adapter = SQLAAdapter(sqla_engine, slowlog=SlowLogConfig(threshold=60))
+        session = adapter.createsession()
+
+        adapter.queryall(session, Account)
+
+        assert adapter.slowlog.entries == []
+        adapter.shutdown()
+        session.close()
+
+    def test_explain_plan(self, sqla_engine, caplog):
+        """Test query plans are captured on a separate connection and logged"""
+        adapter = self.adapter(sqla_engine)
+        session = adapter.createsession()
+
+        with caplog.at_level(logging.WARNING, logger='supermodels.adapters.sqla.slowlog'):
+            adapter.queryby(session, Account, name='u1')
+            adapter.slowlog.wait()
+
+        plan = adapter.slowlog.entries[-1].statements[0].plan
+        assert plan and any('accounts' in line for line in plan)
+        assert 'Slow queryby on Account' in caplog.text
+        adapter.shutdown()
+        session.close()
+
+    def test_rate_limited(self, sqla_engine):
+        """Test entries beyond the rate are dropped and counted"""
+        adapter = self.adapter(sqla_engine, explain=False, rate=3)
+        session = adapter.createsession()
+
+        for _ in range(5):
+            adapter.queryall(session, Account)
+
+        assert len(adapter.slowlog.entries) == 3
+        assert adapter.slowlog.dropped == 2
+        adapter.shutdown()
+        session.close()
+
+    def test_calling_manager(self, sqla_engine):
+        """Test the manager that issued the operation is recorded"""
+        adapter = self.adapter(sqla_engine, explain=False)
+        manager = AccountManager(adapter.createsession(), adapter)
+
+        manager.getall()
+
+        entry = adapter.slowlog.entries[-1]
+        assert entry.manager == 'AccountManager'
+        assert entry.operation == 'queryall'
+        adapter.shutdown()
+        manager.close()
+
+    def test_paramshape_hides_values(self):
+        """Test parameter shapes never include values"""
+        assert paramshape({'name': 'secret', 'ids': (1, 2)}) == {'name': 'str[6]', 'ids': ['int', 'int']}
+
+    def test_statement_capture_limited(self, sqla_engine):
+        """Test statements beyond the configured limit are counted, not kept"""
+        adapter = self.adapter(sqla_engine, explain=False, statements=1)
+        session = adapter.createsession()
+
+        with adapter.slowlog.observe('outer', Account):
+            adapter.queryall(session, Account)
+            adapter.queryby(session, Account, age__gte=35)
+            adapter.queryby(session, Account, name='u1')
+
+        entry = adapter.slowlog.entries[-1]
+        assert entry.operation == 'outer'
+        assert len(entry.statements) == 1
+        assert entry.skipped == 2
+        adapter.shutdown()
+        session.close()
+
+    def test_bulk_count_rows(self, sqla_engine):
+        """Test bulk writes returning only a count record that count"""
+        adapter = self.adapter(sqla_engine, explain=False)
+        session = adapter.createsession()
+
+        written = adapter.bulkadd(session, (Account(tenant='a', name=f"u{i}") for i in range(3)), collect=False)
+
+        assert written == 3
+        assert adapter.slowlog.entries[-1].rows == 3
+        adapter.shutdown()
+        session.close()
+
+    def test_manyshape_keeps_first_row(self):
+        """Test executemany parameters are summarized by first row and count"""
+        assert manyshape(([{'name': 'secret'}], 500)) == {'rows': 500, 'first': {'name': 'str[6]'}}
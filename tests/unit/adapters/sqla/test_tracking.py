@@ -0,0 +1,173 @@
+# tests/unit/adapters/sqla/test_tracking.py
+from datetime import datetime
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import configure_mappers
+
+from supermodels.adapters.sqla import SQLAAdapter
+from supermodels.adapters.sqla import tracking
+from supermodels.adapters.sqla.tracking import detectchanges
+from tests.fixtures.tables import Document, Account, Profile, Section
+
+
+def profile() -> Profile:
+    return Profile(name='doc', created=datetime(2026, 5, 6), sections=[Section('intro', ['a'])])
+
+
+class Statements:
+    """Collects UPDATE statements issued on an engine"""
+
+    def __init__(self, engine):
+        self.updates = []
+        event.listen(engine, 'before_cursor_execute', self)
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith('UPDATE'):
+            self.updates.append(statement)
+
+
+def seed(adapter) -> int:
+    session = adapter.createsession()
+    doc = adapter.additem(session, Document(title='t', watched=profile()))
+    docid = doc.id
+    session.close()
+    return docid
+
+
+class TestTypedColumnTracking:
+
+    def test_inplace_mutation_flagged_dirty(self, sqla_engine):
+        """Test mutating a nested value in place is detected and written on flush"""
+        adapter = SQLAAdapter(sqla_engine)
+        docid = seed(adapter)
+
+        session = adapter.createsession()
+        doc = session.get(Document, docid)
+        doc.watched.sections[0].words.append('b')
+        session.commit()
+        session.close()
+
+        session = adapter.createsession()
+        assert session.get(Document, docid).watched.sections[0].words == ['a', 'b']
+        session.close()
+
+    def test_equal_reassignment_skips_update(self, sqla_engine):
+        """Test assigning an equal value issues no UPDATE"""
+        adapter = SQLAAdapter(sqla_engine)
+        docid = seed(adapter)
+        statements = Statements(sqla_engine)
+
+        session = adapter.createsession()
+        doc = session.get(Document, docid)
+        doc.watched = profile()
+        session.commit()
+        session.close()
+
+        assert statements.updates == []
+
+    def test_scalar_change_leaves_typed_column_out(self, sqla_engine):
+        """Test changing only a scalar column doesn't rewrite the typed column"""
+        adapter = SQLAAdapter(sqla_engine)
+        docid = seed(adapter)
+        statements = Statements(sqla_engine)
+
+        session = adapter.createsession()
+        doc = session.get(Document, docid)
+        doc.title = 'renamed'
+        session.commit()
+        session.close()
+
+        assert len(statements.updates) == 1
+        assert 'watched' not in statements.updates[0]
+
+    def test_updateitem_writes_mutations(self, sqla_engine):
+        """Test partial updates include in-place mutations of tracked columns"""
+        adapter = SQLAAdapter(sqla_engine)
+        docid = seed(adapter)
+
+        session = adapter.createsession()
+        doc = session.get(Document, docid)
+        doc.watched.name = 'changed'
+        assert detectchanges(inspect(doc)) == ['watched']
+        adapter.updateitem(session, doc)
+        session.close()
+
+        session = adapter.createsession()
+        assert session.get(Document, docid).watched.name == 'changed'
+        session.close()
+
+    def test_repeat_commits_are_clean(self, sqla_engine):
+        """Test a written mutation isn't written again by the next commit"""
+        adapter = SQLAAdapter(sqla_engine)
+        docid = seed(adapter)
+        session = adapter.createsession()
+        session.expire_on_commit = False
+        doc = session.get(Document, docid)
+        doc.watched.name = 'once'
+        session.commit()
+
+        statements = Statements(sqla_engine)
+        doc.title = 'again'
+        session.commit()
+        session.close()
+
+        assert len(statements.updates) == 1
+        assert 'watched' not in statements.updates[0]
+
+    def test_listeners_only_on_tracked_mappers(self):
+        """Test load listeners are attached only to mappers with tracked columns"""
+        configure_mappers()
+        assert event.contains(inspect(Document), 'load', tracking._onload)
+        assert not event.contains(inspect(Account), 'load', tracking._onload)
+
+    def test_lazy_values_fingerprinted_on_demand(self, sqla_engine, monkeypatch):
+        """Test unread lazy values are never fingerprinted and read ones still track mutations"""
+        adapter = SQLAAdapter(sqla_engine)
+        session = adapter.createsession()
+        docid = adapter.additem(session, Document(title='t', journal=profile())).id
+        session.close()
+
+        coltype = Document.__table__.c.journal.type
+        digests = []
+        monkeypatch.setattr(coltype, 'digest', lambda stored: digests.append(stored) or type(coltype).digest(stored))
+
+        session = adapter.createsession()
+        doc = session.get(Document, docid)
+        doc.title = 'renamed'
+        session.commit()
+        assert digests == []
+
+        doc = session.get(Document, docid)
+        doc.journal.name = 'changed'
+        session.commit()
+        session.close()
+
+        session = adapter.createsession()
+        assert session.get(Document, docid).journal.name == 'changed'
+        session.close()
+
+
+    def test_unread_values_cost_nothing(self, sqla_engine, monkeypatch):
+        """Test loading tracked rows and committing a scalar change never serializes them"""
+        adapter = SQLAAdapter(sqla_engine)
+        session = adapter.createsession()
+        adapter.bulkadd(session, (Document(title=f't{i}', watched=profile()) for i in range(100)))
+        session.close()
+
+        converter = Document.__table__.c.watched.type.converter
+        calls = []
+        original = converter.serialize
+        monkeypatch.setattr(converter, 'serialize', lambda value, **kw: calls.append(1) or original(value, **kw))
+
+        session = adapter.createsession()
+        docs = adapter.queryall(session, Document)
+        assert calls == []
+
+        docs[0].title = 'renamed'
+        session.commit()
+        assert calls == []
+
+        docs[1].watched.name = 'changed'
+        session.commit()
+        session.close()
+        assert len(calls) == 1
@@ -0,0 +1,124 @@
+# tests/unit/adapters/sqla/test_typer.py
+from datetime import datetime
+
+from sqlalchemy import text
+
+from supermodels.adapters.sqla import SQLAAdapter
+from supermodels.converters.codecs import ZLIB, JSONZLIB
+from tests.fixtures.tables import Document, Profile, Section
+
+
+def profile(words: int = 5) -> Profile:
+    return Profile(
+        name='doc',
+        created=datetime(2026, 5, 6, 7, 8, 9),
+        sections=[Section('intro', ['word'] * words), Section('body')],
+        rating=4.5,
+    )
+
+
+class TestSQLATypeAdapter:
+
+    def test_json_column_roundtrip(self, sqla_engine):
+        """Test the default JSON column stores and rebuilds typed values"""
+        adapter = SQLAAdapter(sqla_engine)
+        session = adapter.createsession()
+        adapter.additem(session, Document(title='a', profile=profile()))
+        session.close()
+
+        session = adapter.createsession()
+        loaded = adapter.queryoneby(session, Document, title='a')
+        assert loaded.profile == profile()
+        session.close()
+
+    def test_codec_column_stores_binary(self, sqla_engine):
+        """Test a codec column stores compressed bytes and rebuilds typed values"""
+        adapter = SQLAAdapter(sqla_engine)
+        session = adapter.createsession()
+        adapter.additem(session, Document(title='b', packed=profile(words=200)))
+        session.close()
+
+        with sqla_engine.connect() as conn:
+            raw = conn.execute(text("SELECT packed FROM documents WHERE title = 'b'")).scalar_one()
+        assert isinstance(raw, bytes)
+        assert raw[:1] in (ZLIB, JSONZLIB) # MessagePack, or JSON without msgpack
+
+        session = adapter.createsession()
+        loaded = adapter.queryoneby(session, Document, title='b')
+        assert loaded.packed == profile(words=200)
+        assert loaded.profile is None
+        session.close()
+
+    def test_lazy_column_defers_conversion(self, sqla_engine, monkeypatch):
+        """Test lazy columns only run the converter for rows that are read"""
+        adapter = SQLAAdapter(sqla_engine)
+        session = adapter.createsession()
+        adapter.bulkadd(session, *(Document(title=f"d{i}", deferred=profile()) for i in range(10)))
+        session.close()
+
+        coltype = Document.__table__.c.deferred.type
+        calls = []
+        original = coltype.converter.deserialize
+        monkeypatch.setattr(coltype.converter, 'deserialize', lambda value, **kw: calls.append(1) or original(value, **kw))
+
+        session = adapter.createsession()
+        rows = adapter.queryall(session, Document)
+        assert calls == []
+
+        assert rows[0].deferred.name == 'doc'
+        assert isinstance(rows[0].deferred, Profile)
+        assert rows[0].deferred.created == datetime(2026, 5, 6, 7, 8, 9)
+        assert len(calls) == 1
+        session.close()
+
+    def test_lazy_column_writes_back(self, sqla_engine):
+        """Test unread proxies persist their raw value and read proxies re-serialize"""
+        adapter = SQLAAdapter(sqla_engine)
+        session = adapter.createsession()
+        adapter.additem(session, Document(title='e', deferred=profile()))
+        session.close()
+
+        session = adapter.createsession()
+        doc = adapter.queryoneby(session, Document, title='e')
+        copied = Document(title='f', deferred=doc.deferred)
+        adapter.additem(session, copied)
+        doc.deferred.name = 'renamed'
+        adapter.updateitem(session, doc, changes={'deferred': doc.deferred})
+        session.close()
+
+        session = adapter.createsession()
+        assert adapter.queryoneby(session, Document, title='e').deferred.name == 'renamed'
+        assert adapter.queryoneby(session, Document, title='f').deferred == profile()
+        session.close()
+
+    def test_batch_encode_decode(self):
+        """Test batch conversion round-trips and keeps None positions"""
+        coltype = Document.__table__.c.packed.type
+        values = [profile(), None, profile(words=100)]
+
+        encoded = coltype.encodemany(values)
+
+        assert encoded[1] is None
+        assert all(isinstance(v, bytes) for v in (encoded[0], encoded[2]))
+        assert coltype.decodemany(encoded) == values
+
+    def test_bulk_and_pages_convert_in_batches(self, sqla_engine, monkeypatch):
+        """Test bulk writes and page walks make one converter call per column and chunk"""
+        adapter = SQLAAdapter(sqla_engine)
+        converter = Document.__table__.c.packed.type.converter
+        calls = []
+        for name in ('serialize', 'deserialize', 'serializemany', 'deserializemany'):
+            original = getattr(converter, name)
+            monkeypatch.setattr(converter, name, lambda value, _n=name, _f=original, **kw: calls.append(_n) or _f(value, **kw))
+
+        session = adapter.createsession()
+        adapter.bulkadd(session, (Document(title=f"p{i}", packed=profile()) for i in range(6)), chunksize=3)
+        session.close()
+        assert calls == ['serializemany', 'serializemany']
+
+        calls.clear()
+        session = adapter.createsession()
+        pages = list(adapter.iterpages(session, Document, hits=4))
+        session.close()
+        assert calls == ['deserializemany', 'deserializemany']
+        assert [d.packed for page in pages for d in page] == [profile()] * 6
@@ -0,0 +1,184 @@
+import time
+import threading
+import pytest
+from supermodels.adapters.sqla import SQLAAdapter, WriteBehindConfig, WriteBehindQueue
+from tests.fixtures.tables import Event
+
+class TestWriteBehind:
+
+    def count(self, adapter):
+        session = adapter.createsession()
+        try:
+            return session.query(Event).count()
+        finally:
+            session.close()
+
+    def test_disabled_by_default(self, sqla_engine):
+        """Test additem writes immediately without write-behind"""
+        adapter = SQLAAdapter(sqla_engine)
+        session = adapter.createsession()
+
+        adapter.additem(session, Event(kind='click'))
+        session.close()
+
+        assert adapter.writebehind is None
+        assert self.count(adapter) == 1
+
+    def test_flush_by_size(self, sqla_engine):
+        """Test a full batch is written without waiting for the interval"""
+        adapter = SQLAAdapter(sqla_engine, writebehind=WriteBehindConfig(batchsize=10, interval=60))
+        session = adapter.createsession()
+
+        for i in range(10):
+            adapter.additem(session, Event(kind=f'k{i}'))
+
+        deadline = time.monotonic() + 5
+        while adapter.writebehind.stats.written < 10 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert self.count(adapter) == 10
+        adapter.shutdown()
+
+    def test_flush_by_interval(self, sqla_engine):
+        """Test a partial batch is written once the interval elapses"""
+        adapter = SQLAAdapter(sqla_engine, writebehind=WriteBehindConfig(batchsize=1000, interval=0.05))
+        session = adapter.createsession()
+
+        adapter.additem(session, Event(kind='late'))
+
+        deadline = time.monotonic() + 5
+        while adapter.writebehind.stats.written < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert self.count(adapter) == 1
+        adapter.shutdown()
+
+    def test_explicit_flush(self, sqla_engine):
+        """Test flush writes all pending items before returning"""
+        adapter = SQLAAdapter(sqla_engine, writebehind=WriteBehindConfig(batchsize=1000, interval=60))
+        session = adapter.createsession()
+
+        for i in range(25):
+            adapter.additem(session, Event(kind=f'k{i}'))
+        adapter.flush()
+
+        assert self.count(adapter) == 25
+        assert adapter.writebehind.stats.depth == 0
+        adapter.shutdown()
+
+    def test_shutdown_flushes_pending(self, sqla_engine):
+        """Test shutdown writes pending items and rejects new ones"""
+        adapter = SQLAAdapter(sqla_engine, writebehind=WriteBehindConfig(batchsize=1000, interval=60))
+        session = adapter.createsession()
+
+        for i in range(5):
+            adapter.additem(session, Event(kind=f'k{i}'))
+        adapter.shutdown()
+
+        assert self.count(adapter) == 5
+        with pytest.raises(RuntimeError):
+            adapter.additem(session, Event(kind='rejected'))
+
+    def test_items_remain_readable_after_flush(self, sqla_engine):
+        """Test queued items get primary keys and stay usable after flush"""
+        adapter = SQLAAdapter(sqla_engine, writebehind=True)
+        session = adapter.createsession()
+
+        event = adapter.additem(session, Event(kind='click'))
+        adapter.flush()
+
+        assert event.id is not None
+        assert event.kind == 'click'
+        adapter.shutdown()
+
+    def test_backpressure_timeout(self, sqla_engine):
+        """Test producers fail after waiting on a full queue"""
+        adapter = SQLAAdapter(sqla_engine)
+        release = threading.Event()
+
+        def slowsession():
+            release.wait()
+            return adapter._writersession()
+
+        queue = WriteBehindQueue(slowsession, WriteBehindConfig(batchsize=1, interval=0, maxsize=1, timeout=0.01))
+
+        with pytest.raises(RuntimeError):
+            for i in range(5):
+                queue.put(Event(kind=f'k{i}'))
+
+        release.set()
+        queue.close()
+        assert self.count(adapter) == queue.stats.enqueued
+
+    def test_failed_batch_recorded(self, sqla_engine):
+        """Test failed batches are counted and reported"""
+        adapter = SQLAAdapter(sqla_engine, writebehind=WriteBehindConfig(batchsize=1000, interval=60))
+        session = adapter.createsession()
+
+        adapter.additem(session, Event(kind=None))
+        with pytest.warns(UserWarning):
+            adapter.flush()
+
+        stats = adapter.writebehind.stats
+        assert stats.failed == 1
+        assert stats.written == 0
+        assert adapter.writebehind.lasterror is not None
+        adapter.shutdown()
+
+    def test_bad_rows_dead_lettered(self, sqla_engine):
+        """Test a bad row is rejected alone while the rest of its batch is written"""
+        rejected = []
+        config = WriteBehindConfig(batchsize=1000, interval=60, ondeadletter=rejected.append)
+        adapter = SQLAAdapter(sqla_engine, writebehind=config)
+        session = adapter.createsession()
+
+        for i in range(9):
+            adapter.additem(session, Event(kind=(None if i == 4 else f'k{i}')))
+        with pytest.warns(UserWarning):
+            adapter.flush()
+
+        assert self.count(adapter) == 8
+        assert [f.index for f in adapter.writebehind.deadletters] == [4]
+        assert [f.item.kind for f in rejected] == [None]
+        assert adapter.writebehind.stats.written == 8
+        adapter.shutdown()
+
+    def test_flush_with_busy_producers(self, sqla_engine):
+        """Test flush returns while other producers keep queueing"""
+        adapter = SQLAAdapter(sqla_engine, writebehind=WriteBehindConfig(batchsize=50, interval=0.01))
+        stop = threading.Event()
+
+        def produce():
+            while not stop.is_set():
+                adapter.writebehind.put(Event(kind='busy'))
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        try:
+            session = adapter.createsession()
+            adapter.additem(session, Event(kind='mine'))
+            done = threading.Thread(target=adapter.flush)
+            done.start()
+            done.join(timeout=5)
+            assert not done.is_alive()
+        finally:
+            stop.set()
+            producer.join()
+            adapter.shutdown()
+
+    def test_stats_track_latency(self, sqla_engine):
+        """Test metrics report flushes and latency"""
+        adapter = SQLAAdapter(sqla_engine, writebehind=WriteBehindConfig(batchsize=1000, interval=60))
+        session = adapter.createsession()
+
+        for i in range(3):
+            adapter.additem(session, Event(kind=f'k{i}'))
+        adapter.flush()
+
+        stats = adapter.writebehind.stats
+        assert stats.enqueued == 3
+        assert stats.written == 3
+        assert stats.flushes == 1
+        assert stats.maxlatency >= stats.lastlatency > 0
+        assert stats.avglatency > 0
+        adapter.shutdown()
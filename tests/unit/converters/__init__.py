@@ -0,0 +1 @@
+# tests/unit/converters/__init__.py
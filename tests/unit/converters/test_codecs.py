@@ -0,0 +1,60 @@
+# tests/unit/converters/test_codecs.py
+import sys, pytest
+
+from supermodels.converters.codecs import JSONCodec, BinaryCodec, RAW, ZLIB, JSONRAW, JSONZLIB
+
+
+class TestCodecs:
+
+    @pytest.mark.parametrize('codec', [JSONCodec(), JSONCodec(fast=False), BinaryCodec()])
+    def test_roundtrip(self, codec):
+        """Test codecs round-trip JSON-compatible payloads"""
+        value = {'name': 'doc', 'items': [{'id': i, 'score': i / 2} for i in range(50)], 'none': None}
+        assert codec.decode(codec.encode(value)) == value
+        assert codec.decode(memoryview(codec.encode(value))) == value
+
+    def test_compression_threshold(self):
+        """Test payloads above the threshold are compressed and flagged"""
+        codec = JSONCodec(compress=64)
+        small, large = codec.encode({'a': 1}), codec.encode({'a': 'x' * 1000})
+
+        assert small[:1] == RAW
+        assert large[:1] == ZLIB
+        assert len(large) < 100
+        assert codec.decode(large) == {'a': 'x' * 1000}
+
+    def test_threshold_change_reads_old_rows(self):
+        """Test payloads stay readable after changing compression settings"""
+        payload = JSONCodec(compress=8).encode({'key': 'value' * 10})
+        assert JSONCodec().decode(payload) == {'key': 'value' * 10}
+
+    def test_binary_is_compact(self):
+        """Test binary encoding is smaller than the JSON encoding"""
+        pytest.importorskip('msgpack')
+        value = [{'id': i, 'flag': True, 'ratio': 0.5} for i in range(100)]
+        assert len(BinaryCodec().encode(value)) < len(JSONCodec().encode(value))
+
+    def test_unknown_header_raises(self):
+        """Test payloads without a valid header are rejected"""
+        with pytest.raises(ValueError):
+            BinaryCodec().decode(b'\x07abc')
+
+    def test_binary_falls_back_to_json(self, monkeypatch):
+        """Test BinaryCodec writes flagged JSON without msgpack and reads it back either way"""
+        monkeypatch.setitem(sys.modules, 'msgpack', None)
+        codec = BinaryCodec(compress=64)
+        small, large = codec.encode({'a': 1}), codec.encode({'a': 'x' * 1000})
+
+        assert codec.backend in ('json', 'orjson')
+        assert (small[:1], large[:1]) == (JSONRAW, JSONZLIB)
+        assert codec.decode(small) == {'a': 1}
+        assert codec.decode(large) == {'a': 'x' * 1000}
+        monkeypatch.undo()
+        assert BinaryCodec().decode(large) == {'a': 'x' * 1000}
+
+    def test_msgpack_payload_without_msgpack_raises(self, monkeypatch):
+        """Test MessagePack rows explain that msgpack is needed to read them"""
+        monkeypatch.setitem(sys.modules, 'msgpack', None)
+        with pytest.raises(ImportError, match='msgpack'):
+            BinaryCodec().decode(RAW + b'\x81\xa1a\x01')
+
@@ -0,0 +1,162 @@
+# tests/unit/converters/test_dc.py
+import pytest
+import dataclasses as dcs
+import typing as t
+from datetime import datetime
+
+from supermodels.converters.dc import DataclassConverter
+from supermodels.converters.plans import encoderfor, compileencoder
+
+
+@dcs.dataclass
+class Tag:
+    name: str
+    weight: float = 1.0
+
+
+@dcs.dataclass
+class Node:
+    id: int
+    label: str
+    created: datetime
+    tags: t.List[Tag] = dcs.field(default_factory=list)
+    scores: t.List[int] = dcs.field(default_factory=list)
+    children: t.List['Node'] = dcs.field(default_factory=list)
+    meta: t.Dict[str, t.Any] = dcs.field(default_factory=dict)
+    parent: t.Optional[int] = None
+
+
+def legacy(val):
+    """Reference implementation the compiled plans must match"""
+    if dcs.is_dataclass(val) and not isinstance(val, type): return {k: legacy(getattr(val, k)) for k in dcs.asdict(val)}
+    elif isinstance(val, list): return [legacy(item) for item in val]
+    elif isinstance(val, (int, float, str, bool)): return val
+    elif isinstance(val, dict): return {k: legacy(v) for k,v in val.items()}
+    else: return str(val)
+
+
+def sample() -> Node:
+    when = datetime(2026, 1, 2, 3, 4, 5)
+    leaf = Node(id=2, label='leaf', created=when, scores=[1, 2], meta={'k': [Tag('x')]})
+    return Node(
+        id=1, label='root', created=when,
+        tags=[Tag('a'), Tag('b', 2.5)],
+        scores=[3, True],
+        children=[leaf],
+        meta={'nested': {'when': when, 'flag': False}},
+    )
+
+
+class TestDataclassSerialize:
+
+    def test_matches_reference_output(self):
+        """Test compiled plans emit exactly what the asdict-based converter did"""
+        node = sample()
+        assert DataclassConverter(Node).serialize(node) == legacy(node)
+
+    def test_lists_and_scalars(self):
+        """Test top-level lists, scalars and None follow the same rules"""
+        converter = DataclassConverter(Node)
+        assert converter.serialize([Tag('a'), 3, 'x', None]) == [{'name': 'a', 'weight': 1.0}, 3, 'x', 'None']
+
+    def test_does_not_deep_copy(self, monkeypatch):
+        """Test serialization never calls dataclasses.asdict"""
+        def fail(*args, **kwargs):
+            raise AssertionError("asdict called")
+        monkeypatch.setattr(dcs, 'asdict', fail)
+
+        DataclassConverter(Node).serialize(sample())
+
+    def test_plan_cached_per_class(self):
+        """Test each dataclass compiles one encoder, reused across calls"""
+        assert encoderfor(Node) is encoderfor(Node)
+        assert encoderfor(Tag) is not encoderfor(Node)
+
+    def test_mistyped_values_fall_back(self):
+        """Test values not matching their hints still encode correctly"""
+        tag = Tag(name=None, weight='heavy') # type: ignore
+        assert compileencoder(Tag)(tag) == {'name': 'None', 'weight': 'heavy'}
+
+
+class TestDataclassDeserialize:
+
+    def test_roundtrip_rebuilds_nested(self):
+        """Test deserialize inverts serialize, including nested dataclasses and datetimes"""
+        converter = DataclassConverter(Node)
+        node = sample()
+
+        restored = converter.deserialize(converter.serialize(node))
+
+        assert isinstance(restored.children[0], Node)
+        assert isinstance(restored.tags[1], Tag)
+        assert restored.created == node.created
+        assert restored.parent is None
+        assert restored.scores == node.scores
+        assert converter.serialize(restored) == converter.serialize(node)
+
+    def test_does_not_mutate_input(self):
+        """Test the serialized payload is left untouched"""
+        converter = DataclassConverter(Node)
+        payload = converter.serialize(sample())
+        snapshot = repr(payload)
+
+        converter.deserialize(payload)
+
+        assert repr(payload) == snapshot
+
+    def test_lists_of_targets(self):
+        """Test a list payload yields a list of target instances"""
+        converter = DataclassConverter(Tag)
+        assert converter.deserialize([{'name': 'a'}, {'name': 'b', 'weight': 2.0}]) == [Tag('a'), Tag('b', 2.0)]
+
+    def test_datetimes_option_by_field_name(self):
+        """Test the datetimes option parses named fields whatever their hint"""
+        @dcs.dataclass
+        class Loose:
+            stamp: t.Any = None
+
+        converter = DataclassConverter(Loose, datetimes={'stamp'})
+
+        assert converter.deserialize({'stamp': '2026-01-02 03:04:05'}).stamp == datetime(2026, 1, 2, 3, 4, 5)
+        assert converter.deserialize({'stamp': 'None'}).stamp is None
+
+    def test_unknown_keys_raise_error(self):
+        """Test keys that are not fields are rejected like the dataclass constructor does"""
+        converter = DataclassConverter(Tag)
+        with pytest.raises(TypeError):
+            converter.deserialize({'name': 'a', 'colour': 'red'})
+        with pytest.raises(TypeError):
+            converter.deserialize({'name': 'a', 'weight': 1.0, 'colour': 'red'})
+
+    def test_datetimes_in_plain_nested_dicts(self):
+        """Test the datetimes option reaches dicts nested in untyped and dict fields"""
+        @dcs.dataclass
+        class Event:
+            payload: t.Any = None
+            meta: t.Dict[str, t.Any] = dcs.field(default_factory=dict)
+
+        converter = DataclassConverter(Event, datetimes={'at'})
+        event = converter.deserialize({
+            'payload': {'items': [{'at': '2026-01-02 03:04:05'}], 'at': 'none'},
+            'meta': {'at': '2026-01-02 03:04:05', 'inner': {'at': '2026-01-03 00:00:00'}},
+        })
+
+        assert event.payload['items'][0]['at'] == datetime(2026, 1, 2, 3, 4, 5)
+        assert event.payload['at'] is None
+        assert event.meta['at'] == datetime(2026, 1, 2, 3, 4, 5)
+        assert event.meta['inner']['at'] == datetime(2026, 1, 3)
+
+
+class TestDataclassBatch:
+
+    def test_serializemany_matches_serialize(self):
+        """Test batch serialization equals per-value serialization"""
+        converter = DataclassConverter(Node)
+        values = [sample(), Tag('a'), [Tag('b')], 3]
+        assert converter.serializemany(values) == [converter.serialize(v) for v in values]
+
+    def test_deserializemany_matches_deserialize(self):
+        """Test batch deserialization equals per-value deserialization"""
+        converter = DataclassConverter(Node)
+        payloads = converter.serializemany([sample(), sample()]) + [converter.serializemany([sample()])]
+        assert converter.deserializemany(payloads) == [converter.deserialize(p) for p in payloads]
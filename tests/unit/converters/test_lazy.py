@@ -0,0 +1,66 @@
+# tests/unit/converters/test_lazy.py
+import copy
+import pickle
+import pytest
+
+from supermodels.converters.lazy import LazyValue, unwrap
+from tests.fixtures.tables import Section
+
+
+class Counter:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, raw):
+        self.calls += 1
+        return Section(raw['heading'], list(raw['words']))
+
+
+class TestLazyValue:
+
+    def test_decodes_once_on_first_use(self):
+        """Test the decoder runs on first access only and the result is cached"""
+        decode = Counter()
+        proxy = LazyValue({'heading': 'h', 'words': ['a']}, decode)
+
+        assert not proxy.decoded
+        assert decode.calls == 0
+        assert proxy.heading == 'h'
+        assert proxy.words == ['a']
+        assert decode.calls == 1
+        assert proxy.decoded
+        assert proxy.raw == {'heading': 'h', 'words': ['a']}
+
+    def test_behaves_like_target(self):
+        """Test comparisons, isinstance and mutation go to the decoded value"""
+        proxy = LazyValue({'heading': 'h', 'words': ['a']}, Counter())
+
+        assert isinstance(proxy, Section)
+        assert proxy == Section('h', ['a'])
+        proxy.heading = 'changed'
+        assert unwrap(proxy) == Section('changed', ['a'])
+        assert copy.deepcopy(proxy) == Section('changed', ['a'])
+        assert pickle.loads(pickle.dumps(proxy)) == Section('changed', ['a'])
+
+    def test_container_protocols(self):
+        """Test lists behind a proxy support len, iteration and indexing"""
+        proxy = LazyValue([1, 2, 3], list)
+
+        assert len(proxy) == 3
+        assert list(proxy) == [1, 2, 3]
+        assert proxy[1] == 2
+        assert 3 in proxy
+
+    def test_unwrap_passthrough(self):
+        """Test unwrap leaves plain values alone"""
+        value = Section('x')
+        assert unwrap(value) is value
+
+    def test_unhashable(self):
+        """Test proxies refuse hashing without decoding the value"""
+        decode = Counter()
+        proxy = LazyValue({'heading': 'h', 'words': []}, decode)
+
+        with pytest.raises(TypeError):
+            hash(proxy)
+        assert decode.calls == 0
@@ -0,0 +1,82 @@
+# tests/unit/converters/test_pyd.py
+import json
+import typing as t
+from datetime import datetime
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from supermodels.converters.pyd import PydanticConverter, typeadapter
+
+
+class Line(BaseModel):
+    sku: str
+    qty: int
+    shipped: t.Optional[datetime] = None
+
+
+class Order(BaseModel):
+    id: int
+    placed: datetime
+    lines: t.List[Line] = []
+    parent: t.Optional['Order'] = None
+    meta: t.Dict[str, t.Any] = {}
+
+
+def sample() -> Order:
+    when = datetime(2026, 3, 4, 5, 6, 7)
+    return Order(
+        id=1, placed=when,
+        lines=[Line(sku='a', qty=2, shipped=when), Line(sku='b', qty=1)],
+        parent=Order(id=0, placed=when),
+        meta={'note': 'x'},
+    )
+
+
+class TestPydanticConverter:
+
+    def test_serialize_is_json_compatible(self):
+        """Test serialization dumps models in JSON mode"""
+        payload = PydanticConverter(Order).serialize(sample())
+
+        assert payload['placed'] == '2026-03-04T05:06:07'
+        assert json.loads(json.dumps(payload)) == payload
+
+    @pytest.mark.parametrize('trusted', [False, True])
+    def test_roundtrip(self, trusted):
+        """Test validated and trusted modes rebuild nested models"""
+        converter = PydanticConverter(Order, trusted=trusted)
+        restored = converter.deserialize(converter.serialize(sample()))
+
+        assert restored == sample()
+        assert isinstance(restored.lines[0], Line)
+        assert isinstance(restored.parent, Order)
+        assert restored.lines[0].shipped == datetime(2026, 3, 4, 5, 6, 7)
+
+    def test_lists_and_raw_json(self):
+        """Test lists and raw JSON text validate through cached adapters"""
+        converter = PydanticConverter(Line)
+        payload = converter.serialize([Line(sku='a', qty=1), Line(sku='b', qty=2)])
+
+        assert converter.deserialize(payload) == [Line(sku='a', qty=1), Line(sku='b', qty=2)]
+        assert converter.deserialize(json.dumps(payload)) == converter.deserialize(payload)
+        assert converter.deserialize('{"sku": "c", "qty": 3}') == Line(sku='c', qty=3)
+        assert typeadapter(Line) is typeadapter(Line)
+
+    def test_validation_vs_trusted(self):
+        """Test invalid data fails validation but trusted mode skips checks"""
+        bad = {'sku': 'a', 'qty': 'many'}
+
+        with pytest.raises(ValidationError):
+            PydanticConverter(Line).deserialize(bad)
+        assert PydanticConverter(Line, trusted=True).deserialize(bad).qty == 'many'
+
+    def test_does_not_mutate_input(self):
+        """Test the datetimes option no longer rewrites the input payload"""
+        converter = PydanticConverter(Order, datetimes={'when'})
+        payload = {'id': 1, 'placed': '2026-03-04T05:06:07', 'meta': {'when': '2026-01-01T00:00:00'}}
+
+        restored = converter.deserialize(payload)
+
+        assert payload['meta']['when'] == '2026-01-01T00:00:00'
+        assert restored.meta['when'] == datetime(2026, 1, 1)
@@ -2,6 +2,7 @@
 import pytest
 from abc import ABC
 from supermodels.core.bases.adapter import DBAdapter
+from supermodels.core.enums import ONCE
 from tests.fixtures.models import User, Order
 
 class TestDBAdapter:
@@ -41,6 +42,24 @@ class TestDBAdapter:
            def deleteitem(self, session, item):
                return True
 
+           def querypage(self, session, model, page=1, hits=25, **options):
+               return [], 0
+
+           def iterpages(self, session, model, hits=25, **options):
+               return iter([])
+
+           def bulkadd(self, session, *items, chunksize=None, commit=ONCE, collect=True):
+               return list(items)
+
+           def bulkupdate(self, session, *items, chunksize=None, commit=ONCE, collect=True):
+               return list(items)
+
+           def bulkdelete(self, session, *items, chunksize=None, commit=ONCE):
+               return True
+
+           def aggregate(self, session, model, *where, groupby=(), astuples=False, **kwargs):
+               return []
+
        adapter = ConcreteAdapter()
        assert adapter is not None
 
@@ -63,9 +82,15 @@ class TestDBAdapter:
            'queryby',
            'queryoneby',
            'querybyid',
+           'querypage',
+           'iterpages',
            'additem',
            'updateitem',
-           'deleteitem'
+           'deleteitem',
+           'bulkadd',
+           'bulkupdate',
+           'bulkdelete',
+           'aggregate'
        }
 
        actual_methods = {
@@ -108,6 +133,24 @@ class TestDBAdapter:
            def deleteitem(self, session: MockSession, item):
                return True
 
+           def querypage(self, session: MockSession, model, page=1, hits=25, **options):
+               return [], 0
+
+           def iterpages(self, session: MockSession, model, hits=25, **options):
+               return iter([])
+
+           def bulkadd(self, session: MockSession, *items, chunksize=None, commit=ONCE, collect=True):
+               return list(items)
+
+           def bulkupdate(self, session: MockSession, *items, chunksize=None, commit=ONCE, collect=True):
+               return list(items)
+
+           def bulkdelete(self, session: MockSession, *items, chunksize=None, commit=ONCE):
+               return True
+
+           def aggregate(self, session: MockSession, model, *where, groupby=(), astuples=False, **kwargs):
+               return []
+
        adapter = TypedAdapter()
        session = adapter.createsession()
        assert isinstance(session, MockSession)
@@ -75,3 +75,103 @@ class TestManagerMeta:
 
         # Original registry unchanged
         assert len(ManagerMeta.GetRegistry()) == original_size
+
+    def test_reset_registry(self):
+        """Test ResetRegistry restores a saved registry and drops cached resolutions"""
+        saved = ManagerMeta.GetRegistry()
+
+        class TestManager(BaseManager, metaclass=ManagerMeta):
+            __model__ = User
+
+        class SpecialUser(User):
+            pass
+
+        assert ManagerMeta.GetModelManager(SpecialUser) == TestManager
+
+        ManagerMeta.ResetRegistry(saved)
+        assert ManagerMeta.GetRegistry() == saved
+        assert ManagerMeta.GetModelManager(SpecialUser) == saved.get(User)
+
+        ManagerMeta.ResetRegistry()
+        assert ManagerMeta.GetRegistry() == {}
+        assert ManagerMeta.GetModelManager(SpecialUser) is None
+
+    def test_subclass_resolves_to_base_manager(self):
+        """Test lookups walk the MRO to the nearest registered model"""
+        class TestManager(BaseManager, metaclass=ManagerMeta):
+            __model__ = User
+
+        class SpecialUser(User):
+            pass
+
+        class VerySpecialUser(SpecialUser):
+            pass
+
+        assert ManagerMeta.ResolveModel(VerySpecialUser) is User
+        assert ManagerMeta.GetModelManager(VerySpecialUser) == TestManager
+        assert ManagerMeta.GetInstanceMangager(VerySpecialUser(id=1)) == TestManager
+        assert ManagerMeta.GetModelManager(object) is None
+
+    def test_registration_invalidates_resolutions(self):
+        """Test registering a closer manager replaces cached resolutions"""
+        class TestManager(BaseManager, metaclass=ManagerMeta):
+            __model__ = User
+
+        class SpecialUser(User):
+            pass
+
+        assert ManagerMeta.GetModelManager(SpecialUser) == TestManager
+
+        class SpecialManager(BaseManager, metaclass=ManagerMeta):
+            __model__ = SpecialUser
+
+        assert ManagerMeta.GetModelManager(SpecialUser) == SpecialManager
+        assert ManagerMeta.GetModelManager(User) == TestManager
+
+    def test_resolve_against_model_subset(self):
+        """Test resolution scoped to explicit models ignores the global registry"""
+        class SpecialUser(User):
+            pass
+
+        assert ManagerMeta.ResolveModel(SpecialUser, (Order, User)) is User
+        assert ManagerMeta.ResolveModel(SpecialUser, (Order,)) is None
+
+    def test_resolution_cache_is_bounded(self, monkeypatch):
+        """Test the resolution cache evicts its oldest entries at capacity"""
+        monkeypatch.setattr(ManagerMeta, '_resolvecapacity', 8)
+        ManagerMeta.Invalidate()
+        first = type('First', (User,), {})
+        ManagerMeta.ResolveModel(first, (User,))
+        for i in range(20):
+            ManagerMeta.ResolveModel(type(f'Dynamic{i}', (User,), {}), (User,))
+
+        assert len(ManagerMeta._resolved) == 8
+        assert (first, (User,)) not in ManagerMeta._resolved
+
+    def test_resolution_snapshot_not_mutated(self):
+        """Test a miss publishes a new snapshot instead of changing the one readers hold"""
+        ManagerMeta.Invalidate()
+        ManagerMeta.ResolveModel(User)
+        snapshot = ManagerMeta._resolved
+        before = dict(snapshot)
+
+        ManagerMeta.ResolveModel(type('Fresh', (User,), {}))
+
+        assert snapshot == before
+        assert ManagerMeta._resolved is not snapshot
+        assert len(ManagerMeta._resolved) == len(before) + 1
+
+    def test_resolution_racing_registration_not_cached(self):
+        """Test a resolution computed while the registry changed is not cached"""
+        class Racing(tuple):
+            def __contains__(self, item):
+                ManagerMeta.Invalidate() # a manager registered mid-resolution
+                return super().__contains__(item)
+
+        class SpecialUser(User):
+            pass
+
+        models = Racing((User,))
+        assert ManagerMeta.ResolveModel(SpecialUser, models) is User
+        assert (SpecialUser, models) not in ManagerMeta._resolved
+
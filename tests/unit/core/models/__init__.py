@@ -0,0 +1 @@
+# ~/supermodels/tests/unit/core/models/__init__.py
@@ -0,0 +1,126 @@
+import asyncio
+import pytest
+from sqlalchemy import event
+from supermodels.core.manager import Manager
+from supermodels.adapters.sqla import SQLAAdapter
+from tests.fixtures.tables import Account
+
+class TestBatchLoader:
+
+    @pytest.fixture
+    def adapter(self, sqla_engine):
+        adapter = SQLAAdapter(sqla_engine)
+        session = adapter.createsession()
+        adapter.bulkadd(session, *[Account(tenant='a', name=f'u{i}', age=i) for i in range(1, 6)])
+        session.close()
+        return adapter
+
+    @pytest.fixture
+    def selects(self, sqla_engine):
+        statements = []
+        def capture(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith('SELECT'):
+                statements.append(statement)
+        event.listen(sqla_engine, 'before_cursor_execute', capture)
+        yield statements
+        event.remove(sqla_engine, 'before_cursor_execute', capture)
+
+    def test_sync_batch_scope(self, adapter, selects):
+        """Test gets in a batch scope are deduped into one IN query"""
+        with Manager(adapter)(Account) as ctx:
+            with ctx.batch() as loader:
+                futures = [loader.load(Account, id) for id in (3, 1, 3, 99, 2)]
+                assert not any(f.done() for f in futures)
+
+            assert [(f.result().name if f.result() else None) for f in futures] == ['u3', 'u1', 'u3', None, 'u2']
+            assert futures[0] is futures[2]
+            assert loader.queries == 1
+            assert len(selects) == 1
+            assert ' IN ' in selects[0].upper()
+
+    def test_ids_chunked(self, adapter, selects):
+        """Test large batches are split into chunks of at most `chunksize` ids"""
+        with Manager(adapter)(Account) as ctx:
+            with ctx.batch(chunksize=2) as loader:
+                futures = loader.loadmany(Account, (1, 2, 3, 4, 5))
+
+            assert [f.result().name for f in futures] == ['u1', 'u2', 'u3', 'u4', 'u5']
+            assert loader.queries == 3
+            assert len(selects) == 3
+
+    def test_result_dispatches_early(self, adapter, selects):
+        """Test reading a result inside the scope dispatches pending requests"""
+        with Manager(adapter)(Account) as ctx:
+            with ctx.batch() as loader:
+                first = loader.load(Account, 1)
+                second = loader.load(Account, 2)
+                assert first.result().name == 'u1'
+                assert second.done()
+                assert loader.load(Account, 1) is first
+
+        assert len(selects) == 1
+
+    def test_async_tick(self, adapter, selects):
+        """Test awaited loads issued in the same tick share one query"""
+        async def resolve(loader, id):
+            await asyncio.sleep(0)
+            account = await loader.aload(Account, id)
+            return account.name
+
+        async def main(ctx):
+            with ctx.batch() as loader:
+                return await asyncio.gather(*(resolve(loader, id) for id in (5, 4, 5, 1)))
+
+        with Manager(adapter)(Account) as ctx:
+            names = asyncio.run(main(ctx))
+
+        assert names == ['u5', 'u4', 'u5', 'u1']
+        assert len(selects) == 1
+
+    def test_error_propagates(self, adapter):
+        """Test a failing batch query raises for every waiting request"""
+        with Manager(adapter)(Account) as ctx:
+            with ctx.batch(key='missing') as loader:
+                future = loader.load(Account, 1)
+
+            with pytest.raises(ValueError):
+                future.result()
+
+    def test_async_dispatch_keeps_loop_responsive(self, adapter):
+        """Test a slow batch query runs off the event loop while other tasks proceed"""
+        import threading
+        started, release = threading.Event(), threading.Event()
+
+        async def other():
+            # only reachable while the query is blocked if it runs off the loop
+            while not started.is_set():
+                await asyncio.sleep(0.01)
+            release.set()
+
+        async def main(ctx):
+            getby = ctx.getby
+            def slow(*args, **kwargs):
+                started.set()
+                assert release.wait(5)
+                return getby(*args, **kwargs)
+            ctx.getby = slow
+
+            with ctx.batch() as loader:
+                account, _ = await asyncio.gather(loader.aload(Account, 2), other())
+            return account.name
+
+        with Manager(adapter)(Account) as ctx:
+            assert asyncio.run(main(ctx)) == 'u2'
+
+    def test_failed_scope_fails_pending(self, adapter, selects):
+        """Test an exception in the batch scope fails pending requests instead of loading them"""
+        with Manager(adapter)(Account) as ctx:
+            with pytest.raises(RuntimeError, match='boom'):
+                with ctx.batch() as loader:
+                    future = loader.load(Account, 1)
+                    raise RuntimeError('boom')
+
+            with pytest.raises(RuntimeError, match='boom'):
+                future.result()
+            assert loader.queries == 0
+            assert selects == []
@@ -0,0 +1,66 @@
+import pytest
+from supermodels.core.filters import Condition, Group, AND, OR, parsekey, parsefilters, evaluate, equalities, fields
+from tests.fixtures.models import User
+
+class TestFilters:
+
+    def test_parsekey(self):
+        """Test filter keys split into field and operator"""
+        assert parsekey('age__gte') == ('age', 'gte')
+        assert parsekey('name') == ('name', 'eq')
+        assert parsekey('user__id__in') == ('user__id', 'in')
+        assert parsekey('created__at') == ('created__at', 'eq')
+
+    def test_unknown_operator_raises_error(self):
+        """Test explicit conditions reject unknown operators"""
+        with pytest.raises(ValueError):
+            Condition('age', 'between', (1, 2))
+
+    def test_in_requires_collection(self):
+        """Test `in` rejects strings that would match by substring"""
+        with pytest.raises(ValueError):
+            parsefilters(name__in='abc')
+
+    def test_empty_groups_raise_error(self):
+        """Test AND()/OR() without any expression or filter are rejected"""
+        with pytest.raises(ValueError):
+            OR()
+        with pytest.raises(ValueError):
+            AND()
+
+    def test_parsefilters_combines_where_and_keywords(self):
+        """Test positional groups and keyword filters form one AND group"""
+        group = parsefilters(OR(age__lt=18, age__gt=65), name__startswith='j')
+
+        assert group.conjunction == 'and'
+        assert isinstance(group.children[0], Group) and group.children[0].conjunction == 'or'
+        assert group.children[1] == Condition('name', 'startswith', 'j')
+        assert set(fields(group)) == {'age', 'name'}
+
+    def test_equalities(self):
+        """Test top-level equality extraction ignores OR groups and other operators"""
+        assert equalities(AND(id=1, age__gt=3)) == {'id': 1}
+        assert equalities(OR(id=1, name='x')) == {}
+
+    @pytest.mark.parametrize('expr, expected', [
+        (AND(id__in=[1, 3]), [1, 3]),
+        (AND(id__gte=2, id__lt=4), [2, 3]),
+        (AND(name__startswith='a'), [1, 2]),
+        (AND(name__endswith='c'), [3]),
+        (AND(name__contains='b'), [2]),
+        (AND(email__isnull=True), [3]),
+        (AND(email__isnull=False), [1, 2]),
+        (AND(email=None), [3]),
+        (AND(email__ne=None), [1, 2]),
+        (OR(id=1, name='c'), [1, 3]),
+        (AND(OR(AND(id=1), AND(id=3)), name__notin=['a']), [3]),
+    ])
+    def test_evaluate(self, expr, expected):
+        """Test Python evaluation of operators and groups"""
+        users = [User(id=1, name='a', email='a@x'), User(id=2, name='ab', email='b@x'), User(id=3, name='c')]
+        assert [u.id for u in users if evaluate(expr, u)] == expected
+
+    def test_evaluate_none_never_compares(self):
+        """Test ordering comparisons against None do not match"""
+        assert not evaluate(AND(name__gt='a'), User(id=1))
+        assert not evaluate(AND(name__startswith='a'), User(id=1))
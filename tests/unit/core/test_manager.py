@@ -66,15 +66,46 @@ class TestManagerContext:
         assert context._managersregistry == {}
 
     def test_context_enter_creates_session(self, mock_adapter):
-        """Test entering context creates session and managers"""
+        """Test session and managers are created on first use inside the context"""
         context = ManagerContext(mock_adapter, User, Order)
 
         with context as mgr:
+            assert mock_adapter.sessions == []
+            assert mgr._managersregistry == {}
+
             assert mgr.session is not None
-            assert User in mgr._managersregistry
-            assert Order in mgr._managersregistry
+            assert isinstance(mgr._getmanager(User(id=1)), UserManager)
+            assert isinstance(mgr._getmanager(Order(id=1)), OrderManager)
             assert isinstance(mgr._managersregistry[User], UserManager)
             assert isinstance(mgr._managersregistry[Order], OrderManager)
+            assert len(mock_adapter.sessions) == 1
+
+    def test_context_unused_creates_nothing(self, mock_adapter):
+        """Test a context that never touches the database creates no session"""
+        before = ManagerContext.totals.sessions
+        context = ManagerContext(mock_adapter, User, Order)
+
+        with context:
+            pass
+
+        assert mock_adapter.sessions == []
+        assert context.stats.entered == 1
+        assert context.stats.sessions == 0
+        assert context.stats.managers == 0
+        assert ManagerContext.totals.sessions == before
+
+    def test_context_instantiates_only_touched_managers(self, mock_adapter):
+        """Test only managers for models actually used are instantiated"""
+        context = ManagerContext(mock_adapter, User, Order)
+
+        with context as mgr:
+            mgr.add(User(id=1))
+            mgr.get(User, 1)
+
+        assert context.stats.sessions == 1
+        assert context.stats.managers == 1
+        assert len(mock_adapter.sessions) == 1
+        assert mock_adapter.sessions[0].closed
 
     def test_context_exit_closes_session(self, mock_adapter):
         """Test exiting context closes session"""
@@ -99,6 +130,14 @@ class TestManagerContext:
         assert session.rolled_back
         assert session.closed
 
+    def test_context_querypage(self, mock_adapter):
+        """Test querypage is dispatched to the model's manager"""
+        with ManagerContext(mock_adapter, User) as mgr:
+            items, total = mgr.querypage(User, page=2, hits=10)
+
+        assert [u.id for u in items] == [11]
+        assert total == 20
+
     def test_getmanager_direct_match(self, mock_adapter):
         """Test _getmanager with direct type match"""
         context = ManagerContext(mock_adapter, User, Order)
@@ -137,3 +176,161 @@ class TestManagerContext:
         with context as mgr:
             with pytest.raises(ValueError):
                 mgr._getmanager(None)
+
+
+class TestManagerConcurrency:
+
+    def test_nested_contexts(self, mock_adapter):
+        """Test nested `with manager:` blocks restore the outer context"""
+        manager = Manager(mock_adapter, User)
+
+        with manager as outer:
+            with manager as inner:
+                assert manager.context is inner
+                assert inner is not outer
+            assert manager.context is outer
+        assert manager.context is None
+
+    def test_contexts_not_kept_per_manager(self, mock_adapter):
+        """Test managers share one context variable and leave no entries once exited"""
+        from supermodels.core.manager import _entered
+
+        managers = [Manager(mock_adapter, User) for _ in range(3)]
+        with managers[0] as first, managers[1] as second:
+            assert managers[0].context is first
+            assert managers[1].context is second
+            assert managers[2].context is None
+        assert _entered.get() == {}
+        assert not hasattr(managers[0], '_contexts')
+
+    def test_threads_share_manager(self, mock_adapter):
+        """Stress test: overlapping contexts on one Manager never see each other's state"""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        manager = Manager(mock_adapter, User, Order)
+        barrier = threading.Barrier(8)
+
+        def work(n):
+            if n < 8:
+                barrier.wait() # first round enters all at once
+            with manager as ctx:
+                session = ctx.session
+                for i in range(20):
+                    assert manager.context is ctx
+                    assert ctx.session is session
+                    ctx.add(User(id=(n * 100) + i))
+            assert manager.context is None
+            return session
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            sessions = list(pool.map(work, range(200)))
+
+        assert len({id(s) for s in sessions}) == 200
+        assert all(s.closed for s in sessions)
+        assert len(mock_adapter.added_items) == 200 * 20
+        assert manager.context is None
+
+    def test_asyncio_tasks_share_manager(self, mock_adapter):
+        """Test interleaved asyncio tasks each see their own context"""
+        import asyncio
+
+        manager = Manager(mock_adapter, User)
+
+        async def work():
+            with manager as ctx:
+                for _ in range(10):
+                    await asyncio.sleep(0)
+                    assert manager.context is ctx
+                return ctx
+
+        async def main():
+            return await asyncio.gather(*(work() for _ in range(50)))
+
+        contexts = asyncio.run(main())
+
+        assert len({id(c) for c in contexts}) == 50
+        assert manager.context is None
+
+    def test_scoped_default_adapter(self, mock_adapter):
+        """Test a scoped default adapter applies only within its block"""
+        other = MockAdapter()
+        Manager._defaultadapter = mock_adapter
+
+        try:
+            with Manager.scoped(other):
+                assert Manager(None, User).adapter is other
+            assert Manager(None, User).adapter is mock_adapter
+        finally:
+            Manager._defaultadapter = None
+
+
+class TestGather:
+
+    def slow(self, seconds, value):
+        import time
+        def call(ctx):
+            time.sleep(seconds)
+            return (value, ctx.session)
+        return call
+
+    def test_results_in_order(self, mock_adapter):
+        """Test results come back in call order, each from its own session"""
+        with Manager(mock_adapter, User) as ctx:
+            results = ctx.gather(self.slow(0.05, 'a'), self.slow(0.01, 'b'), self.slow(0.03, 'c'))
+
+        assert [value for value, _ in results] == ['a', 'b', 'c']
+        assert len({id(session) for _, session in results}) == 3
+        assert all(session.closed for _, session in results)
+
+    def test_calls_run_concurrently(self, mock_adapter):
+        """Test calls run concurrently rather than one after another"""
+        import threading
+        ctx = ManagerContext(mock_adapter, User)
+        # every call waits for all five: run one after another, the first wait times out
+        barrier = threading.Barrier(5, timeout=5)
+
+        def call(c):
+            return barrier.wait()
+
+        results = ctx.gather(*(call for _ in range(5)))
+
+        assert sorted(results) == [0, 1, 2, 3, 4]
+
+    def test_operations(self, mock_adapter):
+        """Test regular context operations work inside gathered calls"""
+        with Manager(mock_adapter, User, Order) as ctx:
+            users, order = ctx.gather(lambda c: c.getby(User, id=3), lambda c: c.get(Order, 7))
+
+        assert [u.id for u in users] == [3]
+        assert order.id == 7
+
+    def test_calls_are_read_only(self, mock_adapter):
+        """Test gathered calls cannot write and their sessions are rolled back"""
+        with Manager(mock_adapter, User) as ctx:
+            with pytest.raises(ValueError, match="read-only"):
+                ctx.gather(lambda c: c.add(User(id=1)))
+            users, = ctx.gather(lambda c: c.getby(User, id=3))
+
+        assert [u.id for u in users] == [3]
+        assert all(session.rolled_back for session in mock_adapter.sessions[-2:])
+
+    def test_exception_propagates(self, mock_adapter):
+        """Test a failing call raises after the others finish"""
+        def fail(ctx):
+            raise RuntimeError("boom")
+
+        ctx = ManagerContext(mock_adapter, User)
+        with pytest.raises(RuntimeError, match="boom"):
+            ctx.gather(self.slow(0.01, 'a'), fail)
+
+        assert all(session.closed for session in mock_adapter.sessions)
+
+    def test_agather(self, mock_adapter):
+        """Test the awaitable variant"""
+        import asyncio
+        ctx = ManagerContext(mock_adapter, User)
+
+        results = asyncio.run(ctx.agather(self.slow(0.02, 'a'), self.slow(0.01, 'b')))
+
+        assert [value for value, _ in results] == ['a', 'b']
@@ -1,7 +1,8 @@
 # ~/supermodels/tests/unit/core/test_registerops.py
 # tests/unit/core/test_registerops.py
 import pytest
-from supermodels.core.manager import registeroperations, ManagerContext
+from supermodels.core.manager import ManagerContext
+from supermodels.core.utils.decorators import registeroperations
 from supermodels.core.bases.manager import BaseManager
 from tests.fixtures.models import User, Order
 from tests.fixtures.adapters import MockAdapter
@@ -178,3 +179,35 @@ class TestRegisterOperations:
        assert hasattr(context, 'GetOrders')    # From User
        assert hasattr(context, 'GetAddresses') # From User
        assert hasattr(context, 'GetItems')     # From Order
+
+   def test_dispatch_table_cached_per_model_set(self, mock_adapter):
+       """Test contexts over the same models share one compiled dispatch table"""
+
+       first = ManagerContext(mock_adapter, User)
+       second = ManagerContext(mock_adapter, User)
+       other = ManagerContext(mock_adapter, User, Order)
+
+       assert first._optable is second._optable
+       assert first._optable is not other._optable
+       assert 'GetOrders' in first._optable.handlers
+       assert 'add' not in first.__dict__
+
+   def test_dispatch_table_rebuilt_when_super_changes(self, mock_adapter):
+       """Test reassigning a model's __super__ invalidates its cached table"""
+
+       class Invoice:
+           __super__ = {'GetLines'}
+
+           @classmethod
+           def GetLines(cls, session, invoice_id):
+               return [invoice_id]
+
+       before = ManagerContext(mock_adapter, Invoice)
+       assert not hasattr(before, 'GetTotal')
+
+       Invoice.__super__ = {'GetLines', 'GetTotal'}
+       Invoice.GetTotal = classmethod(lambda cls, session, invoice_id: 0)
+
+       after = ManagerContext(mock_adapter, Invoice)
+       assert after._optable is not before._optable
+       assert after.GetTotal(1) == 0
@@ -0,0 +1,47 @@
+# tests/unit/test_imports.py
+import sys, subprocess
+import pytest
+
+
+def loaded(statement: str) -> set:
+    """Modules loaded by running an import statement in a fresh interpreter"""
+    result = subprocess.run(
+        [sys.executable, '-c', f"import sys; {statement}; print('\\n'.join(sys.modules))"],
+        capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+
+class TestLazyImports:
+
+    @pytest.mark.parametrize('statement', [
+        'import supermodels',
+        'import supermodels.adapters',
+        'import supermodels.converters',
+        'from supermodels.adapters.sqla import OrderBy',
+    ])
+    def test_no_heavy_dependencies_at_import(self, statement):
+        """Test package imports don't load SQLAlchemy, pydantic or the core"""
+        modules = loaded(statement)
+
+        assert not any(m.startswith(('sqlalchemy', 'pydantic')) for m in modules)
+        assert 'supermodels.core.manager' not in modules
+
+    def test_memory_adapter_skips_sqlalchemy(self):
+        """Test the in-memory adapter is usable without loading SQLAlchemy"""
+        modules = loaded('from supermodels.adapters import MemoryAdapter')
+
+        assert 'supermodels.adapters.memory.adapter' in modules
+        assert not any(m.startswith('sqlalchemy') for m in modules)
+
+    def test_names_resolve_on_access(self):
+        """Test lazily exported names resolve to the defining objects"""
+        import supermodels
+        from supermodels.adapters import SQLA, SQLAAdapter
+        from supermodels.core.manager import Manager
+
+        assert supermodels.Manager is Manager
+        assert SQLA is SQLAAdapter
+        assert 'Manager' in dir(supermodels)
+        with pytest.raises(AttributeError):
+            supermodels.Missing